@@ -1,10 +1,19 @@
+import importlib
 import streamlit as st
 from streamlit_option_menu import option_menu
-from pages import upload, directTextExtraction, ocrTextExtraction
+from pages import upload
+from pdf2text import jobs, models, storage, tracing
 
 
 st.set_page_config(page_title="PDF to Text Converter", layout="wide")
 
+# Modeller iş işçilerinde yüklenir; ön yükleme istenirse işçileri hemen başlat
+if models.WARMUP_ENGINES:
+    jobs.job_manager.prestart()
+storage.start_sweeper()
+tracing.start_metrics_server()
+upload.keep_alive()
+
 st.markdown(
     """
     <style>
@@ -38,6 +47,7 @@ st.session_state.menu_selection = selected
 if selected == "Upload":
     upload.show()
 elif selected == "Direct Text Extraction":
-    directTextExtraction.show()
+    # Çıkarma sayfaları ve motorları yalnızca seçildiklerinde içe aktarılır
+    importlib.import_module("pages.directTextExtraction").show()
 elif selected == "OCR Text Extraction":
-    ocrTextExtraction.show()
+    importlib.import_module("pages.ocrTextExtraction").show()
@@ -1,12 +1,139 @@
 import os
+import time
 import streamlit as st
-from streamlit_pdf_viewer import pdf_viewer
-import pymupdf4llm
-import pdfplumber
-import fitz
 import pandas as pd
-import camelot
-from unstructured.partition.pdf import partition_pdf
+from pdf2text import extract
+from pdf2text import export, jobs, markdown, pagecache, search, stream, structure
+from pdf2text import table_records, tracing
+from pdf2text import tables as table_prefilter
+from pdf2text.cache import file_sha256, make_key, result_cache
+from pages import jobPanel, pageRange, pdfViewer, tracePanel, upload
+
+
+def cached(file_path, backend, mode, compute, **params):
+    """Sonucu dosya özeti, motor, mod ve parametrelere göre önbellekten getirir."""
+    with tracing.span(f"{backend}.{mode}"):
+        return result_cache.get_or_compute(
+            file_sha256(file_path), backend, mode, params, compute
+        )
+
+
+def cached_in_background(file_path, backend, mode, fn, *args, **params):
+    """Sonuç önbellekte yoksa arka plan işinde hesaplar; iş sürerken None döndürür."""
+    key = make_key(file_sha256(file_path), backend, mode, params)
+    missing = object()
+    value = result_cache.get(key, missing)
+    if value is not missing:
+        return value
+
+    jobPanel.submit_once(key, fn, *args, label=f"{backend} ({mode})")
+    status = jobPanel.show_job(key)
+    if status is None or status["state"] == jobs.CANCELLED:
+        return None
+    if status["state"] == jobs.FAILED:
+        raise RuntimeError(status["error"].strip().splitlines()[-1])
+    jobPanel.forget(key)
+    result_cache.put(key, status["result"])
+    return status["result"]
+
+
+def show_prefilter_report(report):
+    if not report["scores"]:
+        return
+    st.caption(
+        f"Table prefilter: {report['candidates']}/{report['pages']} candidate page(s), "
+        f"{report['skipped']} skipped, ~{max(report['estimated_seconds_saved'], 0):.2f}s saved "
+        f"(prefilter {report['prefilter_seconds']:.2f}s, detector {report['detector_seconds']:.2f}s)"
+    )
+    with st.expander("Table prefilter scores"):
+        st.dataframe(pd.DataFrame(report["scores"]), hide_index=True)
+
+
+def show_streamed_text(file_path, backend, iter_pages, page_numbers, skip_empty=False):
+    """Sayfaları çıkarıldıkça gösterir ve aynı anda dışa aktarma dosyasına yazar.
+
+    `iter_pages(eksik_sayfalar)` yalnızca önbellekte olmayan sayfalar için çağrılır.
+    """
+    file_hash = file_sha256(file_path)
+    range_label = f"{page_numbers[0]}-{page_numbers[-1]}"
+    export_path = stream.export_path(file_hash, f"{backend}.{range_label}")
+    page_count = len(page_numbers)
+    found, missing = pagecache.lookup(file_path, backend, "text", page_numbers)
+    pages = sorted(found.items())
+
+    if missing or not stream.is_exported(export_path):
+        progress = st.progress(0.0, text="Extracting pages...")
+        preview = st.empty()
+        pages = []
+        last_update = 0.0
+        for page_num, page_text in stream.tee_to_file(
+            pagecache.iter_pages(
+                file_path, backend, "text", page_numbers, iter_pages, default=""
+            ),
+            export_path,
+            skip_empty,
+        ):
+            pages.append((page_num, page_text))
+            now = time.monotonic()
+            # Arayüzü her sayfada değil, en fazla yarım saniyede bir güncelle
+            if now - last_update > 0.5 or len(pages) == page_count:
+                last_update = now
+                progress.progress(
+                    min(len(pages) / max(page_count, 1), 1.0),
+                    text=f"Page {page_num} ({len(pages)} / {page_count})",
+                )
+                preview.code(page_text or "", language=None)
+        progress.empty()
+        preview.empty()
+
+    all_text = "".join(
+        stream.format_page(page_num, page_text)
+        for page_num, page_text in pages
+        if page_text or not skip_empty
+    )
+    st.text_area("Full Document Text:", all_text, height=400)
+    with open(export_path, "rb") as f:
+        st.download_button(
+            "Download text",
+            f,
+            file_name=f"{os.path.splitext(os.path.basename(file_path))[0]}.{backend}.{range_label}.txt",
+            mime="text/plain",
+        )
+
+
+def show_structure(file_path, range_first, range_last, pages_per_view=5):
+    """Metin yapısını sayfa sayfa gösterir; bloklar yalnızca seçilince açılır."""
+    page_count = range_last - range_first + 1
+    view_count = -(-page_count // pages_per_view)
+    nav_col1, nav_col2 = st.columns([1, 2])
+    view = nav_col1.number_input(
+        f"View (of {view_count}):", min_value=1, max_value=view_count, value=1
+    )
+    span_fields = nav_col2.multiselect(
+        "Span fields:",
+        structure.SPAN_FIELDS,
+        default=list(structure.DEFAULT_SPAN_FIELDS),
+    )
+    first_page = range_first + (view - 1) * pages_per_view
+    last_page = min(first_page + pages_per_view - 1, range_last)
+    st.caption(f"Pages {first_page}-{last_page} (range {range_first}-{range_last})")
+
+    for page in structure.structure_pages(file_path, first_page, last_page, span_fields):
+        with st.expander(f"Page {page['page']} ({len(page['blocks'])} blocks)"):
+            if not page["blocks"]:
+                st.info("No text blocks on this page")
+                continue
+            st.dataframe(
+                pd.DataFrame(structure.block_summary(page)),
+                hide_index=True,
+            )
+            block_index = st.selectbox(
+                "Expand block:",
+                [None] + list(range(len(page["blocks"]))),
+                key=f"structure_block_{page['page']}",
+            )
+            if block_index is not None:
+                st.json(structure.expand_block(page, block_index))
 
 
 def show():
@@ -18,16 +145,8 @@ def show():
     if "file_path" in st.session_state and os.path.exists(st.session_state.file_path):
         file_path = st.session_state.file_path
 
-        with col1:
-            pdf_viewer(
-                file_path,
-                width=820,
-                height=1640,
-                zoom_level=1,
-                viewer_align="center",
-                show_page_separator=True,
-            )
-        with col2:
+        with tracing.run() as spans, col2:
+            upload.show_document_info()
             option = st.selectbox(
                 "Choose PDF processing method:",
                 [
@@ -39,6 +158,12 @@ def show():
                     "Unstructured (Table Extraction)",
                 ],
             )
+            document_pages = cached(
+                file_path, "pymupdf", "page_count",
+                lambda: extract.pymupdf_page_count(file_path),
+            )
+            first_page, last_page = pageRange.select(document_pages)
+            selected_pages = pagecache.page_numbers(first_page, last_page)
 
             if option == "PyMuPDF (fitz)":
                 st.subheader("PyMuPDF (fitz) Text & Table Extraction")
@@ -55,60 +180,89 @@ def show():
                     ],
                 )
 
-                doc = fitz.open(file_path)
-
                 if pymupdf_option == "All Text":
-                    all_text = ""
-                    for page_num in range(doc.page_count):
-                        page = doc[page_num]
-                        all_text += (
-                            f"\n--- Page {page_num + 1} ---\n{page.get_text()}\n"
-                        )
-                    st.text_area("Full Document Text:", all_text, height=400)
+                    show_streamed_text(
+                        file_path,
+                        "pymupdf",
+                        lambda missing: extract.iter_pymupdf_text(
+                            file_path, page_numbers=missing
+                        ),
+                        selected_pages,
+                    )
 
                 elif pymupdf_option == "Specific Page":
+                    page_count = cached(
+                        file_path, "pymupdf", "page_count",
+                        lambda: extract.pymupdf_page_count(file_path),
+                    )
                     page_number = st.number_input(
                         "Enter page number:",
                         min_value=1,
-                        max_value=doc.page_count,
+                        max_value=page_count,
                         step=1,
                         value=1,
                     )
-                    page = doc[page_number - 1]
-                    page_text = page.get_text()
+                    page_text = cached(
+                        file_path, "pymupdf", "page_text",
+                        lambda: extract.pymupdf_page_text(file_path, page_number),
+                        page_number=page_number,
+                    )
                     st.text_area(f"Page {page_number} Text:", page_text, height=400)
 
                 elif pymupdf_option == "Markdown/JSON Output":
                     output_format = st.selectbox("Output Format:", ["Markdown", "JSON"])
                     if output_format == "Markdown":
-                        for page_num in range(doc.page_count):
-                            md_text = pymupdf4llm.to_markdown(
-                                file_path, pages=[page_num]
+                        workers = st.number_input(
+                            "Workers:",
+                            min_value=1,
+                            max_value=os.cpu_count() or 1,
+                            value=1,
+                        )
+                        with st.spinner("Converting to Markdown..."):
+                            pages = markdown.markdown_pages(
+                                file_path, first_page, last_page, workers
                             )
+                        for page_num, md_text in pages:
                             st.markdown("---")
-                            st.markdown(f"### Page {page_num + 1}\n{md_text}")
+                            st.markdown(f"### Page {page_num}\n{md_text}")
                     elif output_format == "JSON":
-                        for page_num in range(doc.page_count):
-                            page = doc[page_num]
-                            json_text = page.get_text("dict")
-                            st.json({f"Page {page_num + 1}": json_text})
+                        show_structure(file_path, first_page, last_page)
 
                 elif pymupdf_option == "Search Text":
                     search_term = st.text_input("Enter text to search:")
+                    search_col1, search_col2 = st.columns([2, 1])
+                    search_mode = search_col1.radio(
+                        "Match:",
+                        search.SEARCH_MODES,
+                        format_func=lambda mode: {
+                            "substring": "Substring (PyMuPDF)",
+                            "exact": "Exact word",
+                            "prefix": "Word prefix",
+                            "all_terms": "All terms on page",
+                        }[mode],
+                        horizontal=True,
+                    )
+                    case_sensitive = search_col2.checkbox(
+                        "Case sensitive", disabled=search_mode == "substring"
+                    )
                     if search_term:
-                        results = []
-                        for page_num in range(doc.page_count):
-                            page = doc[page_num]
-                            text_instances = page.search_for(search_term)
-                            if text_instances:
-                                results.append(
-                                    {
-                                        "page": page_num + 1,
-                                        "occurrences": len(text_instances),
-                                        "coordinates": text_instances,
-                                    }
-                                )
+                        index = search.get_index(file_path)
+                        if search_mode == "substring":
+                            results = index.search(file_path, search_term)
+                        else:
+                            results = index.search_words(
+                                search_term, search_mode, case_sensitive
+                            )
+                        results = [
+                            result for result in results
+                            if first_page <= result["page"] <= last_page
+                        ]
 
+                        pdfViewer.set_highlights(
+                            file_path,
+                            f"'{search_term}'",
+                            {result["page"]: result["coordinates"] for result in results},
+                        )
                         if results:
                             st.success(
                                 f"Found '{search_term}' in {len(results)} page(s)"
@@ -117,89 +271,102 @@ def show():
                                 st.write(
                                     f"**Page {result['page']}:** {result['occurrences']} occurrence(s)"
                                 )
-                                for i, rect in enumerate(result["coordinates"]):
+                                for i, (x0, y0, x1, y1) in enumerate(result["coordinates"]):
                                     st.write(
-                                        f"  Position {i+1}: ({rect.x0:.1f}, {rect.y0:.1f}) to ({rect.x1:.1f}, {rect.y1:.1f})"
+                                        f"  Position {i+1}: ({x0:.1f}, {y0:.1f}) to ({x1:.1f}, {y1:.1f})"
                                     )
                         else:
-                            st.warning(f"Text '{search_term}' not found in document")
+                            st.warning(
+                                f"Text '{search_term}' not found on pages {first_page}-{last_page}"
+                            )
 
                 elif pymupdf_option == "Table Detection":
-                    found_any_table = False
-                    for page_num in range(doc.page_count):
-                        page = doc[page_num]
-                        table_finder = page.find_tables()
-                        tables = table_finder.tables if table_finder else []
+                    prefilter = st.checkbox(
+                        "Only scan table candidate pages", value=True, key="pymupdf_prefilter"
+                    )
+                    boxed_pages, report = cached(
+                        file_path, "pymupdf", "tables_boxes",
+                        lambda: table_prefilter.run_with_prefilter(
+                            file_path,
+                            lambda path, candidates: pagecache.cached_pages(
+                                path, "pymupdf", "tables_boxes", candidates,
+                                lambda missing: extract.pymupdf_tables(path, missing, with_boxes=True),
+                                default=[],
+                            ),
+                            enabled=prefilter,
+                            first_page=first_page,
+                            last_page=last_page,
+                        ),
+                        prefilter=prefilter,
+                        first_page=first_page,
+                        last_page=last_page,
+                    )
+                    show_prefilter_report(report)
+                    pages = [
+                        (page_num, [table["rows"] for table in tables])
+                        for page_num, tables in boxed_pages
+                    ]
+                    pdfViewer.set_highlights(
+                        file_path,
+                        "PyMuPDF tables",
+                        {
+                            page_num: [table["bbox"] for table in tables]
+                            for page_num, tables in boxed_pages
+                        },
+                        kind="table",
+                    )
+                    merge_tables = st.checkbox(
+                        "Merge tables continued across pages", key="pymupdf_merge_tables"
+                    )
+                    records = [
+                        record
+                        for page_num, tables in pages
+                        for record in table_records.from_rows("pymupdf", page_num, tables)
+                    ]
+                    if merge_tables:
+                        records = table_records.merge_continued(records)
+                    found_any_table = bool(records)
+                    records_by_page = {}
+                    for record in records:
+                        records_by_page.setdefault(record.page, []).append(record)
+                    for page_num, tables in pages:
+                        page_records = records_by_page.get(page_num, [])
                         if tables:
-                            found_any_table = True
                             st.success(
-                                f"Found {len(tables)} table(s) on page {page_num + 1}"
+                                f"Found {len(tables)} table(s) on page {page_num}"
                             )
-                            for i, table in enumerate(tables):
-                                st.write(f"**Page {page_num + 1} - Table {i + 1}:**")
-                                table_data = table.extract()
-                                if table_data:
-                                    if table_data[0]:
-                                        columns = []
-                                        for j, col in enumerate(table_data[0]):
-                                            if col is None or col == "":
-                                                columns.append(f"Column_{j+1}")
-                                            else:
-                                                columns.append(str(col))
-
-                                        seen = {}
-                                        unique_columns = []
-                                        for col in columns:
-                                            if col in seen:
-                                                seen[col] += 1
-                                                unique_columns.append(
-                                                    f"{col}_{seen[col]}"
-                                                )
-                                            else:
-                                                seen[col] = 0
-                                                unique_columns.append(col)
-
-                                        df = pd.DataFrame(
-                                            table_data[1:], columns=unique_columns
-                                        )
-                                    else:
-                                        num_cols = (
-                                            len(table_data[1])
-                                            if len(table_data) > 1
-                                            else 1
-                                        )
-                                        columns = [
-                                            f"Column_{j+1}" for j in range(num_cols)
-                                        ]
-                                        df = pd.DataFrame(
-                                            table_data[1:], columns=columns
-                                        )
-
-                                    st.dataframe(df)
+                            for record in page_records:
+                                pages_label = (
+                                    f"Pages {record.pages[0]}-{record.pages[-1]}"
+                                    if len(record.pages) > 1
+                                    else f"Page {page_num}"
+                                )
+                                st.write(f"**{pages_label} - Table {record.index}:**")
+                                st.dataframe(record.df)
                         else:
-                            st.warning(f"No tables found on page {page_num + 1}")
+                            st.warning(f"No tables found on page {page_num}")
                     if not found_any_table:
                         st.warning("No tables found in the document.")
 
                 elif pymupdf_option == "Image Extraction":
-                    for page_num in range(doc.page_count):
-                        page = doc[page_num]
-                        image_list = page.get_images()
-                        if image_list:
-                            st.success(
-                                f"Page {page_num + 1}: {len(image_list)} embedded image(s) found"
+                    pages = [
+                        (page_num, image_list)
+                        for page_num, image_list in pagecache.cached_pages(
+                            file_path, "pymupdf", "images", selected_pages,
+                            lambda missing: extract.pymupdf_images(file_path, missing),
+                            default=[],
+                        )
+                        if image_list
+                    ]
+                    for page_num, image_list in pages:
+                        st.success(
+                            f"Page {page_num}: {len(image_list)} embedded image(s) found"
+                        )
+                        for i, (image_bytes, image_ext) in enumerate(image_list):
+                            st.image(
+                                image_bytes,
+                                caption=f"Page {page_num} - Image {i+1} (.{image_ext})",
                             )
-                            for i, img in enumerate(image_list):
-                                xref = img[0]
-                                base_image = doc.extract_image(xref)
-                                image_bytes = base_image["image"]
-                                image_ext = base_image["ext"]
-                                st.image(
-                                    image_bytes,
-                                    caption=f"Page {page_num + 1} - Image {i+1} (.{image_ext})",
-                                )
-
-                doc.close()
 
             elif option == "PDFplumber":
                 st.subheader("PDFplumber Text & Table Extraction")
@@ -214,161 +381,182 @@ def show():
                     ],
                 )
 
-                with pdfplumber.open(file_path) as pdf:
+                if plumber_option == "All Text":
+                    show_streamed_text(
+                        file_path,
+                        "pdfplumber",
+                        lambda missing: extract.iter_pdfplumber_text(
+                            file_path, page_numbers=missing
+                        ),
+                        selected_pages,
+                        skip_empty=True,
+                    )
+
+                elif plumber_option == "Specific Page":
+                    page_count = cached(
+                        file_path, "pdfplumber", "page_count",
+                        lambda: extract.pdfplumber_page_count(file_path),
+                    )
+                    page_number = st.number_input(
+                        "Enter page number:",
+                        min_value=1,
+                        max_value=page_count,
+                        step=1,
+                        value=1,
+                    )
+                    page_text = cached(
+                        file_path, "pdfplumber", "page_text",
+                        lambda: extract.pdfplumber_page_text(file_path, page_number),
+                        page_number=page_number,
+                    )
+                    st.text_area(
+                        f"Page {page_number} Text:",
+                        page_text or "No text found",
+                        height=400,
+                    )
 
-                    if plumber_option == "All Text":
-                        all_text = ""
-                        for page_num, page in enumerate(pdf.pages):
-                            page_text = page.extract_text()
-                            if page_text:
-                                all_text += (
-                                    f"\n--- Page {page_num + 1} ---\n{page_text}\n"
+                elif plumber_option == "Table Extraction":
+                    prefilter = st.checkbox(
+                        "Only scan table candidate pages", value=True, key="pdfplumber_prefilter"
+                    )
+                    pages, report = cached(
+                        file_path, "pdfplumber", "tables",
+                        lambda: table_prefilter.run_with_prefilter(
+                            file_path,
+                            lambda path, candidates: [
+                                (page_num, tables)
+                                for page_num, tables in pagecache.cached_pages(
+                                    path, "pdfplumber", "tables", candidates,
+                                    lambda missing: extract.pdfplumber_tables(path, missing),
+                                    default=[],
                                 )
-                        st.text_area("Full Document Text:", all_text, height=400)
+                                if tables
+                            ],
+                            enabled=prefilter,
+                            first_page=first_page,
+                            last_page=last_page,
+                        ),
+                        prefilter=prefilter,
+                        first_page=first_page,
+                        last_page=last_page,
+                    )
+                    show_prefilter_report(report)
+                    merge_tables = st.checkbox(
+                        "Merge tables continued across pages", key="pdfplumber_merge_tables"
+                    )
+                    records = [
+                        record
+                        for page_num, tables in pages
+                        for record in table_records.from_rows("pdfplumber", page_num, tables)
+                    ]
+                    if merge_tables:
+                        records = table_records.merge_continued(records)
+                    found_tables = bool(pages)
+                    records_by_page = {}
+                    for record in records:
+                        records_by_page.setdefault(record.page, []).append(record)
+                    for page_num, tables in pages:
+                        st.success(
+                            f"Page {page_num}: {len(tables)} table(s) found"
+                        )
+                        for record in records_by_page.get(page_num, []):
+                            pages_label = (
+                                f"Pages {record.pages[0]}-{record.pages[-1]}"
+                                if len(record.pages) > 1
+                                else f"Page {page_num}"
+                            )
+                            st.write(f"**{pages_label} - Table {record.index}:**")
+                            st.dataframe(record.df)
 
-                    elif plumber_option == "Specific Page":
-                        page_number = st.number_input(
-                            "Enter page number:",
-                            min_value=1,
-                            max_value=len(pdf.pages),
-                            step=1,
-                            value=1,
+                    if not found_tables:
+                        st.warning("No tables found in the document")
+
+                elif plumber_option == "Image Extraction":
+                    pages = [
+                        (page_num, images)
+                        for page_num, images in pagecache.cached_pages(
+                            file_path, "pdfplumber", "images", selected_pages,
+                            lambda missing: extract.pdfplumber_images(
+                                file_path, page_numbers=missing
+                            ),
+                            default=[],
                         )
-                        page = pdf.pages[page_number - 1]
-                        page_text = page.extract_text()
-                        st.text_area(
-                            f"Page {page_number} Text:",
-                            page_text or "No text found",
-                            height=400,
+                        if images
+                    ]
+                    for page_num, images in pages:
+                        st.success(
+                            f"Page {page_num}: {len(images)} image(s) found"
                         )
+                        for i, img in enumerate(images):
+                            st.write(f"**Image {i + 1}:**")
+                            st.write(
+                                f"Position: ({img['x0']:.1f}, {img['y0']:.1f}) to ({img['x1']:.1f}, {img['y1']:.1f})"
+                            )
+                            size_width = img["x1"] - img["x0"]
+                            size_height = img["y1"] - img["y0"]
+                            st.write(f"Size: {size_width} x {size_height}")
 
-                    elif plumber_option == "Table Extraction":
-                        found_tables = False
-                        for page_num, page in enumerate(pdf.pages):
-                            tables = page.extract_tables()
-                            if tables:
-                                found_tables = True
-                                st.success(
-                                    f"Page {page_num + 1}: {len(tables)} table(s) found"
+                            if img["png"] is not None:
+                                st.image(
+                                    img["png"],
+                                    caption=f"Page {page_num} - Image {i + 1} (Cropped)",
                                 )
-                                for i, table in enumerate(tables):
-                                    if table and len(table) > 0:
-                                        st.write(
-                                            f"**Page {page_num + 1} - Table {i + 1}:**"
-                                        )
-                                        if table[0]:
-                                            columns = []
-                                            for j, col in enumerate(table[0]):
-                                                if col is None or col == "":
-                                                    columns.append(f"Column_{j+1}")
-                                                else:
-                                                    columns.append(str(col))
-
-                                            seen = {}
-                                            unique_columns = []
-                                            for col in columns:
-                                                if col in seen:
-                                                    seen[col] += 1
-                                                    unique_columns.append(
-                                                        f"{col}_{seen[col]}"
-                                                    )
-                                                else:
-                                                    seen[col] = 0
-                                                    unique_columns.append(col)
-
-                                            df = pd.DataFrame(
-                                                table[1:], columns=unique_columns
-                                            )
-                                        else:
-                                            num_cols = (
-                                                len(table[1]) if len(table) > 1 else 1
-                                            )
-                                            columns = [
-                                                f"Column_{j+1}" for j in range(num_cols)
-                                            ]
-                                            df = pd.DataFrame(
-                                                table[1:], columns=columns
-                                            )
-
-                                        st.dataframe(df)
-
-                        if not found_tables:
-                            st.warning("No tables found in the document")
-
-                    elif plumber_option == "Image Extraction":
-                        found_images = False
-                        for page_num, page in enumerate(pdf.pages):
-                            if hasattr(page, "images") and page.images:
-                                found_images = True
-                                st.success(
-                                    f"Page {page_num + 1}: {len(page.images)} image(s) found"
+                            else:
+                                st.warning(
+                                    f"Could not display cropped image: {img['error']}"
                                 )
-                                for i, img in enumerate(page.images):
-                                    st.write(f"**Image {i + 1}:**")
-                                    st.write(
-                                        f"Position: ({img['x0']:.1f}, {img['y0']:.1f}) to ({img['x1']:.1f}, {img['y1']:.1f})"
-                                    )
-                                    size_width = img["x1"] - img["x0"]
-                                    size_height = img["y1"] - img["y0"]
-                                    st.write(f"Size: {size_width} x {size_height}")
-
-                                    page_height = page.height
-                                    corrected_y0 = page_height - img["y1"]
-                                    corrected_y1 = page_height - img["y0"]
-
-                                    bbox = (
-                                        img["x0"],
-                                        corrected_y0,
-                                        img["x1"],
-                                        corrected_y1,
-                                    )
-                                    cropped_page = page.crop(bbox)
-
-                                    try:
-                                        cropped_image = cropped_page.to_image(
-                                            resolution=150
-                                        )
-                                        st.image(
-                                            cropped_image.original,
-                                            caption=f"Page {page_num + 1} - Image {i + 1} (Cropped)",
-                                        )
-                                    except Exception as e:
-                                        st.warning(
-                                            f"Could not display cropped image: {str(e)}"
-                                        )
-                                        st.write(
-                                            f"Debug info - Page height: {page_height}, Original bbox: ({img['x0']}, {img['y0']}, {img['x1']}, {img['y1']})"
-                                        )
-                                        st.write(f"Corrected bbox: {bbox}")
-
-                                    if "object" in img:
-                                        st.write(f"Object ID: {img['object']}")
-                                    st.write("---")
+                                st.write(
+                                    f"Debug info - Page height: {img['page_height']}, Original bbox: ({img['x0']}, {img['y0']}, {img['x1']}, {img['y1']})"
+                                )
+                                st.write(f"Corrected bbox: {img['bbox']}")
+
+                            if img["object"] is not None:
+                                st.write(f"Object ID: {img['object']}")
+                            st.write("---")
 
             elif option == "Camelot (Tables Only)":
                 st.subheader("Camelot Table Extraction")
                 camelot_option = st.radio("Select Camelot mode:", ["Stream", "Lattice"])
-                pages_param = "all"
+                workers = st.number_input(
+                    "Workers:",
+                    min_value=1,
+                    max_value=os.cpu_count() or 1,
+                    value=os.cpu_count() or 1,
+                    key="camelot_workers",
+                )
+
+                prefilter = st.checkbox(
+                    "Only scan table candidate pages", value=True, key="camelot_prefilter"
+                )
 
                 try:
-                    tables = camelot.read_pdf(
-                        file_path, flavor=camelot_option.lower(), pages=pages_param
+                    result = cached_in_background(
+                        file_path, "camelot", camelot_option.lower(),
+                        extract.camelot_tables_prefiltered,
+                        file_path, camelot_option.lower(), first_page, last_page, workers,
+                        prefilter,
+                        first_page=first_page,
+                        last_page=last_page,
+                        prefilter=prefilter,
                     )
 
-                    if len(tables) > 0:
-                        st.success(f"Found {len(tables)} table(s)")
+                    if result is None:
+                        tables = None
+                    else:
+                        tables, report = result
+                        show_prefilter_report(report)
 
-                        for i, table in enumerate(tables):
-                            st.write(f"**Table {i + 1} (Page {table.page}):**")
+                    if tables is None:
+                        pass
+                    elif len(tables) > 0:
+                        st.success(f"Found {len(tables)} table(s)")
 
-                            accuracy = table.parsing_report["accuracy"]
-                            whitespace = table.parsing_report["whitespace"]
+                        for i, record in enumerate(table_records.from_camelot(tables)):
+                            st.write(f"**Table {i + 1} (Page {record.page}):**")
                             st.write(
-                                f"Accuracy: {accuracy:.2f}%, Whitespace: {whitespace:.2f}%"
+                                f"Accuracy: {record.accuracy:.2f}%, Whitespace: {record.whitespace:.2f}%"
                             )
-
-                            df = table.df
-                            st.dataframe(df)
+                            st.dataframe(record.df)
 
                             st.write("---")
                     else:
@@ -386,29 +574,20 @@ def show():
                 include_page_breaks = st.checkbox("Include page breaks", value=True)
 
                 try:
-                    elements = partition_pdf(
-                        filename=file_path,
-                        strategy="fast",
+                    text_elements = cached_in_background(
+                        file_path, "unstructured", "fast",
+                        extract.unstructured_text_range,
+                        file_path, first_page, last_page, include_page_breaks,
+                        first_page=first_page,
+                        last_page=last_page,
                         include_page_breaks=include_page_breaks,
                     )
 
-                    text_elements = [
-                        elem
-                        for elem in elements
-                        if elem.category
-                        in [
-                            "NarrativeText",
-                            "Title",
-                            "ListItem",
-                            "UncategorizedText",
-                        ]
-                    ]
-
-                    if text_elements:
+                    if text_elements is None:
+                        pass
+                    elif text_elements:
                         st.success(f"Found {len(text_elements)} text element(s)")
-                        all_text = ""
-                        for i, elem in enumerate(text_elements):
-                            all_text += f"{elem.text}\n\n"
+                        all_text = "".join(f"{text}\n\n" for text in text_elements)
                         st.text_area("Extracted Text:", all_text, height=400)
                     else:
                         st.warning("No text elements found")
@@ -419,5 +598,53 @@ def show():
                         "Make sure the 'unstructured' library is properly installed"
                     )
 
+            with st.expander("Export results"):
+                st.caption(
+                    f"Exports pages {first_page}-{last_page} extracted with PyMuPDF, "
+                    "independent of the backend selected above."
+                )
+                export_formats = st.multiselect(
+                    "Formats:", export.available_formats(), default=["jsonl", "md"]
+                )
+                export_key = [file_sha256(file_path), first_page, last_page]
+                if export_formats and st.button("Prepare export"):
+                    try:
+                        with st.spinner("Preparing export..."):
+                            st.session_state.export_zip = {
+                                "key": export_key,
+                                "path": export.export_zip(
+                                    file_path,
+                                    export_formats,
+                                    os.path.splitext(os.path.basename(file_path))[0],
+                                    first_page,
+                                    last_page,
+                                ),
+                            }
+                    except Exception as e:
+                        st.error(f"Error exporting results: {str(e)}")
+                # Başka bir dosya veya aralık için hazırlanan zip gösterilmez
+                prepared = st.session_state.get("export_zip")
+                if prepared and prepared["key"] == export_key and os.path.exists(prepared["path"]):
+                    with open(prepared["path"], "rb") as f:
+                        st.download_button(
+                            "Download export",
+                            f,
+                            file_name=(
+                                f"{os.path.splitext(os.path.basename(file_path))[0]}"
+                                f".pages{first_page}-{last_page}.zip"
+                            ),
+                            mime="application/zip",
+                        )
+
+            with st.expander("Cache statistics"):
+                st.json(result_cache.stats())
+
+        with col2:
+            tracePanel.show(spans)
+
+        # Vurgular sağ sütunda ayarlandığından görüntüleyici en son çizilir.
+        with col1:
+            pdfViewer.show(file_path)
+
     else:
         st.error("PDF file not found. Please upload again.")
@@ -0,0 +1,58 @@
+import time
+import streamlit as st
+from pdf2text import jobs, tracing
+from pdf2text.jobs import job_manager
+
+
+def submit_once(key, fn, *args, label=None, **kwargs):
+    """Bu anahtar için oturumda bilinen bir iş yoksa arka plan işini başlatır."""
+    job_ids = st.session_state.setdefault("jobs", {})
+    job_id = job_ids.get(key)
+    if job_id is None or job_manager.status(job_id) is None:
+        job_id = job_manager.submit(fn, *args, label=label, **kwargs)
+        job_ids[key] = job_id
+    return job_id
+
+
+def forget(key):
+    st.session_state.setdefault("jobs", {}).pop(key, None)
+
+
+def job_status(key):
+    job_id = st.session_state.setdefault("jobs", {}).get(key)
+    return job_manager.status(job_id) if job_id else None
+
+
+@st.fragment(run_every=1.0)
+def _job_progress(job_id, render_partial):
+    status = job_manager.status(job_id)
+    if status is None or status["state"] not in jobs.ACTIVE_STATES:
+        # İş bitti; sonucu göstermek için tüm sayfayı yeniden çalıştır
+        st.rerun()
+
+    elapsed = time.time() - status["submitted"]
+    st.info(f"{status['label']}: {status['state']} ({elapsed:.0f}s)")
+    if st.button("Cancel", key=f"cancel_{job_id}"):
+        job_manager.cancel(job_id)
+        st.rerun()
+    if render_partial and status["partial"]:
+        render_partial(status["partial"])
+
+
+def show_job(key, render_partial=None):
+    """İş sürüyorsa durumunu yoklayarak gösterir ve None döndürür; bittiyse durumu döndürür."""
+    status = job_status(key)
+    if status is None:
+        return None
+    if status["state"] in jobs.ACTIVE_STATES:
+        _job_progress(status["id"], render_partial)
+        return None
+    # İşçide ölçülen aşamalar bu çalıştırmanın dökümünde gösterilir
+    tracing.merge(status["spans"])
+    if status["state"] == jobs.CANCELLED:
+        st.warning(f"{status['label']} was cancelled.")
+    if status["state"] in (jobs.CANCELLED, jobs.FAILED):
+        if st.button("Restart", key=f"restart_{status['id']}"):
+            forget(key)
+            st.rerun()
+    return status
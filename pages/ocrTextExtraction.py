@@ -1,99 +1,119 @@
 import os
 import streamlit as st
-from streamlit_pdf_viewer import pdf_viewer
 import fitz
 import pandas as pd
 import numpy as np
-from PIL import Image
-import io
-import base64
+import functools
+import json
+from pdf2text.cache import file_sha256, result_cache
+from pdf2text.models import registry, replicas
+from pdf2text import images as image_store
+from pdf2text import backends, jobs, raster, routing, table_records, tracing
+from pdf2text import ocr as ocr_batch
+from pdf2text import ocr_records
+from pages import jobPanel, pdfViewer, tracePanel
 
-# OCR ve tablo çıkarma kütüphaneleri için import'lar
-try:
-    from paddleocr import PaddleOCR
-    PADDLEOCR_AVAILABLE = True
-except ImportError:
-    PADDLEOCR_AVAILABLE = False
-
-try:
-    import img2table
-    from img2table.document import Image as Img2TableImage
-    from img2table.ocr import PaddleOCR as Img2TablePaddleOCR
-    IMG2TABLE_AVAILABLE = True
-except ImportError:
-    IMG2TABLE_AVAILABLE = False
+# OCR ve tablo çıkarma kütüphaneleri yalnızca ilk kullanımda içe aktarılır
+PADDLEOCR_AVAILABLE = backends.available("paddleocr")
+IMG2TABLE_AVAILABLE = backends.available("img2table")
 
 # deepdoctection kaldırıldı - uyumsuzluk nedeniyle
 DEEPDOCTECTION_AVAILABLE = False
 
-try:
-    import pdfplumber
-    PDFPLUMBER_AVAILABLE = True
-except ImportError:
-    PDFPLUMBER_AVAILABLE = False
-
-try:
-    from transformers import DonutProcessor, VisionEncoderDecoderModel
-    import torch
-    DONUT_AVAILABLE = True
-except ImportError:
-    DONUT_AVAILABLE = False
+PDFPLUMBER_AVAILABLE = backends.available("pdfplumber")
+DONUT_AVAILABLE = backends.available("donut")
+LAYOUTPARSER_AVAILABLE = backends.available("layoutparser")
 
-try:
-    import layoutparser as lp
-    LAYOUTPARSER_AVAILABLE = True
-except ImportError:
-    LAYOUTPARSER_AVAILABLE = False
-
-def extract_images_from_pdf(file_path):
-    """PDF'den görüntüleri çıkarır"""
-    doc = fitz.open(file_path)
-    images = []
-    
-    for page_num in range(doc.page_count):
-        page = doc[page_num]
-        image_list = page.get_images()
-        
-        for img_index, img in enumerate(image_list):
-            xref = img[0]
-            base_image = doc.extract_image(xref)
-            image_bytes = base_image["image"]
-            image_ext = base_image["ext"]
-            
-            # PIL Image'e çevir
-            pil_image = Image.open(io.BytesIO(image_bytes))
-            images.append({
-                'page': page_num + 1,
-                'image': pil_image,
-                'ext': image_ext,
-                'index': img_index
-            })
-    
-    doc.close()
-    return images
-
-def paddleocr_extraction(image):
-    """PaddleOCR ile metin çıkarma"""
+def paddleocr_extraction(image, tiled=False, tile_size=1600, overlap=200, tile_workers=2):
+    """PaddleOCR ile metin çıkarma; `tiled` ile büyük görüntüler döşemelere bölünür"""
     if not PADDLEOCR_AVAILABLE:
         return "PaddleOCR kütüphanesi yüklü değil. 'pip install paddlepaddle paddleocr' komutu ile yükleyin."
     
     try:
-        ocr = PaddleOCR(use_angle_cls=True, lang='en')
-        result = ocr.ocr(np.array(image))
-        
-        extracted_text = ""
-        for line in result:
-            if line:
-                for word_info in line:
-                    if word_info:
-                        text = word_info[1][0]
-                        confidence = word_info[1][1]
-                        extracted_text += f"{text} (Confidence: {confidence:.2f})\n"
-        
-        return extracted_text if extracted_text else "Metin bulunamadı"
+        if tiled:
+            lines = ocr_batch.paddleocr_tiled(
+                image, tile_size=tile_size, overlap=overlap, workers=tile_workers
+            )
+            return ocr_records.from_paddleocr(lines)
+        with replicas.lease("paddleocr", lang='en') as ocr, tracing.span("paddleocr.ocr", pages=1):
+            result = ocr.ocr(ocr_batch.to_bgr(image))
+        return ocr_records.from_paddleocr(line for page in result if page for line in page)
     except Exception as e:
         return f"PaddleOCR hatası: {str(e)}"
 
+def ocr_text(result):
+    """OCR sonucunu (yapılandırılmış veya metin) okuma sıralı metne çevirir"""
+    if isinstance(result, ocr_records.OcrResult):
+        return result.to_text() or "Metin bulunamadı"
+    return result
+
+def show_ocr_result(result, image=None, key="ocr"):
+    """Yapılandırılmış OCR sonucunu güven süzgeci, kutu çizimi ve dışa aktarmayla gösterir"""
+    if not isinstance(result, ocr_records.OcrResult):
+        st.text_area("Çıkarılan Metin:", result, height=400, key=f"{key}_text")
+        return
+    
+    min_confidence = st.slider(
+        "En düşük güven:", 0.0, 1.0, 0.0, step=0.05, key=f"{key}_confidence"
+    )
+    filtered = result.filter(min_confidence)
+    st.caption(f"{len(filtered)} / {len(result)} öğe gösteriliyor")
+    if any(filtered.texts) or not any(filtered.labels):
+        st.text_area(
+            "Çıkarılan Metin:", filtered.to_text() or "Metin bulunamadı", height=400, key=f"{key}_text"
+        )
+    if image is not None and len(filtered):
+        st.image(filtered.overlay(image), caption="Tespit edilen kutular")
+    with st.expander("Kutular ve güven değerleri"):
+        st.dataframe(filtered.to_dataframe().round(2), hide_index=True)
+    
+    download_col1, download_col2 = st.columns(2)
+    download_col1.download_button(
+        "JSON indir",
+        json.dumps(filtered.to_dict(), ensure_ascii=False),
+        file_name=f"{key}.json",
+        mime="application/json",
+        key=f"{key}_json",
+    )
+    download_col2.download_button(
+        "CSV indir",
+        filtered.to_dataframe().to_csv(index=False),
+        file_name=f"{key}.csv",
+        mime="text/csv",
+        key=f"{key}_csv",
+    )
+
+def batch_ocr(file_path, images, ocr_technology, batch_size):
+    """PaddleOCR veya Donut ile görüntüleri toplu işleyen arka plan işi.
+
+    Her grup bittiğinde (başlangıç, sonuçlar, süre) üretir; görüntüler işçi
+    sürecinde çözülür.
+    """
+    if ocr_technology == "PaddleOCR":
+        batch_fn = ocr_batch.paddleocr_batch
+        format_result = ocr_records.from_paddleocr
+    else:
+        batch_fn = ocr_batch.donut_batch
+        format_result = lambda result: f"Donut Analiz Sonucu:\n{result}"
+    
+    for start, batch_results, seconds in ocr_batch.run_in_batches(
+        batch_fn, image_store.LazyImages(file_path, images), batch_size
+    ):
+        yield start, [format_result(result) for result in batch_results], seconds
+
+def image_ocr(file_path, xref, ocr_technology, paddle_options):
+    """Tek bir gömülü görüntüyü işçi sürecinde çözüp OCR'layan arka plan işi"""
+    return run_ocr(ocr_technology, image_store.load_image(file_path, xref), **paddle_options)
+
+def page_ocr(file_path, page_number, dpi, ocr_technology, paddle_options):
+    """Tek bir sayfayı işçi sürecinde rasterleştirip OCR'layan arka plan işi"""
+    with fitz.open(file_path) as doc:
+        page_image = raster.render_page(doc[page_number - 1], dpi)
+    result = run_ocr(ocr_technology, page_image, **paddle_options)
+    if isinstance(result, ocr_records.OcrResult):
+        result = result.on_page(page_number)
+    return result
+
 def img2table_extraction(image):
     """img2table ile tablo çıkarma"""
     if not IMG2TABLE_AVAILABLE:
@@ -101,20 +121,21 @@ def img2table_extraction(image):
     
     try:
         # PIL Image'i numpy array'e çevir
-        img_array = np.array(image)
+        img_array = np.asarray(image)
         
         # OCR engine olarak PaddleOCR kullan
-        ocr = Img2TablePaddleOCR()
+        ocr = registry.get("img2table", lang='en')
         
         # Image2Table ile tablo tespiti
-        img = Img2TableImage(img_array)
-        tables = img.extract_tables(ocr=ocr)
+        img = backends.load("img2table.document").Image(img_array)
+        with tracing.span("img2table.extract_tables", pages=1):
+            tables = img.extract_tables(ocr=ocr)
         
         if tables:
             result = f"Bulunan tablo sayısı: {len(tables)}\n\n"
-            for i, table in enumerate(tables):
-                result += f"--- Tablo {i+1} ---\n"
-                result += str(table) + "\n\n"
+            for record in table_records.from_img2table(tables):
+                result += f"--- Tablo {record.index} ---\n"
+                result += str(record.df) + "\n\n"
             return result
         else:
             return "Tablo bulunamadı"
@@ -131,6 +152,7 @@ def pdfplumber_extraction(file_path):
         return "PDFplumber kütüphanesi yüklü değil. 'pip install pdfplumber' komutu ile yükleyin."
     
     try:
+        pdfplumber = backends.load("pdfplumber")
         with pdfplumber.open(file_path) as pdf:
             all_tables = []
             
@@ -153,25 +175,7 @@ def pdfplumber_extraction(file_path):
                     # DataFrame oluştur
                     table_data = table_info['data']
                     if table_data[0]:
-                        columns = []
-                        for j, col in enumerate(table_data[0]):
-                            if col is None or col == "":
-                                columns.append(f"Sütun_{j+1}")
-                            else:
-                                columns.append(str(col))
-                        
-                        # Tekrarlanan sütun isimlerini düzelt
-                        seen = {}
-                        unique_columns = []
-                        for col in columns:
-                            if col in seen:
-                                seen[col] += 1
-                                unique_columns.append(f"{col}_{seen[col]}")
-                            else:
-                                seen[col] = 0
-                                unique_columns.append(col)
-                        
-                        df = pd.DataFrame(table_data[1:], columns=unique_columns)
+                        df = table_records.rows_to_dataframe(table_data, fallback="Sütun")
                         result += f"Tablo boyutu: {df.shape}\n"
                         result += str(df.head()) + "\n\n"
                     else:
@@ -189,20 +193,16 @@ def donut_extraction(image):
         return "Donut kütüphanesi yüklü değil. 'pip install transformers torch' komutu ile yükleyin."
     
     try:
-        # Donut model ve processor'ı yükle
-        processor = DonutProcessor.from_pretrained("naver-clova-ix/donut-base-finetuned-docvqa")
-        model = VisionEncoderDecoderModel.from_pretrained("naver-clova-ix/donut-base-finetuned-docvqa")
-        
-        # GPU varsa kullan
-        device = "cuda" if torch.cuda.is_available() else "cpu"
-        model.to(device)
+        # Donut model ve processor'ı paylaşılan kayıt defterinden al
+        processor, model, device = registry.get("donut")
         
         # Görüntüyü işle
         pixel_values = processor(image, return_tensors="pt").pixel_values
         pixel_values = pixel_values.to(device)
         
         # Tahmin yap
-        with torch.no_grad():
+        torch = backends.load("torch")
+        with tracing.span("donut.generate", pages=1), torch.no_grad():
             generated_ids = model.generate(
                 pixel_values,
                 max_length=512,
@@ -230,28 +230,34 @@ def layoutparser_extraction(image):
     
     try:
         # PIL Image'i numpy array'e çevir
-        img_array = np.array(image)
+        img_array = np.asarray(image)
         
         # LayoutParser ile analiz
-        image_analyzer = lp.AutoLayoutModel('lp/PubLayNet/faster_rcnn_R_50_FPN_3x')
+        image_analyzer = registry.get("layoutparser")
         
         # Görüntüyü analiz et
-        layout_result = image_analyzer.detect(img_array)
-        
-        # Sonuçları işle
-        result = "LayoutParser Analiz Sonuçları:\n\n"
+        with tracing.span("layoutparser.detect", pages=1):
+            layout_result = image_analyzer.detect(img_array)
         
-        for i, layout in enumerate(layout_result):
-            result += f"Layout {i+1}:\n"
-            result += f"  - Tip: {layout.type}\n"
-            result += f"  - Confidence: {layout.score:.2f}\n"
-            result += f"  - Koordinatlar: {layout.block.coordinates}\n"
-            result += f"  - Boyut: {layout.block.width} x {layout.block.height}\n\n"
-        
-        return result
+        # Bloklar tür etiketi ve kutularıyla sütunlu sonuca dönüştürülür
+        return ocr_records.from_layoutparser(layout_result)
     except Exception as e:
         return f"LayoutParser hatası: {str(e)}"
 
+def run_ocr(ocr_technology, image, **paddle_options):
+    """Seçilen OCR teknolojisini görüntü (PIL veya NumPy dizisi) üzerinde çalıştırır."""
+    if ocr_technology == "PaddleOCR":
+        return paddleocr_extraction(image, **paddle_options)
+    elif ocr_technology == "img2table (Tablo Tespiti)":
+        return img2table_extraction(image)
+    elif ocr_technology == "DeepDoctection":
+        return deepdoctection_extraction(image)
+    elif ocr_technology == "Donut (Belge Analizi)":
+        return donut_extraction(image)
+    elif ocr_technology == "LayoutParser (Layout Analizi)":
+        return layoutparser_extraction(image)
+    return "Geçersiz teknoloji seçimi"
+
 def show():
     st.title("OCR Text Extraction & Table Detection")
     st.write("PDF belgelerinden OCR ile metin çıkarma ve tablo tespiti yapın.")
@@ -264,6 +270,19 @@ def show():
     st.sidebar.write(f"PDFplumber: {'✅' if PDFPLUMBER_AVAILABLE else '❌'}")
     st.sidebar.write(f"Donut: {'✅' if DONUT_AVAILABLE else '❌'}")
     st.sidebar.write(f"LayoutParser: {'✅' if LAYOUTPARSER_AVAILABLE else '❌'}")
+
+    # Modeller iş işçilerinde yüklüdür; her işçinin son raporu gösterilir
+    worker_models = {
+        pid: loaded for pid, loaded in jobs.job_manager.worker_reports().items() if loaded
+    }
+    if worker_models:
+        st.sidebar.header("Yüklü Modeller")
+        for pid, loaded_models in sorted(worker_models.items()):
+            for model_info in loaded_models:
+                st.sidebar.write(
+                    f"İşçi {pid} – {model_info['engine']} ({model_info['lang']}): "
+                    f"{model_info['size_mb']} MB, {model_info['hits']} kullanım"
+                )
     
     col1, col2 = st.columns([1, 1])
     
@@ -272,16 +291,9 @@ def show():
         
         with col1:
             st.subheader("PDF Görüntüleyici")
-            pdf_viewer(
-                file_path,
-                width=820,
-                height=1640,
-                zoom_level=1,
-                viewer_align="center",
-                show_page_separator=True,
-            )
+            pdfViewer.show(file_path)
         
-        with col2:
+        with tracing.run() as spans, col2:
             st.subheader("OCR Teknolojileri")
             
             # Teknoloji seçimi
@@ -297,49 +309,238 @@ def show():
                 ]
             )
             
+            # Büyük (yüksek DPI, A3, çizim) görüntüler için döşemeli OCR
+            paddle_options = {}
+            if ocr_technology == "PaddleOCR":
+                if st.checkbox("Döşemeli OCR (büyük görüntüler)", value=False):
+                    tile_col1, tile_col2, tile_col3 = st.columns(3)
+                    paddle_options = {
+                        "tiled": True,
+                        "tile_size": tile_col1.number_input(
+                            "Döşeme boyutu (px):", min_value=512, max_value=4096, value=1600, step=128
+                        ),
+                        "overlap": tile_col2.number_input(
+                            "Örtüşme (px):", min_value=32, max_value=1024, value=200, step=16
+                        ),
+                        "tile_workers": tile_col3.number_input(
+                            "Döşeme iş parçacığı:", min_value=1, max_value=os.cpu_count() or 1,
+                            value=min(2, os.cpu_count() or 1)
+                        ),
+                    }
+            
             # PDF'den görüntü çıkarma seçeneği
             extract_images = st.checkbox("PDF'den görüntüleri çıkar ve OCR uygula", value=False)
             
             if extract_images:
-                st.info("PDF'den görüntüler çıkarılıyor...")
-                images = extract_images_from_pdf(file_path)
+                # Görüntüler çözülmeden yalnızca meta veriden indekslenir
+                images = image_store.image_index(file_path)
                 
                 if images:
                     st.success(f"{len(images)} görüntü bulundu")
                     
+                    def image_label(x):
+                        label = f"Sayfa {images[x]['page']} - Görüntü {images[x]['index']+1} ({images[x]['width']}x{images[x]['height']} {images[x]['ext']})"
+                        if len(images[x]['pages']) > 1:
+                            label += f" [{len(images[x]['pages'])} sayfada kullanılıyor]"
+                        return label
+                    
+                    if st.checkbox("Küçük resimleri göster", value=False):
+                        thumb_columns = st.columns(4)
+                        for i, image_info in enumerate(images):
+                            thumb_columns[i % 4].image(
+                                image_store.thumbnail(file_path, image_info['xref']),
+                                caption=image_label(i),
+                            )
+                    
                     # Görüntü seçimi
                     selected_image_index = st.selectbox(
                         "Analiz edilecek görüntüyü seçin:",
                         options=range(len(images)),
-                        format_func=lambda x: f"Sayfa {images[x]['page']} - Görüntü {images[x]['index']+1}"
+                        format_func=image_label
                     )
                     
-                    selected_image = images[selected_image_index]['image']
+                    # Yalnızca seçilen görüntü çözülür
+                    selected_image = image_store.load_image(file_path, images[selected_image_index]['xref'])
                     
                     # Seçilen görüntüyü göster
                     st.image(selected_image, caption=f"Seçilen görüntü - Sayfa {images[selected_image_index]['page']}")
                     
-                    # OCR işlemi
+                    # OCR işlemi arka plan işinde çalışır; sonuç iş durumunda tutulur,
+                    # böylece süzgeç değiştiğinde OCR yeniden çalışmaz
+                    image_job_key = f"ocr_image:{file_path}:{images[selected_image_index]['xref']}:{ocr_technology}:{sorted(paddle_options.items())}"
                     if st.button("OCR Analizi Başlat"):
-                        with st.spinner("OCR analizi yapılıyor..."):
-                            if ocr_technology == "PaddleOCR":
-                                result = paddleocr_extraction(selected_image)
-                            elif ocr_technology == "img2table (Tablo Tespiti)":
-                                result = img2table_extraction(selected_image)
-                            elif ocr_technology == "DeepDoctection":
-                                result = deepdoctection_extraction(selected_image)
-                            elif ocr_technology == "Donut (Belge Analizi)":
-                                result = donut_extraction(selected_image)
-                            elif ocr_technology == "LayoutParser (Layout Analizi)":
-                                result = layoutparser_extraction(selected_image)
-                            else:
-                                result = "Geçersiz teknoloji seçimi"
-                            
-                            st.subheader("OCR Sonucu")
-                            st.text_area("Çıkarılan Metin:", result, height=400)
+                        jobPanel.forget(image_job_key)
+                        jobPanel.submit_once(
+                            image_job_key,
+                            image_ocr,
+                            file_path,
+                            images[selected_image_index]['xref'],
+                            ocr_technology,
+                            paddle_options,
+                            label="Görüntü OCR",
+                        )
+                    status = jobPanel.show_job(image_job_key)
+                    if status and status["state"] == jobs.DONE:
+                        st.subheader("OCR Sonucu")
+                        show_ocr_result(status["result"], selected_image, key="image_ocr")
+                    elif status and status["state"] == jobs.FAILED:
+                        st.error(f"OCR hatası: {status['error'].strip().splitlines()[-1]}")
+                    
+                    # Tüm görüntüleri tek seferde, gruplar halinde analiz et
+                    if ocr_technology in ("PaddleOCR", "Donut (Belge Analizi)"):
+                        batch_size = st.number_input(
+                            "Grup boyutu:", min_value=1, max_value=64, value=8
+                        )
+                        
+                        def show_batch_progress(batches):
+                            done = sum(len(batch_results) for _, batch_results, _ in batches)
+                            st.progress(done / len(images), text=f"{done} / {len(images)} görüntü")
+                        
+                        batch_job_key = f"ocr_batch:{file_path}:{ocr_technology}:{batch_size}"
+                        if st.button("Tüm Görüntüleri Analiz Et"):
+                            jobPanel.forget(batch_job_key)
+                            jobPanel.submit_once(
+                                batch_job_key,
+                                batch_ocr,
+                                file_path,
+                                images,
+                                ocr_technology,
+                                batch_size,
+                                label="Toplu görüntü OCR",
+                            )
+                        status = jobPanel.show_job(batch_job_key, render_partial=show_batch_progress)
+                        if status and status["state"] == jobs.DONE:
+                            results = [
+                                result for _, batch_results, _ in status["partial"] for result in batch_results
+                            ]
+                            total_seconds = sum(seconds for _, _, seconds in status["partial"])
+                            images_per_second = len(results) / total_seconds if total_seconds else 0.0
+                            st.success(f"{len(results)} görüntü işlendi ({images_per_second:.2f} görüntü/sn)")
+                            for image_info, result in zip(images, results):
+                                with st.expander(f"Sayfa {image_info['page']} - Görüntü {image_info['index']+1}"):
+                                    st.text(ocr_text(result))
+                        elif status and status["state"] == jobs.FAILED:
+                            st.error(f"Toplu OCR hatası: {status['error'].strip().splitlines()[-1]}")
                 else:
                     st.warning("PDF'de görüntü bulunamadı")
             
+            # Taranmış sayfalar için sayfaları rasterleştirip OCR uygula
+            rasterize_pages = st.checkbox("Sayfaları rasterleştir ve OCR uygula", value=False)
+            
+            if rasterize_pages:
+                with fitz.open(file_path) as doc:
+                    page_count = doc.page_count
+                
+                raster_col1, raster_col2 = st.columns(2)
+                dpi = raster_col1.slider("Çözünürlük (DPI):", 72, 300, raster.DEFAULT_DPI, step=6)
+                workers = raster_col2.number_input(
+                    "Paralel iş sayısı:", min_value=1, max_value=os.cpu_count() or 1,
+                    value=min(2, os.cpu_count() or 1)
+                )
+                page_number = st.number_input(
+                    "Sayfa numarası:", min_value=1, max_value=page_count, value=1
+                )
+                
+                with fitz.open(file_path) as doc:
+                    page_image = raster.render_page(doc[page_number - 1], dpi)
+                st.image(page_image, caption=f"Sayfa {page_number} ({dpi} DPI)")
+                
+                page_job_key = f"ocr_page:{file_path}:{page_number}:{dpi}:{ocr_technology}:{sorted(paddle_options.items())}"
+                if st.button("Sayfa OCR Analizi Başlat"):
+                    jobPanel.forget(page_job_key)
+                    jobPanel.submit_once(
+                        page_job_key,
+                        page_ocr,
+                        file_path,
+                        page_number,
+                        dpi,
+                        ocr_technology,
+                        paddle_options,
+                        label="Sayfa OCR",
+                    )
+                status = jobPanel.show_job(page_job_key)
+                if status and status["state"] == jobs.DONE:
+                    st.subheader("OCR Sonucu")
+                    show_ocr_result(status["result"], page_image, key="page_ocr")
+                elif status and status["state"] == jobs.FAILED:
+                    st.error(f"OCR hatası: {status['error'].strip().splitlines()[-1]}")
+                
+                # Tüm sayfalar arka plan işinde OCR'lanır; sonuçlar geldikçe gösterilir
+                def show_page_results(page_results):
+                    for page_num, result in page_results:
+                        with st.expander(f"Sayfa {page_num}"):
+                            st.text(ocr_text(result))
+                
+                pages_job_key = f"ocr_pages:{file_path}:{ocr_technology}:{dpi}:{sorted(paddle_options.items())}"
+                if st.button("Tüm Sayfaları OCR'la"):
+                    jobPanel.forget(pages_job_key)
+                    jobPanel.submit_once(
+                        pages_job_key,
+                        raster.ocr_pages,
+                        file_path,
+                        functools.partial(run_ocr, ocr_technology, **paddle_options),
+                        dpi=dpi,
+                        workers=workers,
+                        label="Sayfa OCR",
+                    )
+                status = jobPanel.show_job(pages_job_key, render_partial=show_page_results)
+                if status and status["state"] == jobs.DONE:
+                    st.success(f"{len(status['partial'])} / {page_count} sayfa işlendi")
+                    structured = [
+                        result.on_page(page_num)
+                        for page_num, result in status["partial"]
+                        if isinstance(result, ocr_records.OcrResult)
+                    ]
+                    if structured:
+                        with st.expander("Tüm sayfaların yapılandırılmış sonucu"):
+                            show_ocr_result(ocr_records.concat(structured), key="pages_ocr")
+                    show_page_results(status["partial"])
+                elif status and status["state"] == jobs.FAILED:
+                    st.error(f"OCR hatası: {status['error'].strip().splitlines()[-1]}")
+            
+            # Metin katmanı olan sayfaları doğrudan, taranmış sayfaları OCR ile çıkar
+            auto_route = st.checkbox("Otomatik yönlendirme (metin katmanı tespiti)", value=False)
+            
+            if auto_route:
+                decisions = result_cache.get_or_compute(
+                    file_sha256(file_path), "routing", "classify",
+                    {
+                        "min_chars": routing.MIN_TEXT_CHARS,
+                        "max_image_coverage": routing.MAX_IMAGE_COVERAGE,
+                        "min_scan_chars": routing.MIN_SCAN_TEXT_CHARS,
+                    },
+                    lambda: routing.classify_document(file_path),
+                )
+                ocr_page_count = sum(1 for d in decisions if d["route"] == routing.ROUTE_OCR)
+                st.info(
+                    f"{len(decisions)} sayfanın {len(decisions) - ocr_page_count} tanesi doğrudan, "
+                    f"{ocr_page_count} tanesi PaddleOCR ile işlenecek"
+                )
+                st.dataframe(
+                    pd.DataFrame(decisions).drop(columns=["text"]),
+                    hide_index=True,
+                )
+                
+                route_job_key = f"route:{file_path}"
+                if st.button("Yönlendirilmiş Çıkarmayı Başlat"):
+                    jobPanel.forget(route_job_key)
+                    jobPanel.submit_once(
+                        route_job_key,
+                        routing.route_document,
+                        file_path,
+                        paddleocr_extraction,
+                        decisions=decisions,
+                        label="Yönlendirilmiş çıkarma",
+                    )
+                status = jobPanel.show_job(route_job_key)
+                if status and status["state"] == jobs.DONE:
+                    for page_info in status["result"]:
+                        route_label = "OCR" if page_info["route"] == routing.ROUTE_OCR else "Metin"
+                        with st.expander(f"Sayfa {page_info['page']} ({route_label})"):
+                            st.text(page_info["text"])
+                elif status and status["state"] == jobs.FAILED:
+                    st.error(f"Çıkarma hatası: {status['error'].strip().splitlines()[-1]}")
+            
             # PDFplumber için doğrudan dosya analizi
             if ocr_technology == "PDFplumber (Tablo Çıkarma)":
                 if st.button("PDFplumber ile Tablo Analizi"):
@@ -350,6 +551,8 @@ def show():
             
             # Genel bilgiler
             st.markdown("---")
+            tracePanel.show(spans)
+
             st.markdown("### Kullanım Notları:")
             
             if ocr_technology == "PaddleOCR":
@@ -0,0 +1,26 @@
+import streamlit as st
+
+
+def select(page_count, key="page_range"):
+    """Tüm çıkarma modlarının kullandığı ortak sayfa aralığı seçicisi; (ilk, son) döndürür."""
+    first_key, last_key = f"{key}_first", f"{key}_last"
+    # Farklı sayfa sayılı bir belge yüklendiyse eski aralığı sıfırla
+    if st.session_state.get(f"{key}_page_count") != page_count:
+        st.session_state[f"{key}_page_count"] = page_count
+        st.session_state[first_key] = 1
+        st.session_state[last_key] = page_count
+
+    range_col1, range_col2 = st.columns(2)
+    first_page = range_col1.number_input(
+        "From page:", min_value=1, max_value=page_count, key=first_key
+    )
+    if st.session_state[last_key] < first_page:
+        st.session_state[last_key] = first_page
+    last_page = range_col2.number_input(
+        "To page:", min_value=first_page, max_value=page_count, key=last_key
+    )
+    st.caption(
+        f"Processing pages {first_page}-{last_page} of {page_count}; "
+        "already extracted pages are reused."
+    )
+    return first_page, last_page
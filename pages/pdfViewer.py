@@ -0,0 +1,94 @@
+import streamlit as st
+from pdf2text import viewer
+
+VIEWER_MODES = ["Page images", "Full document"]
+
+
+def set_highlights(file_path, label, boxes_by_page, kind="search"):
+    """Görüntüleyicide gösterilecek vurguları ayarlar; ilk vurgulu sayfaya gider."""
+    pages = {
+        page_num: [(*box, kind) for box in boxes]
+        for page_num, boxes in boxes_by_page.items()
+        if boxes
+    }
+    previous = st.session_state.get("viewer_highlights")
+    st.session_state.viewer_highlights = {
+        "file_path": file_path,
+        "label": label,
+        "pages": pages,
+    }
+    # Aynı vurgular her yeniden çalıştırmada tekrar ayarlanır; kullanıcının
+    # gezindiği sayfayı korumak için yalnızca vurgular değiştiğinde ilk sayfaya git
+    unchanged = (
+        previous
+        and previous["file_path"] == file_path
+        and previous["label"] == label
+        and previous["pages"] == pages
+    )
+    if pages and not unchanged:
+        st.session_state.viewer_first_page = min(pages)
+
+
+def clear_highlights():
+    st.session_state.pop("viewer_highlights", None)
+
+
+def _highlights(file_path):
+    highlights = st.session_state.get("viewer_highlights")
+    if highlights and highlights["file_path"] == file_path:
+        return highlights
+    return None
+
+
+@st.fragment
+def _page_view(file_path, width):
+    page_count = viewer.page_count(file_path)
+    highlights = _highlights(file_path)
+    if st.session_state.get("viewer_first_page", 1) > page_count:
+        st.session_state.viewer_first_page = 1
+
+    nav_col1, nav_col2, nav_col3 = st.columns(3)
+    first_page = nav_col1.number_input(
+        "Page:", min_value=1, max_value=page_count, key="viewer_first_page"
+    )
+    pages_per_view = nav_col2.number_input(
+        "Pages shown:", min_value=1, max_value=10, value=2, key="viewer_pages_per_view"
+    )
+    dpi = nav_col3.selectbox("Quality (DPI):", [72, 96, 150], index=1, key="viewer_dpi")
+
+    page_numbers = list(range(first_page, min(first_page + pages_per_view, page_count + 1)))
+    if highlights:
+        hit_pages = sorted(highlights["pages"])
+        info_col, button_col = st.columns([3, 1])
+        info_col.caption(
+            f"Highlighting {highlights['label']} on {len(hit_pages)} page(s)"
+            + (f": {', '.join(map(str, hit_pages[:20]))}" if hit_pages else "")
+        )
+        if button_col.button("Clear", key="viewer_clear_highlights"):
+            clear_highlights()
+            st.rerun(scope="fragment")
+        if hit_pages and st.checkbox("Only highlighted pages", key="viewer_only_hits"):
+            page_numbers = [p for p in hit_pages if p >= first_page][:pages_per_view]
+
+    for page_num, png in viewer.page_images(
+        file_path, page_numbers, dpi, highlights["pages"] if highlights else None
+    ):
+        st.image(png, caption=f"Page {page_num} / {page_count}", width=width)
+
+
+def show(file_path, width=820, height=1640):
+    """PDF'i seçilen modda gösterir; sayfa görüntüleri modu yalnızca görünen sayfaları işler."""
+    mode = st.radio("Viewer:", VIEWER_MODES, horizontal=True, key="viewer_mode")
+    if mode == "Full document":
+        from streamlit_pdf_viewer import pdf_viewer
+
+        pdf_viewer(
+            file_path,
+            width=width,
+            height=height,
+            zoom_level=1,
+            viewer_align="center",
+            show_page_separator=True,
+        )
+    else:
+        _page_view(file_path, width)
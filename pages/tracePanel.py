@@ -0,0 +1,54 @@
+import pandas as pd
+import streamlit as st
+from pdf2text import backends, tracing
+
+
+def summarize(spans):
+    """Aşamaları ada göre toplar; çağrı, süre, CPU, sayfa ve bellek farkı döndürür."""
+    rows = {}
+    for span in spans:
+        row = rows.setdefault(
+            span.name,
+            {
+                "stage": span.name,
+                "depth": span.depth,
+                "calls": 0,
+                "seconds": 0.0,
+                "cpu_seconds": 0.0,
+                "pages": 0,
+                "rss_delta_mb": None,
+                "errors": 0,
+            },
+        )
+        row["depth"] = min(row["depth"], span.depth)
+        row["calls"] += 1
+        row["seconds"] += span.seconds
+        row["cpu_seconds"] += span.cpu_seconds
+        row["pages"] += span.pages
+        row["errors"] += span.error is not None
+        if span.rss_delta is not None:
+            row["rss_delta_mb"] = (row["rss_delta_mb"] or 0) + span.rss_delta / (1024 * 1024)
+    return list(rows.values())
+
+
+def show(spans, title="Timing breakdown"):
+    """Bu çalıştırmada ölçülen aşamaları bir tabloda gösterir."""
+    with st.expander(title):
+        if not spans:
+            st.caption("No stages ran (results came from cache or no extraction was selected).")
+        else:
+            df = pd.DataFrame(summarize(spans))
+            df["stage"] = ["  " * depth + stage for depth, stage in zip(df["depth"], df["stage"])]
+            total = sum(span.seconds for span in spans if span.depth == 0)
+            st.caption(f"{len(spans)} span(s), {total:.3f} s in top-level stages")
+            st.dataframe(
+                df.drop(columns=["depth"]).round(4),
+                hide_index=True,
+                use_container_width=True,
+            )
+        metrics_col, backends_col = st.columns(2)
+        with metrics_col.popover("Process metrics"):
+            st.code(tracing.metrics.prometheus(), language="text")
+        with backends_col.popover("Backends"):
+            st.caption("Backends are imported on first use; import time is measured once per process.")
+            st.dataframe(pd.DataFrame(backends.status()), hide_index=True)
@@ -1,6 +1,18 @@
-import os
 import streamlit as st
-import uuid
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from pdf2text.ingest import InvalidPDFError, ingest
+from pdf2text.storage import document_store
+
+
+def session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else "default"
+
+
+def keep_alive():
+    """Oturumun belgesine olan referansını yeniler."""
+    if "file_hash" in st.session_state:
+        document_store.acquire(st.session_state.file_hash, session_id())
 
 
 def show():
@@ -12,21 +24,60 @@ def show():
 
         uploaded_file = st.file_uploader("Choose a PDF file", type=["pdf"])
 
-        if uploaded_file:
-            st.success("File uploaded successfully!")
-            random_filename = str(uuid.uuid4()) + ".pdf"
+        if uploaded_file and uploaded_file.file_id == st.session_state.get("upload_error_id"):
+            st.error(st.session_state.upload_error)
+
+        # Aynı yükleme her yeniden çalıştırmada tekrar yazılmaz
+        elif uploaded_file and uploaded_file.file_id != st.session_state.get("upload_file_id"):
+            try:
+                with st.spinner("Validating PDF..."):
+                    info = ingest(uploaded_file)
+            except InvalidPDFError as e:
+                st.session_state.upload_error_id = uploaded_file.file_id
+                st.session_state.upload_error = f"Invalid PDF: {e}"
+                st.error(st.session_state.upload_error)
+                return
+
+            file_hash = info["file_hash"]
+            previous_hash = st.session_state.get("file_hash")
+            if previous_hash and previous_hash != file_hash:
+                document_store.release(previous_hash, session_id())
+            document_store.acquire(file_hash, session_id())
+
+            st.session_state.upload_file_id = uploaded_file.file_id
             st.session_state.uploaded_file = uploaded_file
-            st.session_state.safe_filename = random_filename
-
-            docs_dir = os.path.join(os.path.dirname(__file__), "docs")
-            os.makedirs(docs_dir, exist_ok=True)
-            file_path = os.path.join(docs_dir, random_filename)
-            with open(file_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
-            st.session_state.file_path = file_path
+            st.session_state.safe_filename = file_hash + ".pdf"
+            st.session_state.file_hash = file_hash
+            st.session_state.file_path = info["path"]
+            st.session_state.document_info = info
             st.session_state.file_uploaded = True
             st.session_state.menu_selection = "Direct Text Extraction"
             st.session_state.force_menu_update = st.session_state.get('force_menu_update', 0) + 1
-            st.info(f"File saved to {file_path}")
+            st.success("File uploaded successfully!")
+            if not info["is_new"]:
+                st.info("This document was uploaded before; cached results will be reused.")
             st.success("Redirecting to text extraction page...")
             st.rerun()
+
+
+def show_document_info():
+    """Yükleme sırasında çıkarılan belge bilgilerini gösterir."""
+    info = st.session_state.get("document_info")
+    if not info or info["path"] != st.session_state.get("file_path"):
+        return
+    if info["needs_password"]:
+        st.warning("This PDF is password protected; extraction may fail.")
+    elif info["text_layer"] is False:
+        st.warning("No text layer found on the first pages; OCR Text Extraction is recommended.")
+    with st.expander(f"Document info ({info['pages']} pages, {info['size'] / 1024:.0f} KB)"):
+        if info["preview"]:
+            st.image(info["preview"], caption="Page 1", width=160)
+        st.json(
+            {
+                "pages": info["pages"],
+                "text_layer": info["text_layer"],
+                "encrypted": info["encrypted"],
+                "repaired": info["repaired"],
+                "metadata": info["metadata"],
+            }
+        )
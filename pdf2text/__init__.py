@@ -0,0 +1 @@
+"""PDF'den metin çıkarma için arayüzden bağımsız yardımcı modüller."""
@@ -0,0 +1,129 @@
+"""Komut satırı girişi: `python -m pdf2text batch <dizin>`, `export <pdf>`, `bench` ve `importtime`."""
+import argparse
+import json
+import os
+import sys
+
+from pdf2text import backends, batch, export
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m pdf2text")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    batch_parser = subparsers.add_parser("batch", help="Extract text from a directory of PDFs")
+    batch_parser.add_argument("input_dir")
+    batch_parser.add_argument("-o", "--output-dir", default="pdf2text_output")
+    batch_parser.add_argument("-b", "--backend", choices=batch.BACKENDS, default="pymupdf")
+    batch_parser.add_argument("-w", "--workers", type=int, default=None)
+    batch_parser.add_argument("--pages-per-shard", type=int, default=50)
+    batch_parser.add_argument("--formats", default="jsonl,md")
+    batch_parser.add_argument("--flavor", choices=["lattice", "stream"], default="lattice")
+    batch_parser.add_argument("--no-page-breaks", action="store_true")
+    batch_parser.add_argument("-r", "--recursive", action="store_true")
+
+    export_parser = subparsers.add_parser("export", help="Export extraction results of a PDF")
+    export_parser.add_argument("pdf")
+    export_parser.add_argument("-o", "--output-dir", default="pdf2text_export")
+    export_parser.add_argument("--formats", default=",".join(export.available_formats()))
+    export_parser.add_argument("--first-page", type=int, default=1)
+    export_parser.add_argument("--last-page", type=int, default=None)
+    export_parser.add_argument("--zip", action="store_true", help="Write a zip archive instead")
+
+    bench_parser = subparsers.add_parser("bench", help="Benchmark extraction backends on a corpus")
+    bench_parser.add_argument(
+        "--corpus", default=None, help="Directory of PDFs (default: generate a synthetic corpus)"
+    )
+    bench_parser.add_argument("--generate-dir", default="pdf2text_bench/corpus")
+    bench_parser.add_argument(
+        "--backends", default=None, help="Comma-separated backends (default: all)"
+    )
+    bench_parser.add_argument("--repeat", type=int, default=1)
+    bench_parser.add_argument("-o", "--output", default="pdf2text_bench/report.json")
+    bench_parser.add_argument("--baseline", default=None, help="Previous report to compare against")
+
+    importtime_parser = subparsers.add_parser(
+        "importtime", help="Measure app startup import time in a fresh interpreter"
+    )
+    importtime_parser.add_argument("modules", nargs="*", default=backends.STARTUP_MODULES)
+    importtime_parser.add_argument(
+        "--budget", type=float, default=None, help="Fail if startup takes longer (seconds)"
+    )
+    importtime_parser.add_argument("--top", type=int, default=15)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "batch":
+        failed = batch.run_batch(
+            args.input_dir,
+            args.output_dir,
+            backend=args.backend,
+            workers=args.workers,
+            pages_per_shard=args.pages_per_shard,
+            formats=[f.strip() for f in args.formats.split(",") if f.strip()],
+            recursive=args.recursive,
+            options={
+                "flavor": args.flavor,
+                "include_page_breaks": not args.no_page_breaks,
+            },
+        )
+        return 1 if failed else 0
+    if args.command == "export":
+        formats = [f.strip() for f in args.formats.split(",") if f.strip()]
+        name = os.path.splitext(os.path.basename(args.pdf))[0]
+        if args.zip:
+            print(export.export_zip(args.pdf, formats, name, args.first_page, args.last_page))
+        else:
+            results = export.document_results(args.pdf, args.first_page, args.last_page)
+            for path in export.export_directory(results, args.output_dir, formats, name):
+                print(path)
+        return 0
+    if args.command == "bench":
+        # Kıyaslama modülü yalnızca bu alt komutta içe aktarılır
+        from pdf2text import benchmark
+
+        if args.backends is None:
+            backend_names = list(benchmark.BACKENDS)
+        else:
+            backend_names = [b.strip() for b in args.backends.split(",") if b.strip()]
+        unknown = [b for b in backend_names if b not in benchmark.BACKENDS]
+        if unknown:
+            parser.error(f"unknown backends: {', '.join(unknown)}")
+        if args.corpus:
+            corpus = benchmark.load_corpus(args.corpus)
+        else:
+            corpus = benchmark.generate_corpus(args.generate_dir)
+        report = benchmark.run_benchmark(
+            corpus,
+            backend_names,
+            repeat=args.repeat,
+            progress=lambda doc, backend: print(f"{doc}: {backend}", file=sys.stderr),
+        )
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(benchmark.format_table(report))
+        print(args.output)
+        if args.baseline:
+            with open(args.baseline, encoding="utf-8") as f:
+                regressions = benchmark.compare_reports(json.load(f), report)
+            for line in regressions:
+                print(f"regression: {line}", file=sys.stderr)
+            return 1 if regressions else 0
+        return 0
+    if args.command == "importtime":
+        report = backends.measure_startup(args.modules, top=args.top)
+        print(f"startup imports: {report['wall_seconds']:.3f} s")
+        for name, seconds in report["slowest"]:
+            print(f"  {seconds:8.3f} s  {name}")
+        if report["heavy_loaded"]:
+            print(f"heavy backends imported at startup: {', '.join(report['heavy_loaded'])}")
+        if args.budget is not None and report["wall_seconds"] > args.budget:
+            print(f"startup exceeds budget of {args.budget:.3f} s", file=sys.stderr)
+            return 1
+        return 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""Ağır çıkarma motorları için tembel içe aktarma katmanı.
+
+Motorlar ilk kez seçildiklerinde içe aktarılır. Kullanılabilirlik, modülü
+yüklemeden `importlib.util.find_spec` ile denetlenir; böylece uygulamanın
+açılışında torch, paddleocr gibi kütüphaneler belleğe alınmaz.
+"""
+import importlib
+import importlib.util
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+
+# Motor adı -> gerekli üst düzey modüller
+BACKENDS = {
+    "pdfplumber": ("pdfplumber",),
+    "pymupdf4llm": ("pymupdf4llm",),
+    "camelot": ("camelot",),
+    "unstructured": ("unstructured",),
+    "paddleocr": ("paddleocr",),
+    "img2table": ("img2table",),
+    "donut": ("transformers", "torch"),
+    "layoutparser": ("layoutparser",),
+    "pyarrow": ("pyarrow",),
+}
+
+# main.py'nin açılışta içe aktardığı modüller (streamlit bunlarla birlikte yüklenir);
+# çıkarma sayfaları seçildiklerinde içe aktarılır
+STARTUP_MODULES = [
+    "streamlit_option_menu",
+    "pages.upload",
+    "pdf2text.jobs",
+    "pdf2text.models",
+    "pdf2text.storage",
+    "pdf2text.tracing",
+]
+
+_available = {}
+_import_seconds = {}
+_lock = threading.Lock()
+
+
+def available(name):
+    """Motorun kurulu olup olmadığını modülleri içe aktarmadan döndürür."""
+    with _lock:
+        if name in _available:
+            return _available[name]
+    try:
+        found = all(importlib.util.find_spec(module) is not None for module in BACKENDS[name])
+    except (ImportError, ValueError):
+        found = False
+    with _lock:
+        _available[name] = found
+    return found
+
+
+def load(module_name):
+    """Modülü ilk kullanımda içe aktarır ve süresini kaydeder."""
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    started = time.perf_counter()
+    module = importlib.import_module(module_name)
+    with _lock:
+        _import_seconds.setdefault(module_name, time.perf_counter() - started)
+    return module
+
+
+def status():
+    """Her motor için kurulu/yüklü bilgisini ve `load` ile ölçülen içe aktarma süresini döndürür."""
+    with _lock:
+        import_seconds = dict(_import_seconds)
+    rows = []
+    for name, modules in BACKENDS.items():
+        measured = [
+            seconds
+            for module_name, seconds in import_seconds.items()
+            if module_name.split(".")[0] in modules
+        ]
+        rows.append(
+            {
+                "backend": name,
+                "available": available(name),
+                "loaded": all(module in sys.modules for module in modules),
+                "import_seconds": round(sum(measured), 3) if measured else None,
+            }
+        )
+    return rows
+
+
+def measure_startup(modules=None, python=sys.executable, top=15):
+    """Modülleri temiz bir süreçte içe aktarıp süreyi ölçer.
+
+    `python -X importtime` çıktısından kümülatif süresi en yüksek modüller ve
+    açılışta yanlışlıkla yüklenen ağır motorlar da raporlanır.
+    """
+    modules = modules or STARTUP_MODULES
+    heavy = sorted({module for names in BACKENDS.values() for module in names})
+    code = (
+        "import importlib, sys\n"
+        f"for name in {modules!r}: importlib.import_module(name)\n"
+        f"print(','.join(m for m in {heavy!r} if m in sys.modules))\n"
+    )
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [python, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    wall_seconds = time.perf_counter() - started
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+
+    cumulative = {}
+    for line in completed.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)", line)
+        if match:
+            name = match.group(2)
+            cumulative[name] = max(cumulative.get(name, 0), int(match.group(1)))
+    slowest = sorted(cumulative.items(), key=lambda kv: kv[1], reverse=True)[:top]
+    loaded = completed.stdout.strip().splitlines()
+    return {
+        "wall_seconds": round(wall_seconds, 3),
+        "slowest": [(name, round(us / 1e6, 3)) for name, us in slowest],
+        "heavy_loaded": [m for m in (loaded[-1].split(",") if loaded else []) if m],
+    }
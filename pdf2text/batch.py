@@ -0,0 +1,330 @@
+"""Streamlit olmadan toplu PDF metin çıkarma.
+
+Belgeler sayfa aralıklarına bölünür ve işlemci sayısı kadar süreçten oluşan
+bir havuzda işlenir. Tamamlanan parçalar diske yazıldığından yarıda kalan bir
+çalışma kaldığı yerden devam eder.
+"""
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import fitz
+
+from pdf2text import extract
+from pdf2text.cache import file_sha256
+from pdf2text.export import table_markdown
+
+BACKENDS = ["pymupdf", "pdfplumber", "camelot", "unstructured"]
+# Bu motorlar sayfa aralıklarıyla çalışabilir; Unstructured belge bazındadır
+SHARDABLE_BACKENDS = {"pymupdf", "pdfplumber", "camelot"}
+
+
+def find_pdfs(input_dir, recursive=False):
+    pdfs = []
+    if recursive:
+        for dirpath, _, filenames in os.walk(input_dir):
+            pdfs.extend(
+                os.path.join(dirpath, name)
+                for name in filenames
+                if name.lower().endswith(".pdf")
+            )
+    else:
+        pdfs = [
+            os.path.join(input_dir, name)
+            for name in os.listdir(input_dir)
+            if name.lower().endswith(".pdf")
+        ]
+    return sorted(pdfs)
+
+
+def _extract_records(backend, file_path, first_page, last_page, options):
+    if backend == "pymupdf":
+        return [
+            {"page": page_num, "text": text}
+            for page_num, text in extract.pymupdf_all_text(file_path, first_page, last_page)
+        ]
+    if backend == "pdfplumber":
+        return [
+            {"page": page_num, "text": text or ""}
+            for page_num, text in extract.pdfplumber_all_text(file_path, first_page, last_page)
+        ]
+    if backend == "camelot":
+        tables = extract.camelot_tables(
+            file_path, options.get("flavor", "lattice"), f"{first_page}-{last_page}"
+        )
+        return [
+            {
+                "page": int(table["page"]),
+                "accuracy": table["accuracy"],
+                "whitespace": table["whitespace"],
+                "rows": table["df"].values.tolist(),
+            }
+            for table in tables
+        ]
+    if backend == "unstructured":
+        return [
+            {"index": i, "text": text}
+            for i, text in enumerate(
+                extract.unstructured_text(
+                    file_path, options.get("include_page_breaks", True)
+                )
+            )
+        ]
+    raise ValueError(f"Unknown backend: {backend}")
+
+
+def run_shard(task):
+    """Bir belge parçasını işler ve sonucunu parça dosyasına yazar."""
+    records = _extract_records(
+        task["backend"],
+        task["file_path"],
+        task["first_page"],
+        task["last_page"],
+        task["options"],
+    )
+    tmp_path = task["shard_path"] + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    os.replace(tmp_path, task["shard_path"])
+    return task["doc_id"], task["shard_path"], len(records)
+
+
+def _record_markdown(backend, record):
+    if backend == "camelot":
+        return (
+            f"## Page {record['page']} - Table\n\n"
+            f"Accuracy: {record['accuracy']:.2f}%, Whitespace: {record['whitespace']:.2f}%\n\n"
+            f"{table_markdown(record['rows'])}\n"
+        )
+    if "page" in record:
+        return f"## Page {record['page']}\n\n{record['text']}\n"
+    return f"{record['text']}\n"
+
+
+def _merge_document(doc, backend, output_dir, formats):
+    """Parça dosyalarını sayfa sırasıyla birleştirip belge çıktılarını yazar."""
+    base = os.path.join(output_dir, f"{doc['name']}.{backend}")
+    jsonl_file = open(base + ".jsonl", "w", encoding="utf-8") if "jsonl" in formats else None
+    md_file = open(base + ".md", "w", encoding="utf-8") if "md" in formats else None
+    try:
+        if md_file:
+            md_file.write(f"# {doc['name']}\n\n")
+        for shard_path in doc["shards"]:
+            with open(shard_path, encoding="utf-8") as f:
+                for line in f:
+                    record = json.loads(line)
+                    if jsonl_file:
+                        record = {"document": doc["name"], **record}
+                        jsonl_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    if md_file:
+                        md_file.write(_record_markdown(backend, record) + "\n")
+    finally:
+        if jsonl_file:
+            jsonl_file.close()
+        if md_file:
+            md_file.close()
+
+
+def _load_progress(progress_path):
+    done = {}
+    if os.path.exists(progress_path):
+        with open(progress_path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    entry = json.loads(line)
+                    # Başarısız belgeler bir sonraki çalışmada yeniden denenir
+                    if entry.get("status", "done") == "done":
+                        done[entry["doc_id"]] = entry
+    return done
+
+
+def document_name(input_dir, file_path):
+    relative = os.path.relpath(file_path, input_dir)
+    return os.path.splitext(relative)[0].replace(os.sep, "__")
+
+
+def document_id(name, file_path, backend):
+    # İçerik özeti sayesinde değişen dosyalar yeniden işlenir
+    return f"{name}.{file_sha256(file_path)[:16]}.{backend}"
+
+
+def plan_documents(input_dir, pdfs, backend, shard_dir, pages_per_shard, options):
+    """Belgeleri sayfa aralığı parçalarına böler.
+
+    Okunamayan veya açılamayan belgeler atlanır ve (dosya yolu, hata)
+    olarak üçüncü dönüş değerinde listelenir.
+    """
+    documents = []
+    tasks = []
+    failures = []
+    for file_path in pdfs:
+        name = document_name(input_dir, file_path)
+        try:
+            doc_id = document_id(name, file_path, backend)
+            if backend in SHARDABLE_BACKENDS:
+                with fitz.open(file_path) as pdf:
+                    page_count = pdf.page_count
+            else:
+                page_count = None
+        except Exception as e:
+            failures.append((file_path, e))
+            continue
+        doc_shard_dir = os.path.join(shard_dir, doc_id)
+        os.makedirs(doc_shard_dir, exist_ok=True)
+
+        if backend in SHARDABLE_BACKENDS:
+            ranges = [
+                (start, min(start + pages_per_shard - 1, page_count))
+                for start in range(1, page_count + 1, pages_per_shard)
+            ]
+        else:
+            ranges = [(1, None)]
+
+        doc = {
+            "doc_id": doc_id,
+            "name": name,
+            "file_path": file_path,
+            "page_count": page_count,
+            "shards": [],
+        }
+        for first_page, last_page in ranges:
+            shard_path = os.path.join(
+                doc_shard_dir, f"{first_page:06d}-{last_page or 0:06d}.jsonl"
+            )
+            doc["shards"].append(shard_path)
+            if not os.path.exists(shard_path):
+                tasks.append(
+                    {
+                        "doc_id": doc_id,
+                        "backend": backend,
+                        "file_path": file_path,
+                        "first_page": first_page,
+                        "last_page": last_page,
+                        "shard_path": shard_path,
+                        "options": options,
+                    }
+                )
+        documents.append(doc)
+    return documents, tasks, failures
+
+
+def run_batch(
+    input_dir,
+    output_dir,
+    backend="pymupdf",
+    workers=None,
+    pages_per_shard=50,
+    formats=("jsonl", "md"),
+    recursive=False,
+    options=None,
+    log=None,
+):
+    """Dizindeki PDF'leri işler; tamamlanan belgeleri progress.jsonl'e yazar."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: {backend}")
+    options = options or {}
+    log = log or (lambda message: print(message, file=sys.stderr))
+    workers = workers or os.cpu_count() or 1
+
+    os.makedirs(output_dir, exist_ok=True)
+    shard_dir = os.path.join(output_dir, ".shards")
+    progress_path = os.path.join(output_dir, "progress.jsonl")
+    done = _load_progress(progress_path)
+
+    pdfs = find_pdfs(input_dir, recursive)
+    pending = []
+    for path in pdfs:
+        try:
+            if document_id(document_name(input_dir, path), path, backend) in done:
+                continue
+        except OSError:
+            # Okunamayan dosya planlama sırasında başarısız olarak kaydedilir
+            pass
+        pending.append(path)
+    log(f"{len(pdfs)} PDF(s) found, {len(pdfs) - len(pending)} already done")
+
+    documents, tasks, plan_failures = plan_documents(
+        input_dir,
+        pending, backend, shard_dir, pages_per_shard, options
+    )
+    remaining = {doc["doc_id"]: 0 for doc in documents}
+    for task in tasks:
+        remaining[task["doc_id"]] += 1
+    by_id = {doc["doc_id"]: doc for doc in documents}
+    started = time.perf_counter()
+    failed = []
+
+    with open(progress_path, "a", encoding="utf-8") as progress:
+
+        def finish(doc):
+            _merge_document(doc, backend, output_dir, formats)
+            progress.write(
+                json.dumps(
+                    {
+                        "doc_id": doc["doc_id"],
+                        "file_path": doc["file_path"],
+                        "status": "done",
+                        "pages": doc["page_count"],
+                        "elapsed": round(time.perf_counter() - started, 3),
+                    }
+                )
+                + "\n"
+            )
+            progress.flush()
+            shutil.rmtree(os.path.join(shard_dir, doc["doc_id"]), ignore_errors=True)
+            log(f"done: {doc['file_path']}")
+
+        def fail(file_path, error, doc_id=None):
+            if file_path in failed:
+                return
+            failed.append(file_path)
+            progress.write(
+                json.dumps(
+                    {
+                        "doc_id": doc_id,
+                        "file_path": file_path,
+                        "status": "failed",
+                        "error": f"{type(error).__name__}: {error}",
+                        "elapsed": round(time.perf_counter() - started, 3),
+                    }
+                )
+                + "\n"
+            )
+            progress.flush()
+
+        for file_path, error in plan_failures:
+            fail(file_path, error)
+            log(f"failed: {file_path}: {error}")
+
+        # Tüm parçaları önceki çalışmada bitmiş belgeler
+        for doc_id, count in remaining.items():
+            if count == 0:
+                finish(by_id[doc_id])
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(run_shard, task): task for task in tasks}
+            for future in as_completed(futures):
+                task = futures[future]
+                try:
+                    doc_id, _, _ = future.result()
+                except Exception as e:
+                    fail(task["file_path"], e, task["doc_id"])
+                    log(
+                        f"failed: {task['file_path']} pages "
+                        f"{task['first_page']}-{task['last_page']}: {e}"
+                    )
+                    continue
+                remaining[doc_id] -= 1
+                if remaining[doc_id] == 0:
+                    finish(by_id[doc_id])
+
+    log(
+        f"{len(pending) - len(failed)} document(s) processed in "
+        f"{time.perf_counter() - started:.1f}s"
+    )
+    return sorted(failed)
@@ -0,0 +1,423 @@
+"""Çıkarma motorlarını bir başvuru derlemi üzerinde karşılaştıran kıyaslama aracı.
+
+Her (motor, belge) çalıştırması ayrı bir süreçte yapılır; böylece süre, CPU
+süresi ve en yüksek RSS birbirini etkilemez. Metin motorlarının çıktısı
+PyMuPDF metniyle, tablo motorlarınınki PyMuPDF tablolarıyla karşılaştırılır.
+Rapor JSON olarak yazılır ve önceki bir raporla kıyaslanarak gerilemeler
+bulunur.
+"""
+import hashlib
+import importlib.metadata
+import io
+import json
+import os
+import platform
+import random
+import re
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import fitz
+
+from pdf2text import backends
+
+REPORT_VERSION = 1
+CORPUS_CLASSES = ["text", "tables", "scanned", "images", "long"]
+REFERENCE_TEXT = "pymupdf_text"
+REFERENCE_TABLES = "pymupdf_tables"
+OCR_DPI = 150
+
+# Motor adı -> (tür, gerekli motor veya None)
+BACKENDS = {
+    "pymupdf_text": ("text", None),
+    "pdfplumber_text": ("text", "pdfplumber"),
+    "unstructured_fast": ("text", "unstructured"),
+    "paddleocr": ("text", "paddleocr"),
+    "donut": ("other", "donut"),
+    "pymupdf_tables": ("tables", None),
+    "pdfplumber_tables": ("tables", "pdfplumber"),
+    "camelot_lattice": ("tables", "camelot"),
+    "camelot_stream": ("tables", "camelot"),
+    "img2table": ("tables", "img2table"),
+    "layoutparser": ("other", "layoutparser"),
+}
+VERSION_PACKAGES = [
+    "pymupdf", "pdfplumber", "camelot-py", "unstructured", "paddleocr",
+    "img2table", "transformers", "torch", "layoutparser",
+]
+
+WORDS = (
+    "belge metin sayfa tablo satır sütun görüntü çıkarma analiz rapor veri "
+    "document text page table row column image extraction analysis report data"
+).split()
+
+
+def _paragraph(rng, words=60):
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _text_page(doc, rng, paragraphs=6):
+    page = doc.new_page()
+    text = "\n\n".join(_paragraph(rng) for _ in range(paragraphs))
+    page.insert_textbox(fitz.Rect(50, 50, page.rect.width - 50, page.rect.height - 50), text, fontsize=10)
+    return page
+
+
+def _table_page(doc, rng, rows=8, cols=4):
+    page = doc.new_page()
+    page.insert_text((50, 60), _paragraph(rng, 8), fontsize=10)
+    x0, y0, cell_w, cell_h = 50, 90, 120, 22
+    for r in range(rows + 1):
+        page.draw_line((x0, y0 + r * cell_h), (x0 + cols * cell_w, y0 + r * cell_h))
+    for c in range(cols + 1):
+        page.draw_line((x0 + c * cell_w, y0), (x0 + c * cell_w, y0 + rows * cell_h))
+    for r in range(rows):
+        for c in range(cols):
+            value = f"Col {c + 1}" if r == 0 else str(rng.randint(0, 9999))
+            page.insert_text((x0 + c * cell_w + 4, y0 + r * cell_h + 15), value, fontsize=9)
+    return page
+
+
+def _image_bytes(rng, size=(320, 240)):
+    from PIL import Image
+
+    image = Image.effect_noise(size, rng.randint(20, 80)).convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def generate_corpus(output_dir, seed=0, long_pages=100):
+    """Her belge sınıfı için tekrarlanabilir bir PDF üretir; yolları döndürür."""
+    os.makedirs(output_dir, exist_ok=True)
+    rng = random.Random(seed)
+    paths = {name: os.path.join(output_dir, f"{name}.pdf") for name in CORPUS_CLASSES}
+
+    with fitz.open() as doc:
+        for _ in range(3):
+            _text_page(doc, rng)
+        doc.save(paths["text"])
+
+    with fitz.open() as doc:
+        for _ in range(2):
+            _table_page(doc, rng)
+        doc.save(paths["tables"])
+
+    # Taranmış belge: metin sayfaları yalnızca görüntü olarak eklenir
+    with fitz.open(paths["text"]) as source, fitz.open() as doc:
+        for source_page in source:
+            pix = source_page.get_pixmap(dpi=OCR_DPI, colorspace=fitz.csGRAY)
+            page = doc.new_page(width=source_page.rect.width, height=source_page.rect.height)
+            page.insert_image(page.rect, stream=pix.tobytes("png"))
+        doc.save(paths["scanned"])
+
+    with fitz.open() as doc:
+        for _ in range(2):
+            page = doc.new_page()
+            page.insert_text((50, 50), _paragraph(rng, 10), fontsize=10)
+            for i in range(4):
+                x, y = 50 + (i % 2) * 260, 80 + (i // 2) * 220
+                page.insert_image(fitz.Rect(x, y, x + 240, y + 180), stream=_image_bytes(rng))
+        doc.save(paths["images"])
+
+    with fitz.open() as doc:
+        for i in range(long_pages):
+            if i % 10 == 9:
+                _table_page(doc, rng)
+            else:
+                _text_page(doc, rng)
+        doc.save(paths["long"])
+
+    return paths
+
+
+def load_corpus(corpus_dir):
+    """Dizindeki PDF'leri {sınıf: yol} olarak döndürür; sınıf dosya adıdır."""
+    return {
+        os.path.splitext(name)[0]: os.path.join(corpus_dir, name)
+        for name in sorted(os.listdir(corpus_dir))
+        if name.lower().endswith(".pdf")
+    }
+
+
+def _page_count(file_path):
+    with fitz.open(file_path) as doc:
+        return doc.page_count
+
+
+def _rendered_pages(file_path):
+    from pdf2text import raster
+
+    return list(raster.render_pages(file_path, dpi=OCR_DPI))
+
+
+def _run_backend(backend, file_path):
+    """Motoru çalıştırır; {"text": {sayfa: metin}} veya {"tables": {sayfa: [(satır, sütun)]}} döndürür."""
+    from pdf2text import extract
+
+    if backend == "pymupdf_text":
+        return {"text": dict(extract.pymupdf_all_text(file_path))}
+    if backend == "pdfplumber_text":
+        return {"text": {page: text or "" for page, text in extract.pdfplumber_all_text(file_path)}}
+    if backend == "unstructured_fast":
+        return {"text": {0: "\n".join(extract.unstructured_text(file_path, include_page_breaks=False))}}
+    if backend == "paddleocr":
+        from pdf2text import ocr
+
+        pages = _rendered_pages(file_path)
+        results = ocr.paddleocr_batch([image for _, image in pages])
+        return {
+            "text": {
+                page: " ".join(line[1][0] for line in lines)
+                for (page, _), lines in zip(pages, results)
+            }
+        }
+    if backend == "donut":
+        from PIL import Image
+        from pdf2text import ocr
+
+        pages = _rendered_pages(file_path)
+        results = ocr.donut_batch([Image.fromarray(image) for _, image in pages])
+        return {"other": {page: len(json.dumps(result, default=str)) for (page, _), result in zip(pages, results)}}
+    if backend == "pymupdf_tables":
+        return {"tables": {page: [_shape(rows) for rows in tables] for page, tables in extract.pymupdf_tables(file_path)}}
+    if backend == "pdfplumber_tables":
+        return {"tables": {page: [_shape(rows) for rows in tables] for page, tables in extract.pdfplumber_tables(file_path)}}
+    if backend in ("camelot_lattice", "camelot_stream"):
+        tables = {}
+        for table in extract.camelot_tables(file_path, backend.split("_")[1]):
+            tables.setdefault(int(table["page"]), []).append(tuple(table["df"].shape))
+        return {"tables": tables}
+    if backend == "img2table":
+        from PIL import Image
+        from pdf2text import table_records
+        from pdf2text.models import registry
+
+        document = backends.load("img2table.document")
+        engine = registry.get("img2table", lang="en")
+        tables = {}
+        for page, image in _rendered_pages(file_path):
+            # img2table dizi kabul etmez; sayfa PNG baytlarına kodlanır
+            png = io.BytesIO()
+            Image.fromarray(image).save(png, format="PNG")
+            found = document.Image(png.getvalue()).extract_tables(ocr=engine)
+            tables[page] = [tuple(record.df.shape) for record in table_records.from_img2table(found, page)]
+        return {"tables": tables}
+    if backend == "layoutparser":
+        from pdf2text.models import registry
+
+        model = registry.get("layoutparser")
+        return {"other": {page: len(model.detect(image)) for page, image in _rendered_pages(file_path)}}
+    raise KeyError(f"Bilinmeyen motor: {backend}")
+
+
+def _shape(rows):
+    return (len(rows), max((len(row) for row in rows), default=0))
+
+
+def measure(backend, file_path):
+    """Motoru bu süreçte çalıştırıp süre, CPU ve en yüksek RSS ile döndürür.
+
+    Ayrı bir süreçte çağrılmak üzere tasarlanmıştır; model yükleme süresi dahildir.
+    """
+    if sys.platform == "win32":
+        # Windows'ta `resource` yoktur; CPU süresi süreç saatinden, tepe bellek psutil'den alınır
+        cpu_before = time.process_time()
+        started = time.perf_counter()
+        output = _run_backend(backend, file_path)
+        seconds = time.perf_counter() - started
+        cpu_seconds = time.process_time() - cpu_before
+        import psutil
+
+        memory = psutil.Process(os.getpid()).memory_info()
+        peak_rss_mb = getattr(memory, "peak_wset", memory.rss) / (1024 * 1024)
+    else:
+        import resource
+
+        usage_before = resource.getrusage(resource.RUSAGE_SELF)
+        started = time.perf_counter()
+        output = _run_backend(backend, file_path)
+        seconds = time.perf_counter() - started
+        usage_after = resource.getrusage(resource.RUSAGE_SELF)
+        cpu_seconds = (usage_after.ru_utime - usage_before.ru_utime) + (
+            usage_after.ru_stime - usage_before.ru_stime
+        )
+        # Linux'ta ru_maxrss KB, macOS'ta bayt cinsindendir
+        rss_divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+        peak_rss_mb = usage_after.ru_maxrss / rss_divisor
+    return {
+        "seconds": seconds,
+        "cpu_seconds": cpu_seconds,
+        "peak_rss_mb": peak_rss_mb,
+        "output": output,
+    }
+
+
+def _measure_isolated(backend, file_path):
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+        return executor.submit(measure, backend, file_path).result()
+
+
+def _tokens(text):
+    return set(re.findall(r"\w+", (text or "").lower()))
+
+
+def text_agreement(reference, candidate):
+    """İki {sayfa: metin} çıktısının kelime kümesi Jaccard benzerliği (0-1)."""
+    if 0 in candidate and len(candidate) == 1:
+        reference = {0: " ".join(reference.values())}
+    ref_tokens = set().union(*map(_tokens, reference.values())) if reference else set()
+    cand_tokens = set().union(*map(_tokens, candidate.values())) if candidate else set()
+    if not ref_tokens and not cand_tokens:
+        return 1.0
+    return round(len(ref_tokens & cand_tokens) / len(ref_tokens | cand_tokens), 4)
+
+
+def table_agreement(reference, candidate):
+    """Sayfa başına tablo sayısı ve boyutlarının eşleşme oranı (0-1)."""
+    pages = {int(p) for p in reference} | {int(p) for p in candidate}
+    pages = {p for p in pages if reference.get(p) or candidate.get(p)}
+    if not pages:
+        return 1.0
+    scores = []
+    for page in pages:
+        ref_shapes = sorted(map(tuple, reference.get(page, [])))
+        cand_shapes = sorted(map(tuple, candidate.get(page, [])))
+        if ref_shapes == cand_shapes:
+            scores.append(1.0)
+        elif len(ref_shapes) == len(cand_shapes):
+            scores.append(0.5)
+        else:
+            scores.append(0.0)
+    return round(sum(scores) / len(scores), 4)
+
+
+def _versions():
+    versions = {}
+    for package in VERSION_PACKAGES:
+        try:
+            versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            continue
+    return versions
+
+
+def _file_hash(file_path):
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def run_benchmark(corpus, backend_names=None, repeat=1, progress=None):
+    """Her belge ve motor için ölçüm yapar; JSON'a yazılabilir rapor döndürür.
+
+    `corpus` {sınıf: pdf yolu} eşlemesidir. Kurulu olmayan motorlar
+    "skipped", hata verenler "error" durumuyla rapora eklenir.
+    """
+    backend_names = backend_names or list(BACKENDS)
+    results = []
+    for doc_class, file_path in corpus.items():
+        page_count = _page_count(file_path)
+        outputs = {}
+        for backend in backend_names:
+            kind, requirement = BACKENDS[backend]
+            entry = {"document": doc_class, "backend": backend, "kind": kind, "pages": page_count}
+            if requirement and not backends.available(requirement):
+                entry["status"] = "skipped"
+                results.append(entry)
+                continue
+            if progress:
+                progress(doc_class, backend)
+            try:
+                runs = [_measure_isolated(backend, file_path) for _ in range(max(repeat, 1))]
+            except Exception as e:
+                entry.update(status="error", error=f"{type(e).__name__}: {e}")
+                results.append(entry)
+                continue
+            seconds = statistics.median(run["seconds"] for run in runs)
+            entry.update(
+                status="ok",
+                seconds=round(seconds, 4),
+                seconds_per_page=round(seconds / max(page_count, 1), 5),
+                cpu_seconds=round(statistics.median(run["cpu_seconds"] for run in runs), 4),
+                peak_rss_mb=round(max(run["peak_rss_mb"] for run in runs), 1),
+            )
+            outputs[backend] = runs[-1]["output"]
+            results.append(entry)
+
+        for entry in results:
+            if entry["document"] != doc_class or entry.get("status") != "ok":
+                continue
+            output = outputs[entry["backend"]]
+            if "text" in output and REFERENCE_TEXT in outputs:
+                entry["agreement"] = text_agreement(outputs[REFERENCE_TEXT]["text"], output["text"])
+            elif "tables" in output and REFERENCE_TABLES in outputs:
+                entry["agreement"] = table_agreement(outputs[REFERENCE_TABLES]["tables"], output["tables"])
+                entry["tables"] = sum(len(tables) for tables in output["tables"].values())
+
+    return {
+        "version": REPORT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "packages": _versions(),
+        },
+        "corpus": {
+            doc_class: {"path": file_path, "sha256": _file_hash(file_path), "pages": _page_count(file_path)}
+            for doc_class, file_path in corpus.items()
+        },
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare_reports(baseline, current, time_tolerance=0.25, rss_tolerance=0.25, agreement_drop=0.05):
+    """Mevcut raporu öncekiyle karşılaştırır; gerilemeleri açıklayan satırları döndürür."""
+    previous = {
+        (entry["document"], entry["backend"]): entry
+        for entry in baseline["results"]
+        if entry.get("status") == "ok"
+    }
+    regressions = []
+    for entry in current["results"]:
+        before = previous.get((entry["document"], entry["backend"]))
+        if before is None:
+            continue
+        name = f"{entry['document']}/{entry['backend']}"
+        if entry.get("status") != "ok":
+            regressions.append(f"{name}: {entry.get('status')} ({entry.get('error', '')})")
+            continue
+        if entry["seconds_per_page"] > before["seconds_per_page"] * (1 + time_tolerance):
+            regressions.append(
+                f"{name}: {before['seconds_per_page']:.4f} -> {entry['seconds_per_page']:.4f} s/page"
+            )
+        if entry["peak_rss_mb"] > before["peak_rss_mb"] * (1 + rss_tolerance):
+            regressions.append(f"{name}: peak RSS {before['peak_rss_mb']} -> {entry['peak_rss_mb']} MB")
+        if "agreement" in before and entry.get("agreement", 0) < before["agreement"] - agreement_drop:
+            regressions.append(f"{name}: agreement {before['agreement']} -> {entry.get('agreement')}")
+    return regressions
+
+
+def format_table(report):
+    """Raporu okunabilir metin tablosu olarak döndürür."""
+    lines = [
+        f"{'document':<10} {'backend':<18} {'status':<8} {'s/page':>9} {'cpu s':>8} {'rss MB':>8} {'agree':>6}"
+    ]
+    for entry in report["results"]:
+        if entry.get("status") != "ok":
+            lines.append(f"{entry['document']:<10} {entry['backend']:<18} {entry['status']:<8}")
+            continue
+        agreement = entry.get("agreement")
+        lines.append(
+            f"{entry['document']:<10} {entry['backend']:<18} {'ok':<8} "
+            f"{entry['seconds_per_page']:>9.4f} {entry['cpu_seconds']:>8.2f} "
+            f"{entry['peak_rss_mb']:>8.1f} {'' if agreement is None else f'{agreement:.2f}':>6}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,222 @@
+"""Çıkarma sonuçları için içerik adresli önbellek.
+
+Anahtar; yüklenen dosyanın SHA-256 özeti, motor, mod ve parametrelerden
+oluşur. Önde bellek içi bir LRU, arkada boyutu sınırlı bir disk önbelleği
+bulunur. Dışa aktarma dosyaları da aynı disk bütçesine dahildir.
+"""
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+CACHE_VERSION = 1
+CACHE_DIR = os.environ.get(
+    "PDF2TEXT_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "pdf2text")
+)
+
+_hash_memo = {}
+_hash_lock = threading.Lock()
+
+
+def file_sha256(file_path, chunk_size=1024 * 1024):
+    """Dosyanın SHA-256 özetini döndürür; değişmeyen dosyalar için tekrar hesaplamaz."""
+    stat = os.stat(file_path)
+    memo_key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+    with _hash_lock:
+        if memo_key in _hash_memo:
+            return _hash_memo[memo_key]
+
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    file_hash = digest.hexdigest()
+
+    with _hash_lock:
+        _hash_memo[memo_key] = file_hash
+    return file_hash
+
+
+def remember_sha256(file_path, file_hash):
+    """Özeti zaten bilinen dosyayı (ör. yükleme sırasında hesaplanan) kaydeder."""
+    stat = os.stat(file_path)
+    with _hash_lock:
+        _hash_memo[(os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)] = file_hash
+
+
+def make_key(file_hash, backend, mode, params=None):
+    payload = json.dumps(
+        [CACHE_VERSION, file_hash, backend, mode, params or {}],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+EVICTED_DIRS = ("results", "exports")
+
+
+def _walk(cache_dir, subdirs):
+    for subdir in subdirs:
+        yield from os.walk(os.path.join(cache_dir, subdir))
+
+
+def touch(path):
+    """Dosyanın erişim zamanını yeniler; disk tahliyesi en eski dosyadan başlar."""
+    try:
+        os.utime(path)
+        return True
+    except OSError:
+        return False
+
+
+def _file_size(path):
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+class ResultCache:
+    """Bellek içi LRU + disk önbelleği."""
+
+    # Diğer süreçlerin (arka plan işleri) yazdıklarını hesaba katmak için
+    # sayaç bu kadar yazmada bir diski tarayarak yeniden hesaplanır
+    RESCAN_EVERY = 256
+
+    def __init__(self, cache_dir=CACHE_DIR, max_memory_items=64, max_disk_mb=512):
+        self.cache_dir = cache_dir
+        self.max_memory_items = max_memory_items
+        self.max_disk_bytes = int(max_disk_mb * 1024 * 1024)
+        self._memory = OrderedDict()
+        self._disk_bytes = None
+        self._writes_since_scan = 0
+        self._lock = threading.RLock()
+        self.counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, "results", key[:2], key + ".pkl")
+
+    def _remember(self, key, value):
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_items:
+                self._memory.popitem(last=False)
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.counters["memory_hits"] += 1
+                return self._memory[key]
+
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            with self._lock:
+                self.counters["misses"] += 1
+            return default
+
+        touch(path)
+        with self._lock:
+            self.counters["disk_hits"] += 1
+        self._remember(key, value)
+        return value
+
+    def put(self, key, value):
+        self._remember(key, value)
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            previous_size = _file_size(path)
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            # Disk yazılamıyorsa bellek önbelleği ile devam et
+            return
+        self._track_write(_file_size(path) - previous_size)
+
+    def _track_write(self, size_delta):
+        """Disk boyutu sayacını günceller; bütçe aşıldığında tahliye eder."""
+        with self._lock:
+            if self._disk_bytes is None or self._writes_since_scan >= self.RESCAN_EVERY:
+                rescan = True
+            else:
+                self._disk_bytes += size_delta
+                self._writes_since_scan += 1
+                rescan = self._disk_bytes > self.max_disk_bytes
+        if rescan:
+            self._evict_disk()
+
+    def get_or_compute(self, file_hash, backend, mode, params, compute):
+        """Sonuç önbellekte varsa döndürür, yoksa `compute()` ile hesaplayıp saklar."""
+        key = make_key(file_hash, backend, mode, params)
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def track_file(self, path, previous_size=0):
+        """Önbellek dizinine dışarıdan yazılan bir dosyayı (ör. dışa aktarma) bütçeye katar."""
+        self._track_write(_file_size(path) - previous_size)
+
+    def _evict_disk(self):
+        # Sonuçlar ve dışa aktarma dosyaları aynı bütçeyi paylaşır
+        files = []
+        total = 0
+        for dirpath, _, filenames in _walk(self.cache_dir, EVICTED_DIRS):
+            for name in filenames:
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        if total > self.max_disk_bytes:
+            for _, size, path in sorted(files):
+                if total <= self.max_disk_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                with self._lock:
+                    self.counters["evictions"] += 1
+        with self._lock:
+            self._disk_bytes = total
+            self._writes_since_scan = 0
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self.counters)
+            stats["memory_items"] = len(self._memory)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (
+            (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        )
+        return stats
+
+
+result_cache = ResultCache(
+    max_memory_items=int(os.environ.get("PDF2TEXT_CACHE_MEMORY_ITEMS", 64)),
+    max_disk_mb=float(os.environ.get("PDF2TEXT_CACHE_MAX_MB", 512)),
+)
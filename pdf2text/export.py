@@ -0,0 +1,211 @@
+"""Çıkarma sonuçlarının JSONL, CSV, Parquet ve Markdown olarak toplu dışa aktarımı.
+
+Belge sonuçları (sayfa metinleri, tablolar, görüntü meta verisi) bir kez
+çıkarılıp önbelleğe alınır; biçim değiştiğinde yalnızca yazma adımı tekrar
+çalışır. Çıktılar bir dizine veya diskteki bir zip dosyasına yazılır.
+"""
+import csv
+import io
+import json
+import os
+import tempfile
+import zipfile
+
+import pandas as pd
+
+from pdf2text import backends, extract, images, table_records
+from pdf2text import tables as table_prefilter
+from pdf2text.cache import CACHE_DIR, file_sha256, result_cache, touch
+
+FORMATS = ["jsonl", "csv", "parquet", "md"]
+# Dışa aktarılan sayfa metinleri ve tablolar her zaman bu motorla çıkarılır
+EXPORT_BACKEND = "pymupdf"
+
+
+def available_formats():
+    """Kurulu kütüphanelerle yazılabilen biçimleri döndürür."""
+    return [fmt for fmt in FORMATS if fmt != "parquet" or backends.available("pyarrow")]
+
+
+def table_markdown(rows):
+    """Satır listesini Markdown tablosuna çevirir; ilk satır başlıktır."""
+    if not rows:
+        return ""
+    width = max(len(row) for row in rows)
+    lines = []
+    for i, row in enumerate(rows):
+        cells = [
+            "" if cell is None else str(cell).replace("|", "\\|").replace("\n", " ")
+            for cell in row
+        ]
+        cells += [""] * (width - len(cells))
+        lines.append("| " + " | ".join(cells) + " |")
+        if i == 0:
+            lines.append("|" + "---|" * width)
+    return "\n".join(lines)
+
+
+def _collect(file_path, first_page=1, last_page=None):
+    pages = [
+        {"page": page_num, "text": text}
+        for page_num, text in extract.pymupdf_all_text(file_path, first_page, last_page)
+    ]
+    table_pages, _ = table_prefilter.run_with_prefilter(
+        file_path, extract.pymupdf_tables, first_page=first_page, last_page=last_page
+    )
+    tables = [
+        record.to_dict()
+        for page_num, page_tables in table_pages
+        for record in table_records.from_rows(EXPORT_BACKEND, page_num, page_tables)
+    ]
+    page_set = {page["page"] for page in pages}
+    image_meta = [
+        dict(entry)
+        for entry in images.image_index(file_path)
+        if page_set.intersection(entry["pages"])
+    ]
+    source = {
+        "backend": EXPORT_BACKEND,
+        "first_page": first_page,
+        "last_page": max(page_set) if page_set else first_page,
+    }
+    return {"source": source, "pages": pages, "tables": tables, "images": image_meta}
+
+
+def document_results(file_path, first_page=1, last_page=None):
+    """Belgenin (veya sayfa aralığının) dışa aktarılacak sonuçlarını önbellekli döndürür."""
+    return result_cache.get_or_compute(
+        file_sha256(file_path), "export", "document",
+        {"first_page": first_page, "last_page": last_page},
+        lambda: _collect(file_path, first_page, last_page),
+    )
+
+
+def _table_frame(table):
+    return pd.DataFrame(table["rows"], columns=table["columns"], dtype=object)
+
+
+def _long_tables(tables):
+    """Tüm tabloları tek bir sütunlu (uzun) tabloya çevirir."""
+    records = []
+    for table_id, table in enumerate(tables, start=1):
+        for row_index, row in enumerate(table["rows"]):
+            for column, value in zip(table["columns"], row):
+                records.append(
+                    {
+                        "table_id": table_id,
+                        "page": table["page"],
+                        "table_index": table["index"],
+                        "row": row_index,
+                        "column": column,
+                        "value": None if value is None else str(value),
+                    }
+                )
+    return pd.DataFrame(
+        records, columns=["table_id", "page", "table_index", "row", "column", "value"]
+    )
+
+
+def _image_frame(image_meta):
+    frame = pd.DataFrame(image_meta)
+    if "pages" in frame:
+        frame["pages"] = frame["pages"].map(lambda pages: ",".join(map(str, pages)))
+    return frame
+
+
+def iter_files(results, formats, name="document"):
+    """Her çıktı dosyası için (göreli yol, bayt) üretir."""
+    formats = [fmt for fmt in formats if fmt in FORMATS]
+
+    yield "source.json", json.dumps(results["source"], indent=2).encode("utf-8")
+
+    if "jsonl" in formats:
+        for key in ("pages", "tables", "images"):
+            yield f"{key}.jsonl", "".join(
+                json.dumps(item, ensure_ascii=False, default=str) + "\n"
+                for item in results[key]
+            ).encode("utf-8")
+
+    if "csv" in formats:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(["page", "text"])
+        writer.writerows((page["page"], page["text"]) for page in results["pages"])
+        yield "pages.csv", buffer.getvalue().encode("utf-8")
+        for table in results["tables"]:
+            yield (
+                f"tables/page{table['page']:04d}_table{table['index']}.csv",
+                _table_frame(table).to_csv(index=False).encode("utf-8"),
+            )
+        yield "images.csv", _image_frame(results["images"]).to_csv(index=False).encode("utf-8")
+
+    if "parquet" in formats:
+        if not backends.available("pyarrow"):
+            raise RuntimeError("Parquet export requires pyarrow")
+        frames = {
+            "pages": pd.DataFrame(results["pages"], columns=["page", "text"]),
+            "tables": _long_tables(results["tables"]),
+            "images": _image_frame(results["images"]),
+        }
+        for key, frame in frames.items():
+            buffer = io.BytesIO()
+            frame.to_parquet(buffer, index=False)
+            yield f"{key}.parquet", buffer.getvalue()
+
+    if "md" in formats:
+        parts = [f"# {name}\n"]
+        tables_by_page = {}
+        for table in results["tables"]:
+            tables_by_page.setdefault(table["page"], []).append(table)
+        for page in results["pages"]:
+            parts.append(f"## Page {page['page']}\n\n{page['text']}\n")
+            for table in tables_by_page.get(page["page"], []):
+                parts.append(
+                    f"### Table {table['index']}\n\n"
+                    f"{table_markdown([table['columns']] + table['rows'])}\n"
+                )
+        yield f"{name}.md", "\n".join(parts).encode("utf-8")
+
+
+def export_directory(results, output_dir, formats, name="document"):
+    """Çıktıları dizine yazar; yazılan dosya yollarını döndürür."""
+    written = []
+    for relative_path, data in iter_files(results, formats, name):
+        path = os.path.join(output_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        written.append(path)
+    return written
+
+
+def export_zip(file_path, formats, name="document", first_page=1, last_page=None):
+    """Çıktıları diskteki bir zip dosyasına yazar ve yolunu döndürür.
+
+    Zip, belge özeti, sayfa aralığı ve biçimlerle adlandırılır; aynı istek
+    için yeniden oluşturulmaz.
+    """
+    file_hash = file_sha256(file_path)
+    formats = sorted(fmt for fmt in formats if fmt in FORMATS)
+    range_label = f"{first_page}-{last_page or 'end'}"
+    zip_path = os.path.join(
+        CACHE_DIR, "exports",
+        f"{file_hash}.{EXPORT_BACKEND}.{range_label}.{'-'.join(formats)}.zip",
+    )
+    if os.path.exists(zip_path) and touch(zip_path):
+        return zip_path
+
+    results = document_results(file_path, first_page, last_page)
+    os.makedirs(os.path.dirname(zip_path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(zip_path), suffix=".tmp")
+    os.close(fd)
+    try:
+        with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for relative_path, data in iter_files(results, formats, name):
+                archive.writestr(f"{name}/{relative_path}", data)
+        os.replace(tmp_path, zip_path)
+        result_cache.track_file(zip_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return zip_path
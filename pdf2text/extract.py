@@ -0,0 +1,356 @@
+"""Doğrudan metin çıkarma yolları (PyMuPDF, PDFplumber, Camelot, Unstructured).
+
+Fonksiyonlar Streamlit'e bağlı değildir ve önbelleğe alınabilir (pickle
+edilebilir) sonuçlar döndürür.
+"""
+import io
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import fitz
+
+from pdf2text import backends, jobs, pagecache, tracing
+from pdf2text import tables as table_prefilter
+
+UNSTRUCTURED_TEXT_CATEGORIES = [
+    "NarrativeText",
+    "Title",
+    "ListItem",
+    "UncategorizedText",
+]
+
+
+def _open_pdf(file_path):
+    with tracing.span("pymupdf.open"):
+        return fitz.open(file_path)
+
+
+def _open_plumber(file_path):
+    pdfplumber = backends.load("pdfplumber")
+    with tracing.span("pdfplumber.open"):
+        return pdfplumber.open(file_path)
+
+
+def _page_indices(page_count, first_page, last_page, page_numbers=None):
+    """0 tabanlı sayfa sırasını döndürür; `page_numbers` (1 tabanlı) aralığı geçersiz kılar."""
+    if page_numbers is not None:
+        return [page_num - 1 for page_num in sorted(page_numbers) if 1 <= page_num <= page_count]
+    last_page = page_count if last_page is None else min(last_page, page_count)
+    return range(max(first_page, 1) - 1, last_page)
+
+
+def iter_pymupdf_text(file_path, first_page=1, last_page=None, page_numbers=None):
+    """Sayfaları çıkarıldıkça (sayfa numarası, metin) olarak üretir."""
+    with _open_pdf(file_path) as doc:
+        for page_num in _page_indices(doc.page_count, first_page, last_page, page_numbers):
+            with tracing.span("pymupdf.get_text", pages=1):
+                text = doc[page_num].get_text()
+            yield page_num + 1, text
+
+
+def pymupdf_all_text(file_path, first_page=1, last_page=None):
+    """Her sayfa için (sayfa numarası, metin) listesi döndürür."""
+    return list(iter_pymupdf_text(file_path, first_page, last_page))
+
+
+def pymupdf_page_text(file_path, page_number):
+    with _open_pdf(file_path) as doc:
+        with tracing.span("pymupdf.get_text", pages=1):
+            return doc[page_number - 1].get_text()
+
+
+def pymupdf_page_count(file_path):
+    with _open_pdf(file_path) as doc:
+        return doc.page_count
+
+
+def pymupdf_search(file_path, search_term):
+    """Terimin geçtiği sayfaları ve (x0, y0, x1, y1) koordinatlarını döndürür."""
+    results = []
+    with _open_pdf(file_path) as doc:
+        for page in doc:
+            text_instances = page.search_for(search_term)
+            if text_instances:
+                results.append(
+                    {
+                        "page": page.number + 1,
+                        "occurrences": len(text_instances),
+                        "coordinates": [tuple(rect) for rect in text_instances],
+                    }
+                )
+    return results
+
+
+def pymupdf_tables(file_path, page_numbers=None, with_boxes=False):
+    """Her sayfa için bulunan tabloların ham hücre listelerini döndürür.
+
+    `page_numbers` verilirse yalnızca bu (1 tabanlı) sayfalar taranır.
+    `with_boxes=True` ise her tablo {"rows": hücreler, "bbox": (x0, y0, x1, y1)}
+    olarak döner; böylece vurgular için `find_tables` ikinci kez çalışmaz.
+    """
+    pages = []
+    with _open_pdf(file_path) as doc:
+        if page_numbers is None:
+            page_numbers = range(1, doc.page_count + 1)
+        for page_num in page_numbers:
+            with tracing.span("pymupdf.find_tables", pages=1):
+                table_finder = doc[page_num - 1].find_tables()
+                tables = table_finder.tables if table_finder else []
+            if with_boxes:
+                pages.append(
+                    (page_num, [{"rows": table.extract(), "bbox": tuple(table.bbox)} for table in tables])
+                )
+            else:
+                pages.append((page_num, [table.extract() for table in tables]))
+    return pages
+
+
+def pymupdf_images(file_path, page_numbers=None):
+    """Gömülü görüntüleri sayfa bazında (bayt, uzantı) olarak döndürür."""
+    pages = []
+    with _open_pdf(file_path) as doc:
+        for page_index in _page_indices(doc.page_count, 1, None, page_numbers):
+            page = doc[page_index]
+            images = []
+            for img in page.get_images():
+                base_image = doc.extract_image(img[0])
+                images.append((base_image["image"], base_image["ext"]))
+            if images:
+                pages.append((page.number + 1, images))
+    return pages
+
+
+def iter_pdfplumber_text(file_path, first_page=1, last_page=None, page_numbers=None):
+    with _open_plumber(file_path) as pdf:
+        for page_num in _page_indices(len(pdf.pages), first_page, last_page, page_numbers):
+            page = pdf.pages[page_num]
+            with tracing.span("pdfplumber.extract_text", pages=1):
+                text = page.extract_text()
+            yield page_num + 1, text
+            # pdfplumber sayfa nesneleri ayrıştırılan karakterleri önbelleğe alır
+            page.flush_cache()
+
+
+def pdfplumber_all_text(file_path, first_page=1, last_page=None):
+    return list(iter_pdfplumber_text(file_path, first_page, last_page))
+
+
+def pdfplumber_page_count(file_path):
+    with _open_plumber(file_path) as pdf:
+        return len(pdf.pages)
+
+
+def pdfplumber_page_text(file_path, page_number):
+    with _open_plumber(file_path) as pdf:
+        with tracing.span("pdfplumber.extract_text", pages=1):
+            return pdf.pages[page_number - 1].extract_text()
+
+
+def pdfplumber_tables(file_path, page_numbers=None):
+    with _open_plumber(file_path) as pdf:
+        if page_numbers is None:
+            page_numbers = range(1, len(pdf.pages) + 1)
+        pages = []
+        for page_num in page_numbers:
+            with tracing.span("pdfplumber.extract_tables", pages=1):
+                tables = pdf.pages[page_num - 1].extract_tables()
+            if tables:
+                pages.append((page_num, tables))
+        return pages
+
+
+def pdfplumber_images(file_path, resolution=150, page_numbers=None):
+    """Görüntü konumlarını ve kırpılmış PNG önizlemelerini döndürür."""
+    pages = []
+    with _open_plumber(file_path) as pdf:
+        for page_num in _page_indices(len(pdf.pages), 1, None, page_numbers):
+            page = pdf.pages[page_num]
+            if not (hasattr(page, "images") and page.images):
+                continue
+            images = []
+            for img in page.images:
+                page_height = page.height
+                bbox = (
+                    img["x0"],
+                    page_height - img["y1"],
+                    img["x1"],
+                    page_height - img["y0"],
+                )
+                info = {
+                    "x0": img["x0"],
+                    "y0": img["y0"],
+                    "x1": img["x1"],
+                    "y1": img["y1"],
+                    "page_height": page_height,
+                    "bbox": bbox,
+                    "object": img.get("object"),
+                    "png": None,
+                    "error": None,
+                }
+                try:
+                    cropped_image = page.crop(bbox).to_image(resolution=resolution)
+                    buffer = io.BytesIO()
+                    cropped_image.original.save(buffer, format="PNG")
+                    info["png"] = buffer.getvalue()
+                except Exception as e:
+                    info["error"] = str(e)
+                images.append(info)
+            pages.append((page_num + 1, images))
+    return pages
+
+
+def camelot_tables(file_path, flavor, pages="all"):
+    """Camelot tablolarını sayfa, doğruluk ve boşluk metrikleriyle döndürür."""
+    camelot = backends.load("camelot")
+
+    page_total = 0 if pages == "all" else len(pages.split(","))
+    with tracing.span(f"camelot.read_pdf.{flavor}", pages=page_total):
+        tables = camelot.read_pdf(file_path, flavor=flavor, pages=pages)
+    return [
+        {
+            "page": table.page,
+            "order": table.parsing_report.get("order", i + 1),
+            "accuracy": table.parsing_report["accuracy"],
+            "whitespace": table.parsing_report["whitespace"],
+            "df": table.df,
+        }
+        for i, table in enumerate(tables)
+    ]
+
+
+def camelot_tables_parallel(
+    file_path,
+    flavor,
+    first_page=1,
+    last_page=None,
+    workers=None,
+    pages_per_chunk=10,
+    page_numbers=None,
+):
+    """Sayfa aralığını parçalara bölüp Camelot'u süreç havuzunda çalıştırır.
+
+    `page_numbers` verilirse aralıktaki yalnızca bu sayfalar işlenir. Sonuçlar
+    sayfa ve sayfa içi tablo sırasına göre birleştirilir.
+    """
+    with _open_pdf(file_path) as doc:
+        page_count = doc.page_count
+    last_page = page_count if last_page is None else min(last_page, page_count)
+    selected = [
+        page_num
+        for page_num in range(first_page, last_page + 1)
+        if page_numbers is None or page_num in page_numbers
+    ]
+    chunks = [
+        ",".join(str(page_num) for page_num in selected[i:i + pages_per_chunk])
+        for i in range(0, len(selected), pages_per_chunk)
+    ]
+    if not chunks:
+        return []
+    if len(chunks) == 1 or workers == 1:
+        tables = camelot_tables(file_path, flavor, ",".join(chunks))
+    else:
+        tables = []
+        # Streamlit süreci çok iş parçacıklıdır; fork yerine spawn kullanılır
+        with ProcessPoolExecutor(
+            max_workers=min(workers or os.cpu_count() or 1, len(chunks)),
+            mp_context=jobs.spawn_context(),
+        ) as executor:
+            for chunk_tables in executor.map(
+                camelot_tables, [file_path] * len(chunks), [flavor] * len(chunks), chunks
+            ):
+                tables.extend(chunk_tables)
+    return sorted(tables, key=lambda table: (int(table["page"]), table["order"]))
+
+
+def camelot_tables_prefiltered(
+    file_path, flavor, first_page=1, last_page=None, workers=None, prefilter=True
+):
+    """Camelot'u yalnızca tablo adayı sayfalarda çalıştırır; (tablolar, rapor) döndürür.
+
+    Sayfa sonuçları ayrı ayrı önbelleğe alınır; daha önce işlenen sayfalar
+    yeniden çalıştırılmaz.
+    """
+    def compute(missing):
+        by_page = {}
+        for table in camelot_tables_parallel(
+            file_path, flavor, min(missing), max(missing), workers,
+            page_numbers=set(missing),
+        ):
+            by_page.setdefault(int(table["page"]), []).append(table)
+        return sorted(by_page.items())
+
+    def detector(path, page_numbers):
+        pages = pagecache.cached_pages(
+            path, "camelot", "tables", page_numbers, compute,
+            params={"flavor": flavor}, default=[],
+        )
+        return [table for _, tables in pages for table in tables]
+
+    return table_prefilter.run_with_prefilter(
+        file_path, detector, enabled=prefilter, first_page=first_page, last_page=last_page
+    )
+
+
+def unstructured_text(file_path, include_page_breaks=True):
+    """Unstructured hızlı stratejisi ile metin öğelerini döndürür."""
+    partition_pdf = backends.load("unstructured.partition.pdf").partition_pdf
+
+    with tracing.span("unstructured.partition_pdf"):
+        elements = partition_pdf(
+            filename=file_path,
+            strategy="fast",
+            include_page_breaks=include_page_breaks,
+        )
+    return [
+        elem.text
+        for elem in elements
+        if elem.category in UNSTRUCTURED_TEXT_CATEGORIES
+    ]
+
+
+def unstructured_pages(file_path, page_numbers, include_page_breaks=True):
+    """Yalnızca verilen sayfaları Unstructured ile işler; (sayfa, metinler) üretir.
+
+    Sayfalar geçici bir alt belgeye kopyalanır; öğelerin sayfa numaraları
+    asıl belgedeki numaralara geri eşlenir.
+    """
+    partition_pdf = backends.load("unstructured.partition.pdf").partition_pdf
+
+    page_numbers = sorted(page_numbers)
+    if not page_numbers:
+        return []
+    fd, subset_path = tempfile.mkstemp(suffix=".pdf")
+    os.close(fd)
+    try:
+        with _open_pdf(file_path) as doc:
+            doc.select([page_num - 1 for page_num in page_numbers])
+            doc.save(subset_path)
+        with tracing.span("unstructured.partition_pdf", pages=len(page_numbers)):
+            elements = partition_pdf(
+                filename=subset_path,
+                strategy="fast",
+                include_page_breaks=include_page_breaks,
+            )
+    finally:
+        os.remove(subset_path)
+
+    texts = {}
+    for elem in elements:
+        if elem.category not in UNSTRUCTURED_TEXT_CATEGORIES:
+            continue
+        subset_page = getattr(elem.metadata, "page_number", None) or 1
+        texts.setdefault(page_numbers[subset_page - 1], []).append(elem.text)
+    return sorted(texts.items())
+
+
+def unstructured_text_range(file_path, first_page, last_page, include_page_breaks=True):
+    """Sayfa aralığının metin öğelerini döndürür; önbellekteki sayfaları yeniden işlemez."""
+    pages = pagecache.cached_pages(
+        file_path, "unstructured", "fast",
+        pagecache.page_numbers(first_page, last_page),
+        lambda missing: unstructured_pages(file_path, missing, include_page_breaks),
+        params={"include_page_breaks": include_page_breaks},
+        default=[],
+    )
+    return [text for _, texts in pages for text in texts]
@@ -0,0 +1,134 @@
+"""Gömülü görüntüler için çözümlemesiz indeks ve isteğe bağlı çözümleme.
+
+İndeks yalnızca `page.get_images()` meta verisinden (sayfa, xref, boyut,
+biçim) oluşturulur; piksel verisi ancak bir görüntü seçildiğinde veya OCR'a
+verildiğinde çözülür. Birden çok sayfada kullanılan aynı xref tek kayıtta
+toplanır.
+"""
+import io
+import os
+import threading
+from collections import OrderedDict
+
+import fitz
+from PIL import Image
+
+from pdf2text.cache import file_sha256, result_cache
+
+FILTER_EXTENSIONS = {
+    "DCTDecode": "jpeg",
+    "JPXDecode": "jpx",
+    "JBIG2Decode": "jb2",
+    "CCITTFaxDecode": "tiff",
+}
+THUMBNAIL_SIZE = (256, 256)
+
+
+def build_image_index(file_path):
+    """Görüntüleri çözmeden xref başına bir kayıt listesi döndürür."""
+    entries = OrderedDict()
+    with fitz.open(file_path) as doc:
+        for page in doc:
+            for img_index, img in enumerate(page.get_images()):
+                xref, _, width, height, bpc, colorspace, _, _, image_filter = img[:9]
+                entry = entries.get(xref)
+                if entry is None:
+                    entries[xref] = {
+                        "xref": xref,
+                        "page": page.number + 1,
+                        "index": img_index,
+                        "pages": [page.number + 1],
+                        "width": width,
+                        "height": height,
+                        "bpc": bpc,
+                        "colorspace": colorspace,
+                        "ext": FILTER_EXTENSIONS.get(image_filter, "png"),
+                    }
+                elif page.number + 1 not in entry["pages"]:
+                    entry["pages"].append(page.number + 1)
+    return list(entries.values())
+
+
+def image_index(file_path):
+    """Önbelleğe alınmış görüntü indeksini döndürür."""
+    return result_cache.get_or_compute(
+        file_sha256(file_path), "pymupdf", "image_index", {},
+        lambda: build_image_index(file_path),
+    )
+
+
+_decoded = OrderedDict()
+_decoded_bytes = 0
+_decoded_lock = threading.Lock()
+# Çözülmüş görüntüler için bellek sınırı; tek bir büyük tarama onlarca MB tutabilir
+MAX_DECODED_BYTES = int(float(os.environ.get("PDF2TEXT_DECODED_IMAGES_MB", 64)) * 1024 * 1024)
+
+
+def _decoded_size(image):
+    return image.width * image.height * len(image.getbands())
+
+
+def load_image(file_path, xref):
+    """Tek bir görüntüyü PIL Image olarak çözer; son çözülenleri bellek sınırı içinde tutar."""
+    global _decoded_bytes
+    key = (file_sha256(file_path), xref)
+    with _decoded_lock:
+        if key in _decoded:
+            _decoded.move_to_end(key)
+            return _decoded[key]
+
+    with fitz.open(file_path) as doc:
+        base_image = doc.extract_image(xref)
+    image = Image.open(io.BytesIO(base_image["image"]))
+    image.load()
+
+    size = _decoded_size(image)
+    # Sınırdan büyük görüntüler saklanmaz
+    if size > MAX_DECODED_BYTES:
+        return image
+    with _decoded_lock:
+        if key not in _decoded:
+            _decoded[key] = image
+            _decoded_bytes += size
+        while _decoded_bytes > MAX_DECODED_BYTES:
+            _, evicted = _decoded.popitem(last=False)
+            _decoded_bytes -= _decoded_size(evicted)
+    return image
+
+
+def _make_thumbnail(file_path, xref, size):
+    with fitz.open(file_path) as doc:
+        base_image = doc.extract_image(xref)
+    image = Image.open(io.BytesIO(base_image["image"]))
+    # JPEG'ler için küçültülmüş çözümleme tam boyutlu çözmeyi atlar
+    image.draft("RGB", size)
+    image.thumbnail(size)
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def thumbnail(file_path, xref, size=THUMBNAIL_SIZE):
+    """Görüntünün PNG küçük resmini döndürür (önbellekli)."""
+    return result_cache.get_or_compute(
+        file_sha256(file_path), "pymupdf", "thumbnail", {"xref": xref, "size": list(size)},
+        lambda: _make_thumbnail(file_path, xref, size),
+    )
+
+
+class LazyImages:
+    """Dilimlendiğinde yalnızca istenen görüntüleri çözen dizi benzeri sarmalayıcı."""
+
+    def __init__(self, file_path, entries):
+        self.file_path = file_path
+        self.entries = entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [load_image(self.file_path, e["xref"]) for e in self.entries[item]]
+        return load_image(self.file_path, self.entries[item]["xref"])
@@ -0,0 +1,108 @@
+"""Yüklemelerin tek geçişte diske yazılması, doğrulanması ve ön incelemesi.
+
+Yükleme parça parça diske yazılırken SHA-256 özeti hesaplanır; ilk parçada
+PDF başlığı denetlendiği için PDF olmayan dosyalar hemen reddedilir. Ardından
+PyMuPDF ile açılarak sayfa sayısı, şifreleme, metin katmanı ve meta veri
+çıkarılır, ilk sayfanın küçük bir önizlemesi üretilir. Sonuç önbelleğe
+alınır; çıkarma sayfaları bu bilgilerle başlar.
+"""
+import hashlib
+import os
+import tempfile
+
+import fitz
+
+from pdf2text.cache import make_key, result_cache
+from pdf2text.storage import document_store
+
+PDF_HEADER = b"%PDF-"
+# Başlık dosyanın ilk 1024 baytı içinde olabilir
+HEADER_WINDOW = 1024
+PREVIEW_DPI = 48
+TEXT_SAMPLE_PAGES = 3
+
+
+class InvalidPDFError(ValueError):
+    """Yüklenen dosya okunabilir bir PDF değil."""
+
+
+def inspect_document(doc):
+    """Açık belgenin sayfa sayısı, şifreleme, metin katmanı ve meta verisini döndürür."""
+    info = {
+        "pages": doc.page_count,
+        "encrypted": doc.is_encrypted,
+        "needs_password": bool(doc.needs_pass),
+        "repaired": doc.is_repaired,
+        "metadata": {key: value for key, value in (doc.metadata or {}).items() if value},
+        "text_layer": None,
+    }
+    if doc.needs_pass:
+        return info
+    sample = range(min(TEXT_SAMPLE_PAGES, doc.page_count))
+    info["text_layer"] = any(doc[i].get_text("text").strip() for i in sample)
+    return info
+
+
+def render_preview(doc, dpi=PREVIEW_DPI):
+    """İlk sayfanın PNG önizlemesini döndürür."""
+    if doc.needs_pass or doc.page_count == 0:
+        return None
+    return doc[0].get_pixmap(dpi=dpi).tobytes("png")
+
+
+def _write_chunks(fileobj, file, chunk_size):
+    digest = hashlib.sha256()
+    size = 0
+    head = b""
+    for chunk in iter(lambda: fileobj.read(chunk_size), b""):
+        if len(head) < HEADER_WINDOW:
+            head += chunk[:HEADER_WINDOW - len(head)]
+            if len(head) >= HEADER_WINDOW and PDF_HEADER not in head:
+                raise InvalidPDFError("File does not start with a PDF header")
+        digest.update(chunk)
+        file.write(chunk)
+        size += len(chunk)
+    if PDF_HEADER not in head:
+        raise InvalidPDFError("File does not start with a PDF header")
+    return digest.hexdigest(), size
+
+
+def ingest(fileobj, store=document_store, chunk_size=1024 * 1024, cache=result_cache):
+    """Yüklemeyi depolar ve doğrular; belge bilgilerini içeren sözlük döndürür.
+
+    Dosya PDF değilse veya PyMuPDF tarafından açılamıyorsa `InvalidPDFError`
+    fırlatılır ve hiçbir şey depolanmaz.
+    """
+    os.makedirs(store.root, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=store.root, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            file_hash, size = _write_chunks(fileobj, f, chunk_size)
+
+        key = make_key(file_hash, "ingest", "document", {})
+        info = cache.get(key)
+        if info is None:
+            try:
+                with fitz.open(tmp_path, filetype="pdf") as doc:
+                    if doc.page_count == 0:
+                        raise InvalidPDFError("PDF has no pages")
+                    info = inspect_document(doc)
+                    info["preview"] = render_preview(doc)
+            except (fitz.FileDataError, RuntimeError) as e:
+                raise InvalidPDFError(f"PDF could not be opened: {e}") from e
+            info["size"] = size
+            cache.put(key, info)
+
+        path, is_new = store.adopt(tmp_path, file_hash)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    # Çıkarma sayfalarının ilk isteği sayfa sayısını yeniden hesaplamasın
+    cache.put(make_key(file_hash, "pymupdf", "page_count", {}), info["pages"])
+    return dict(info, file_hash=file_hash, path=path, is_new=is_new)
+
+
+def document_info(file_hash, cache=result_cache):
+    """Daha önce alınmış belge bilgilerini döndürür (yoksa None)."""
+    return cache.get(make_key(file_hash, "ingest", "document", {}))
@@ -0,0 +1,342 @@
+"""Uzun süren çıkarmaları Streamlit betik iş parçacığı dışında çalıştıran iş kuyruğu.
+
+İşler kalıcı işçi süreçlerine dağıtılır. Hedef fonksiyon bir üreteç
+döndürürse üretilen her öğe kısmi sonuç olarak hemen iletilir. Çalışan bir
+iş iptal edildiğinde işçi süreci, açtığı alt süreçlerle (ör. paralel Camelot
+havuzu) birlikte sonlandırılır ve yerine yenisi başlatılır.
+Modeller işçilerde çalıştığından model kayıt defteri ve ön yükleme de her
+işçide kurulur; işçiler yüklü modellerini olaylarla yöneticiye bildirir.
+Yönetici süreç genelinde tek örnektir, bu yüzden işler yeniden
+çalıştırmalardan etkilenmez.
+"""
+import atexit
+import inspect
+import multiprocessing
+import os
+import queue
+import signal
+import sys
+import threading
+import types
+import time
+import traceback
+import uuid
+from collections import deque
+
+from pdf2text import models, tracing
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+ACTIVE_STATES = (PENDING, RUNNING)
+
+MAX_FINISHED_JOBS = 100
+# Boştaki işçilerin durum raporu gönderme aralığı (saniye)
+REPORT_INTERVAL = 5.0
+
+
+def _worker_loop(tasks, events, initializer=None, initargs=(), report=None):
+    # İptalde işçi ve alt süreçleri birlikte sonlandırılabilsin diye kendi süreç grubunu aç
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+    if initializer is not None:
+        initializer(*initargs)
+    reported = None
+    while True:
+        if report is not None:
+            state = report()
+            if state != reported:
+                events.put(("report", None, (os.getpid(), state)))
+                reported = state
+        try:
+            task = tasks.get(timeout=REPORT_INTERVAL if report else None)
+        except queue.Empty:
+            continue
+        if task is None:
+            return
+        job_id, fn, args, kwargs = task
+        events.put(("started", job_id, os.getpid()))
+        # Ölçülen aşamalar sonuçla birlikte yöneticiye gönderilir
+        spans = []
+        try:
+            with tracing.run() as spans:
+                result = fn(*args, **kwargs)
+                if inspect.isgenerator(result):
+                    for item in result:
+                        events.put(("partial", job_id, item))
+                    result = None
+            events.put(("done", job_id, (result, spans)))
+        except BaseException:
+            events.put(("error", job_id, (traceback.format_exc(), spans)))
+
+
+# `__main__` değişimi süreç genelindedir; tüm spawn başlatmaları bu kilidi paylaşır
+_start_lock = threading.Lock()
+
+
+class _SpawnProcess(multiprocessing.context.SpawnProcess):
+    def start(self):
+        # Streamlit çalışan betiği `__main__` olarak kaydeder; spawn bu modülü
+        # alt süreçte yeniden çalıştırmasın diye başlatma sırasında boş bir modül koy
+        with _start_lock:
+            main_module = sys.modules.get("__main__")
+            sys.modules["__main__"] = types.ModuleType("__main__")
+            try:
+                super().start()
+            finally:
+                sys.modules["__main__"] = main_module
+
+
+class _SpawnContext(multiprocessing.context.SpawnContext):
+    Process = _SpawnProcess
+
+
+_spawn_context = _SpawnContext()
+
+
+def spawn_context():
+    """Streamlit betiğini alt süreçte yeniden çalıştırmayan spawn bağlamını döndürür.
+
+    Streamlit sunucusu çok iş parçacıklı olduğundan fork yerine bu bağlam
+    kullanılmalıdır (ör. `ProcessPoolExecutor(mp_context=spawn_context())`).
+    """
+    return _spawn_context
+
+
+def default_workers():
+    """Varsayılan işçi sayısı: çekirdek sayısının yarısı."""
+    return max((os.cpu_count() or 2) // 2, 1)
+
+
+class _Worker:
+    def __init__(self, ctx, events, initializer=None, initargs=(), report=None):
+        self.tasks = ctx.Queue()
+        # Daemon olmayan süreçler kendi süreç havuzlarını açabilir (ör. paralel Camelot)
+        self.process = ctx.Process(
+            target=_worker_loop,
+            args=(self.tasks, events, initializer, initargs, report),
+            daemon=False,
+        )
+        self.process.start()
+        self.job_id = None
+
+    def stop(self):
+        if self.process.is_alive():
+            self._signal(signal.SIGTERM)
+            self.process.join(timeout=5)
+        if self.process.is_alive():
+            self._signal(getattr(signal, "SIGKILL", signal.SIGTERM))
+        self.process.join(timeout=5)
+
+    def _signal(self, signum):
+        """Sinyali işçinin süreç grubuna (işçi ve alt süreçleri) gönderir."""
+        if hasattr(os, "killpg"):
+            try:
+                os.killpg(self.process.pid, signum)
+                return
+            except OSError:
+                # İşçi henüz kendi grubunu açmadıysa yalnızca işçiye gönder
+                pass
+        if signum == signal.SIGTERM:
+            self.process.terminate()
+        else:
+            self.process.kill()
+
+
+class JobManager:
+    """İşleri işçi süreçlerine dağıtır.
+
+    `initializer(*initargs)` her işçi başlarken bir kez çağrılır. `report()`
+    işçide çağrılır; döndürdüğü değer değiştikçe yöneticiye iletilir ve
+    `worker_reports` ile okunur. Hepsi pickle edilebilir olmalıdır.
+    """
+
+    def __init__(self, max_workers=None, initializer=None, initargs=(), report=None):
+        self.max_workers = max_workers or default_workers()
+        self.initializer = initializer
+        self.initargs = initargs
+        self.report = report
+        self._ctx = spawn_context()
+        self._events = None
+        self._workers = []
+        self._reports = {}
+        self._pending = deque()
+        self._jobs = {}
+        self._lock = threading.RLock()
+        self._dispatcher = None
+
+    def _ensure_started(self):
+        if self._dispatcher is not None:
+            return
+        self._events = self._ctx.Queue()
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, daemon=True)
+        self._dispatcher.start()
+        atexit.register(self.shutdown)
+
+    def shutdown(self):
+        """Tüm işçi süreçlerini sonlandırır."""
+        with self._lock:
+            for worker in self._workers:
+                worker.stop()
+            self._workers = []
+            self._reports = {}
+
+    def prestart(self):
+        """İşçi süreçlerini ilk işi beklemeden başlatır (ör. model ön yüklemesi için)."""
+        with self._lock:
+            self._ensure_started()
+            while len(self._workers) < self.max_workers:
+                self._workers.append(self._new_worker())
+
+    def worker_reports(self):
+        """Canlı işçilerin son raporlarını süreç kimliğine göre döndürür."""
+        with self._lock:
+            return dict(self._reports)
+
+    def _new_worker(self):
+        return _Worker(
+            self._ctx, self._events, self.initializer, self.initargs, self.report
+        )
+
+    def _remove_worker(self, worker):
+        self._workers.remove(worker)
+        self._reports.pop(worker.process.pid, None)
+
+    def submit(self, fn, *args, label=None, **kwargs):
+        """İşi kuyruğa ekler ve iş kimliğini döndürür.
+
+        `fn` ve argümanları pickle edilebilir olmalıdır (modül düzeyinde
+        fonksiyonlar veya `functools.partial`).
+        """
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._ensure_started()
+            self._jobs[job_id] = {
+                "id": job_id,
+                "label": label or getattr(fn, "__name__", "job"),
+                "state": PENDING,
+                "partial": [],
+                "spans": [],
+                "result": None,
+                "error": None,
+                "submitted": time.time(),
+                "started": None,
+                "finished": None,
+            }
+            self._pending.append((job_id, fn, args, kwargs))
+        return job_id
+
+    def status(self, job_id):
+        """İşin durumunun bir kopyasını döndürür; bilinmeyen işler için None."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            status = dict(job)
+            status["partial"] = list(job["partial"])
+            status["spans"] = list(job["spans"])
+        return status
+
+    def cancel(self, job_id):
+        stopped = None
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job["state"] not in ACTIVE_STATES:
+                return False
+            self._pending = deque(t for t in self._pending if t[0] != job_id)
+            # İş, işçiye gönderildiği halde "started" olayı gelmeden PENDING
+            # görünebilir; işçi durumdan bağımsız olarak aranır
+            for worker in self._workers:
+                if worker.job_id == job_id:
+                    self._remove_worker(worker)
+                    stopped = worker
+                    break
+            self._finish(job, CANCELLED)
+        # Sonlandırma saniyeler sürebilir; kilit tutulursa durum sorguları ve
+        # dağıtıcı bekler
+        if stopped is not None:
+            stopped.stop()
+        return True
+
+    def _finish(self, job, state, result=None, error=None):
+        job["state"] = state
+        job["result"] = result
+        job["error"] = error
+        job["finished"] = time.time()
+        # Bitmiş işlerin sayısını sınırla
+        finished = [
+            j for j in self._jobs.values() if j["state"] not in ACTIVE_STATES
+        ]
+        for old in sorted(finished, key=lambda j: j["finished"])[:-MAX_FINISHED_JOBS]:
+            del self._jobs[old["id"]]
+
+    def _handle_event(self, event):
+        kind, job_id, payload = event
+        with self._lock:
+            if kind == "report":
+                pid, state = payload
+                # Sonlandırılmış işçilerden gecikerek gelen raporları atla
+                if any(w.process.pid == pid for w in self._workers):
+                    self._reports[pid] = state
+                return
+            if kind in ("done", "error"):
+                # İş iptal edilmiş olsa bile işçi boşa çıkar
+                for worker in self._workers:
+                    if worker.job_id == job_id:
+                        worker.job_id = None
+                payload, spans = payload
+                # İşçide ölçülen aşamalar bu sürecin sayaçlarına da eklenir
+                for span in spans:
+                    tracing.metrics.record(span)
+            job = self._jobs.get(job_id)
+            if job is None or job["state"] not in ACTIVE_STATES:
+                return
+            if kind == "started":
+                job["state"] = RUNNING
+                job["started"] = time.time()
+            elif kind == "partial":
+                job["partial"].append(payload)
+            elif kind == "done":
+                job["spans"] = spans
+                self._finish(job, DONE, result=payload)
+            else:
+                job["spans"] = spans
+                self._finish(job, FAILED, error=payload)
+
+    def _dispatch_loop(self):
+        while True:
+            try:
+                self._handle_event(self._events.get(timeout=0.1))
+            except queue.Empty:
+                pass
+            with self._lock:
+                # Çöken işçilerin işlerini başarısız say
+                for worker in list(self._workers):
+                    if not worker.process.is_alive():
+                        self._remove_worker(worker)
+                        job = self._jobs.get(worker.job_id)
+                        if job is not None and job["state"] in ACTIVE_STATES:
+                            self._finish(job, FAILED, error="Worker process exited")
+                while self._pending:
+                    idle = [w for w in self._workers if w.job_id is None]
+                    if not idle and len(self._workers) < self.max_workers:
+                        worker = self._new_worker()
+                        self._workers.append(worker)
+                        idle = [worker]
+                    if not idle:
+                        break
+                    job_id, fn, args, kwargs = self._pending.popleft()
+                    idle[0].job_id = job_id
+                    idle[0].tasks.put((job_id, fn, args, kwargs))
+
+
+_max_workers = int(os.environ.get("PDF2TEXT_JOB_WORKERS", 0)) or default_workers()
+# Model bellek bütçesi tüm işçiler arasında paylaştırılır
+job_manager = JobManager(
+    max_workers=_max_workers,
+    initializer=models.init_worker,
+    initargs=(_max_workers,),
+    report=models.worker_report,
+)
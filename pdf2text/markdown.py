@@ -0,0 +1,61 @@
+"""pymupdf4llm ile tek geçişte Markdown dönüşümü.
+
+Belge sayfa başına yeniden açılmak yerine bir kez açılır ve seçilen sayfalar
+`page_chunks=True` ile tek çağrıda dönüştürülür. Uzun belgeler isteğe bağlı
+olarak sayfa gruplarına bölünüp paralel süreçlerde işlenir. Sayfa bazında
+sonuçlar önbelleğe alınır.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import fitz
+
+from pdf2text import backends, pagecache, tracing
+from pdf2text.jobs import spawn_context
+from pdf2text.cache import result_cache
+
+
+@tracing.traced("pymupdf4llm.to_markdown")
+def _convert_pages(file_path, page_indices):
+    pymupdf4llm = backends.load("pymupdf4llm")
+
+    with fitz.open(file_path) as doc:
+        chunks = pymupdf4llm.to_markdown(doc, pages=list(page_indices), page_chunks=True)
+    # Parçalar istenen sayfa sırasıyla döner
+    return [(page_index + 1, chunk["text"]) for page_index, chunk in zip(page_indices, chunks)]
+
+
+def to_markdown_pages(file_path, page_indices, workers=1, pages_per_chunk=25):
+    """Verilen (0 tabanlı) sayfaları dönüştürür; (sayfa numarası, markdown) listesi döndürür."""
+    page_indices = sorted(page_indices)
+    if not page_indices:
+        return []
+    if workers <= 1 or len(page_indices) <= pages_per_chunk:
+        return _convert_pages(file_path, page_indices)
+
+    groups = [
+        page_indices[i:i + pages_per_chunk]
+        for i in range(0, len(page_indices), pages_per_chunk)
+    ]
+    results = []
+    # Streamlit sunucusu çok iş parçacıklı olduğundan fork yerine spawn
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(groups)), mp_context=spawn_context()
+    ) as executor:
+        for converted in executor.map(_convert_pages, [file_path] * len(groups), groups):
+            results.extend(converted)
+    return results
+
+
+def markdown_pages(file_path, first_page=1, last_page=None, workers=1, cache=result_cache):
+    """Sayfa aralığının Markdown çıktısını döndürür; önbellekteki sayfaları yeniden dönüştürmez."""
+    with fitz.open(file_path) as doc:
+        page_count = doc.page_count
+    last_page = page_count if last_page is None else min(last_page, page_count)
+
+    def compute(missing):
+        return to_markdown_pages(file_path, [page_num - 1 for page_num in missing], workers)
+
+    return pagecache.cached_pages(
+        file_path, "pymupdf4llm", "markdown",
+        pagecache.page_numbers(first_page, last_page), compute, default="", cache=cache,
+    )
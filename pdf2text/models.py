@@ -0,0 +1,282 @@
+"""OCR/ML modelleri için süreç genelinde paylaşılan kayıt defteri.
+
+Her motor (motor + dil + ayar) anahtarıyla bir kez yüklenir ve tüm
+Streamlit oturumları tarafından paylaşılır. Bellek bütçesi aşıldığında en
+uzun süredir kullanılmayan modeller bellekten atılır.
+"""
+import gc
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from pdf2text import tracing
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+DONUT_CHECKPOINT = "naver-clova-ix/donut-base-finetuned-docvqa"
+LAYOUTPARSER_CONFIG = "lp/PubLayNet/faster_rcnn_R_50_FPN_3x"
+# Çıkarım iş parçacığı sayısı istek başına değil, model yüklenirken bir kez ayarlanır
+OCR_THREADS = int(os.environ.get("PDF2TEXT_OCR_THREADS", 0) or 0) or None
+
+
+def _load_paddleocr(lang, use_angle_cls=True, replica=0, **options):
+    # `replica` yalnızca anahtarı ayırır: `ReplicaPool` aynı ayarla ayrı örnekler açar
+    from paddleocr import PaddleOCR
+    if OCR_THREADS:
+        options.setdefault("cpu_threads", OCR_THREADS)
+    return PaddleOCR(use_angle_cls=use_angle_cls, lang=lang, **options)
+
+
+def _load_img2table(lang):
+    from img2table.ocr import PaddleOCR as Img2TablePaddleOCR
+    return Img2TablePaddleOCR(lang=lang)
+
+
+def _load_donut(lang, checkpoint=DONUT_CHECKPOINT):
+    from transformers import DonutProcessor, VisionEncoderDecoderModel
+    import torch
+
+    if OCR_THREADS:
+        torch.set_num_threads(OCR_THREADS)
+    processor = DonutProcessor.from_pretrained(checkpoint)
+    model = VisionEncoderDecoderModel.from_pretrained(checkpoint)
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    model.to(device)
+    model.eval()
+    return processor, model, device
+
+
+def _load_layoutparser(lang, config_path=LAYOUTPARSER_CONFIG):
+    import layoutparser as lp
+    return lp.AutoLayoutModel(config_path)
+
+
+# Motor adı -> (yükleyici, tahmini bellek kullanımı MB)
+LOADERS = {
+    "paddleocr": (_load_paddleocr, 300),
+    "img2table": (_load_img2table, 300),
+    "donut": (_load_donut, 900),
+    "layoutparser": (_load_layoutparser, 500),
+}
+
+
+def _rss_mb():
+    if not PSUTIL_AVAILABLE:
+        return None
+    return psutil.Process(os.getpid()).memory_info().rss / (1024 * 1024)
+
+
+def _make_key(engine, lang, config):
+    return (engine, lang, tuple(sorted(config.items())))
+
+
+class ModelRegistry:
+    """Yüklenen modelleri anahtar bazında saklar ve bellek bütçesini uygular."""
+
+    def __init__(self, memory_budget_mb=None, idle_ttl=None):
+        self.memory_budget_mb = memory_budget_mb
+        self.idle_ttl = idle_ttl
+        self._entries = {}
+        self._key_locks = {}
+        self._lock = threading.RLock()
+
+    def get(self, engine, lang="en", **config):
+        """Modeli döndürür; gerekirse yükler."""
+        if engine not in LOADERS:
+            raise KeyError(f"Bilinmeyen motor: {engine}")
+        self.evict_idle()
+        key = _make_key(engine, lang, config)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry["last_used"] = time.monotonic()
+                entry["hits"] += 1
+                return entry["model"]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Aynı modelin iki oturum tarafından paralel yüklenmesini engelle
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry["last_used"] = time.monotonic()
+                    entry["hits"] += 1
+                    return entry["model"]
+
+            loader, estimated_mb = LOADERS[engine]
+            rss_before = _rss_mb()
+            started = time.perf_counter()
+            with tracing.span(f"model.load.{engine}"):
+                model = loader(lang, **config)
+            load_seconds = time.perf_counter() - started
+            rss_after = _rss_mb()
+
+            size_mb = estimated_mb
+            if rss_before is not None and rss_after is not None:
+                size_mb = max(rss_after - rss_before, 1.0)
+
+            with self._lock:
+                self._entries[key] = {
+                    "model": model,
+                    "size_mb": size_mb,
+                    "load_seconds": load_seconds,
+                    "last_used": time.monotonic(),
+                    "hits": 0,
+                }
+                self._enforce_budget(keep=key)
+            return model
+
+    def warm_up(self, engines, lang="en"):
+        """Verilen motorları önceden yükler; yüklenemeyenleri atlar."""
+        loaded = []
+        for engine in engines:
+            try:
+                self.get(engine, lang=lang)
+                loaded.append(engine)
+            except Exception:
+                continue
+        return loaded
+
+    def evict(self, engine=None):
+        """Belirtilen motorun (veya tüm motorların) modellerini bırakır."""
+        with self._lock:
+            keys = [k for k in self._entries if engine is None or k[0] == engine]
+            for key in keys:
+                del self._entries[key]
+        if keys:
+            gc.collect()
+        return len(keys)
+
+    def evict_idle(self):
+        """`idle_ttl` saniyeden uzun süredir kullanılmayan modelleri bırakır."""
+        if not self.idle_ttl:
+            return 0
+        now = time.monotonic()
+        with self._lock:
+            keys = [
+                k for k, e in self._entries.items()
+                if now - e["last_used"] > self.idle_ttl
+            ]
+            for key in keys:
+                del self._entries[key]
+        if keys:
+            gc.collect()
+        return len(keys)
+
+    def _enforce_budget(self, keep=None):
+        if not self.memory_budget_mb:
+            return
+        # En uzun süredir kullanılmayandan başlayarak bütçeye inene kadar at
+        by_age = sorted(self._entries.items(), key=lambda kv: kv[1]["last_used"])
+        total = sum(e["size_mb"] for e in self._entries.values())
+        evicted = False
+        for key, entry in by_age:
+            if total <= self.memory_budget_mb:
+                break
+            if key == keep:
+                continue
+            total -= entry["size_mb"]
+            del self._entries[key]
+            evicted = True
+        if evicted:
+            gc.collect()
+
+    def stats(self):
+        """Yüklü modellerin özetini döndürür."""
+        with self._lock:
+            return [
+                {
+                    "engine": key[0],
+                    "lang": key[1],
+                    "config": dict(key[2]),
+                    "size_mb": round(entry["size_mb"], 1),
+                    "load_seconds": round(entry["load_seconds"], 2),
+                    "hits": entry["hits"],
+                }
+                for key, entry in self._entries.items()
+            ]
+
+
+def _env_float(name):
+    value = os.environ.get(name)
+    return float(value) if value else None
+
+
+registry = ModelRegistry(
+    memory_budget_mb=_env_float("PDF2TEXT_MODEL_BUDGET_MB"),
+    idle_ttl=_env_float("PDF2TEXT_MODEL_IDLE_TTL"),
+)
+
+
+class ReplicaPool:
+    """Aynı modelin birden çok örneğini süreç genelinde ödünç verir.
+
+    Paralel iş parçacıkları aynı tahminciyi paylaşmasın diye her `lease`
+    boştaki bir örneği alır, yoksa yeni bir örnek numarası açar; örnek iş
+    bitince havuza geri döner. Örnekler `registry` üzerinden yüklendiği için
+    bellek bütçesi ve boşta kalma süresi bunlara da uygulanır.
+    """
+
+    def __init__(self, registry):
+        self.registry = registry
+        self._free = {}
+        self._created = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def lease(self, engine, lang="en", **config):
+        key = _make_key(engine, lang, config)
+        with self._lock:
+            free = self._free.setdefault(key, [])
+            if free:
+                replica = free.pop()
+            else:
+                replica = self._created.get(key, 0)
+                self._created[key] = replica + 1
+        # İlk örnek, havuz dışında `registry.get` ile alınan modelle aynıdır
+        if replica:
+            config = dict(config, replica=replica)
+        try:
+            yield self.registry.get(engine, lang=lang, **config)
+        finally:
+            with self._lock:
+                self._free[key].append(replica)
+
+
+replicas = ReplicaPool(registry)
+
+WARMUP_ENGINES = [
+    e.strip() for e in os.environ.get("PDF2TEXT_WARMUP", "").split(",") if e.strip()
+]
+
+_warm_up_started = False
+
+
+def start_warm_up():
+    """PDF2TEXT_WARMUP içindeki motorları arka planda bir kez yükler."""
+    global _warm_up_started
+    if _warm_up_started or not WARMUP_ENGINES:
+        return
+    _warm_up_started = True
+    threading.Thread(target=registry.warm_up, args=(WARMUP_ENGINES,), daemon=True).start()
+
+
+def init_worker(worker_count=1):
+    """İş işçisi başlarken çağrılır: bütçeyi işçilere böler ve ön yüklemeyi başlatır.
+
+    Çıkarım yalnızca işçilerde yapıldığından modeller de orada yüklenir.
+    """
+    if registry.memory_budget_mb:
+        registry.memory_budget_mb /= max(worker_count, 1)
+    start_warm_up()
+
+
+def worker_report():
+    """İşçideki yüklü modellerin özeti; iş yöneticisine iletilir."""
+    return registry.stats()
@@ -0,0 +1,258 @@
+"""Birden çok görüntü üzerinde toplu OCR çıkarımı.
+
+PaddleOCR için tespit her görüntüde ayrı çalışır; bulunan tüm metin
+bölgeleri görüntüler arasında birleştirilip tanıma modeline `batch_size`
+büyüklüğünde gruplar halinde verilir. Donut için görüntüler tek bir
+`pixel_values` tensöründe toplanıp `model.generate` tek seferde çağrılır.
+Büyük sayfa görüntüleri için örtüşen döşemelerde paralel OCR da sunulur.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from pdf2text import tracing
+from pdf2text.models import registry, replicas
+
+
+def _as_rgb_array(image):
+    if hasattr(image, "convert"):
+        image = image.convert("RGB")
+    return np.asarray(image)
+
+
+def to_bgr(image):
+    """Görüntüyü PaddleOCR'ın beklediği 3 kanallı, bitişik BGR diziye çevirir.
+
+    PIL görüntüleri ve `raster` çıktıları RGB'dir; tüm PaddleOCR çağrıları
+    girdisini buradan geçirmelidir.
+    """
+    array = _as_rgb_array(image)
+    if array.ndim == 2:
+        array = np.stack([array] * 3, axis=-1)
+    return np.ascontiguousarray(array[:, :, 2::-1])
+
+
+def batched(items, batch_size):
+    batch_size = max(int(batch_size), 1)
+    for start in range(0, len(items), batch_size):
+        yield start, items[start:start + batch_size]
+
+
+def run_in_batches(batch_fn, images, batch_size, **options):
+    """Görüntüleri gruplar halinde işler; (başlangıç, sonuçlar, süre) üretir."""
+    for start, batch in batched(images, batch_size):
+        started = time.perf_counter()
+        results = batch_fn(batch, batch_size=batch_size, **options)
+        yield start, results, time.perf_counter() - started
+
+
+def paddleocr_batch(images, batch_size=8, lang="en"):
+    """Görüntü başına `ocr.ocr` ile aynı biçimde [[kutu, (metin, güven)], ...] döndürür.
+
+    Tek bir PaddleOCR örneği yüklenir; tanıma grup boyutu çağrı başına
+    havuzdan ödünç alınan örnek üzerinde ayarlanır.
+    """
+    with replicas.lease("paddleocr", lang=lang) as ocr:
+        return _paddleocr_batch(ocr, images, batch_size)
+
+
+def _paddleocr_batch(ocr, images, batch_size):
+    arrays = [to_bgr(image) for image in images]
+
+    try:
+        from paddleocr.tools.infer.predict_system import sorted_boxes
+        from paddleocr.tools.infer.utility import get_rotate_crop_image
+        detector = ocr.text_detector
+        recognizer = ocr.text_recognizer
+    except (ImportError, AttributeError):
+        # Dahili tespit/tanıma bileşenlerine erişilemeyen sürümlerde görüntü başına çalış
+        with tracing.span("paddleocr.ocr", pages=len(arrays)):
+            return [(ocr.ocr(array) or [None])[0] or [] for array in arrays]
+
+    crops = []
+    owners = []
+    with tracing.span("paddleocr.detect", pages=len(arrays)):
+        for image_index, bgr in enumerate(arrays):
+            dt_boxes, _ = detector(bgr)
+            if dt_boxes is None:
+                continue
+            for box in sorted_boxes(dt_boxes):
+                crops.append(get_rotate_crop_image(bgr, np.copy(box).astype(np.float32)))
+                owners.append((image_index, box))
+
+    if crops and getattr(ocr, "use_angle_cls", False) and getattr(ocr, "text_classifier", None):
+        with tracing.span("paddleocr.classify"):
+            crops, _, _ = ocr.text_classifier(crops)
+
+    results = [[] for _ in arrays]
+    if not crops:
+        return results
+    recognizer.rec_batch_num = max(int(batch_size), 1)
+    with tracing.span("paddleocr.recognize", pages=len(arrays)):
+        recognized, _ = recognizer(crops)
+    drop_score = getattr(ocr, "drop_score", 0.5)
+    for (image_index, box), (text, confidence) in zip(owners, recognized):
+        if confidence >= drop_score:
+            results[image_index].append([box.tolist(), (text, confidence)])
+    return results
+
+
+def donut_batch(images, batch_size=4, max_length=512):
+    """Görüntüleri tek bir `generate` çağrısında işler; görüntü başına JSON döndürür."""
+    import torch
+
+    processor, model, device = registry.get("donut")
+
+    images = [image.convert("RGB") if hasattr(image, "convert") else image for image in images]
+    with tracing.span("donut.preprocess", pages=len(images)):
+        pixel_values = processor(images, return_tensors="pt").pixel_values.to(device)
+    with tracing.span("donut.generate", pages=len(images)), torch.no_grad():
+        generated_ids = model.generate(
+            pixel_values,
+            max_length=max_length,
+            early_stopping=True,
+            pad_token_id=processor.tokenizer.pad_token_id,
+            eos_token_id=processor.tokenizer.eos_token_id,
+            use_cache=True,
+            num_beams=1,
+            bad_words_ids=[[processor.tokenizer.unk_token_id]],
+            return_dict_in_generate=True,
+        )
+    return [
+        processor.token2json(sequence)
+        for sequence in processor.batch_decode(generated_ids.sequences)
+    ]
+
+
+def tile_grid(height, width, tile_size=1600, overlap=200):
+    """Görüntüyü örtüşen döşemelere böler; (x0, y0, x1, y1) listesi döndürür."""
+    overlap = min(overlap, tile_size // 2)
+    step = tile_size - overlap
+
+    def starts(length):
+        if length <= tile_size:
+            return [0]
+        positions = list(range(0, length - tile_size, step))
+        # Son döşeme kenara hizalanır, böylece her döşeme tam boyutta kalır
+        return positions + [length - tile_size]
+
+    return [
+        (x0, y0, min(x0 + tile_size, width), min(y0 + tile_size, height))
+        for y0 in starts(height)
+        for x0 in starts(width)
+    ]
+
+
+def _bounds(box):
+    xs = [point[0] for point in box]
+    ys = [point[1] for point in box]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _area(bounds):
+    return (bounds[2] - bounds[0]) * (bounds[3] - bounds[1])
+
+
+def _overlap_ratio(a, b):
+    """Kesişim alanının küçük kutunun alanına oranı."""
+    width = min(a[2], b[2]) - max(a[0], b[0])
+    height = min(a[3], b[3]) - max(a[1], b[1])
+    if width <= 0 or height <= 0:
+        return 0.0
+    smaller = min(_area(a), _area(b))
+    return width * height / smaller if smaller > 0 else 0.0
+
+
+def overlap_bands(tiles):
+    """Döşemelerin ikişer ikişer kesişim dikdörtgenlerini döndürür."""
+    bands = []
+    for i, a in enumerate(tiles):
+        for b in tiles[i + 1:]:
+            band = (max(a[0], b[0]), max(a[1], b[1]), min(a[2], b[2]), min(a[3], b[3]))
+            if band[0] < band[2] and band[1] < band[3]:
+                bands.append(band)
+    return bands
+
+
+def dedupe_lines(lines, threshold=0.6, bands=None):
+    """Örtüşme bölgelerinde tekrarlanan satırları ayıklar.
+
+    Döşeme kenarında kesilen satırlar komşu döşemede tam olarak bulunur;
+    kutuları büyük ölçüde örtüşen satırlardan kenara değmeyen, daha büyük ve
+    güveni yüksek olan tutulur. `bands` verilirse yalnızca aynı örtüşme
+    bandına giren satırlar karşılaştırılır; hiçbir banda girmeyen satırlar
+    doğrudan tutulur. Sonuç yukarıdan aşağıya, soldan sağa sıralanır.
+    """
+    bounds = [_bounds(line[0]) for line, _ in lines]
+    ranked = sorted(
+        range(len(lines)),
+        key=lambda i: (lines[i][1], _area(bounds[i]), lines[i][0][1][1]),
+        reverse=True,
+    )
+
+    def touched(b):
+        if bands is None:
+            return [0]
+        return [
+            band_index for band_index, band in enumerate(bands)
+            if b[0] < band[2] and band[0] < b[2] and b[1] < band[3] and band[1] < b[3]
+        ]
+
+    kept = []
+    kept_in_band = {}
+    for i in ranked:
+        band_indices = touched(bounds[i])
+        if all(
+            _overlap_ratio(bounds[i], bounds[j]) < threshold
+            for band_index in band_indices
+            for j in kept_in_band.get(band_index, ())
+        ):
+            kept.append(i)
+            for band_index in band_indices:
+                kept_in_band.setdefault(band_index, []).append(i)
+    kept.sort(key=lambda i: (round(bounds[i][1] / 10), bounds[i][0]))
+    return [lines[i][0] for i in kept]
+
+
+def paddleocr_tiled(image, tile_size=1600, overlap=200, workers=2, lang="en", edge_margin=2):
+    """Büyük görüntüyü örtüşen döşemelerde paralel OCR'lar.
+
+    Her döşeme süreç genelindeki havuzdan ödünç alınan, o an başka bir
+    çağrının kullanmadığı bir PaddleOCR örneğiyle işlenir. Kutular asıl görüntü
+    koordinatlarına taşınır ve örtüşme bölgelerindeki tekrarlar ayıklanır.
+    Çıktı `ocr.ocr` ile aynı [[kutu, (metin, güven)], ...] biçimindedir.
+    """
+    array = to_bgr(image)
+    height, width = array.shape[:2]
+    tiles = tile_grid(height, width, tile_size, overlap)
+    workers = max(1, min(int(workers), len(tiles)))
+
+    def recognize(tile):
+        x0, y0, x1, y1 = tile
+        with tracing.span("paddleocr.tile", pages=0), replicas.lease("paddleocr", lang=lang) as ocr:
+            result = ocr.ocr(np.ascontiguousarray(array[y0:y1, x0:x1]))
+        lines = []
+        for box, recognized in (result or [None])[0] or []:
+            shifted = [[point[0] + x0, point[1] + y0] for point in box]
+            bx0, by0, bx1, by1 = _bounds(shifted)
+            # Görüntü kenarı olmayan döşeme kenarına değen satır kesilmiş olabilir
+            clipped = (
+                (x0 > 0 and bx0 - x0 <= edge_margin)
+                or (y0 > 0 and by0 - y0 <= edge_margin)
+                or (x1 < width and x1 - bx1 <= edge_margin)
+                or (y1 < height and y1 - by1 <= edge_margin)
+            )
+            lines.append(([shifted, tuple(recognized)], not clipped))
+        return lines
+
+    with tracing.span("paddleocr.tiled", pages=1):
+        if workers == 1:
+            tile_lines = [recognize(tile) for tile in tiles]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                tile_lines = list(executor.map(recognize, tiles))
+    with tracing.span("paddleocr.dedupe"):
+        return dedupe_lines(
+            [line for lines in tile_lines for line in lines], bands=overlap_bands(tiles)
+        )
@@ -0,0 +1,202 @@
+"""OCR motorları için sütunlu, yapılandırılmış sonuç tipi.
+
+PaddleOCR satırları ve LayoutParser yerleşim blokları aynı `OcrResult`
+tipine dönüştürülür: kutular (N, 4) dizisi, metinler, güven değerleri,
+sayfa numaraları ve etiketler ayrı sütunlarda tutulur. Sonuçlar metne
+çevrilip yeniden ayrıştırılmadan güvene göre süzülebilir, okuma sırasına
+göre metne dönüştürülebilir, sayfa görüntüsü üzerine çizilebilir ve dışa
+aktarılabilir.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+COLUMNS = ["page", "x0", "y0", "x1", "y1", "text", "confidence", "label"]
+
+
+@dataclass
+class OcrResult:
+    source: str
+    # (N, 4) float32: x0, y0, x1, y1 (görüntü pikseli)
+    boxes: np.ndarray
+    texts: np.ndarray
+    confidences: np.ndarray
+    pages: np.ndarray
+    labels: np.ndarray
+
+    def __len__(self):
+        return len(self.texts)
+
+    def _take(self, index):
+        return OcrResult(
+            self.source,
+            self.boxes[index],
+            self.texts[index],
+            self.confidences[index],
+            self.pages[index],
+            self.labels[index],
+        )
+
+    def filter(self, min_confidence=0.0, pages=None, labels=None):
+        """Güven eşiği, sayfa ve etikete göre süzülmüş yeni bir sonuç döndürür."""
+        mask = self.confidences >= min_confidence
+        if pages is not None:
+            mask &= np.isin(self.pages, list(pages))
+        if labels is not None:
+            mask &= np.isin(self.labels, list(labels))
+        return self._take(mask)
+
+    def on_page(self, page):
+        """Tüm öğeleri verilen sayfaya atanmış bir kopya döndürür."""
+        return OcrResult(
+            self.source,
+            self.boxes,
+            self.texts,
+            self.confidences,
+            np.full(len(self), page, dtype=np.int32),
+            self.labels,
+        )
+
+    def lines(self, line_tolerance=0.5):
+        """Okuma sırasıyla (sayfa, satırdaki öğe indisleri) listesi döndürür.
+
+        Dikey merkezleri arasındaki fark ortanca kutu yüksekliğinin
+        `line_tolerance` katını aşmayan öğeler aynı satırda sayılır; satır
+        içinde öğeler soldan sağa sıralanır.
+        """
+        if not len(self):
+            return []
+        centers = (self.boxes[:, 1] + self.boxes[:, 3]) / 2
+        heights = self.boxes[:, 3] - self.boxes[:, 1]
+        result = []
+        for page in np.unique(self.pages):
+            index = np.flatnonzero(self.pages == page)
+            index = index[np.argsort(centers[index], kind="stable")]
+            tolerance = max(float(np.median(heights[index])) * line_tolerance, 1.0)
+            line_ids = np.concatenate([[0], np.cumsum(np.diff(centers[index]) > tolerance)])
+            order = np.lexsort((self.boxes[index, 0], line_ids))
+            index, line_ids = index[order], line_ids[order]
+            for line_id in np.unique(line_ids):
+                result.append((int(page), index[line_ids == line_id]))
+        return result
+
+    def to_text(self, line_tolerance=0.5):
+        """Metni okuma sırasıyla birleştirir; sayfalar boş satırla ayrılır."""
+        pages = {}
+        for page, index in self.lines(line_tolerance):
+            line = " ".join(text for text in self.texts[index] if text)
+            if line:
+                pages.setdefault(page, []).append(line)
+        return "\n\n".join("\n".join(lines) for _, lines in sorted(pages.items()))
+
+    def overlay(self, image, page=None, min_confidence=0.0, width=2):
+        """Kutuları görüntünün bir kopyası üzerine çizer; PIL görüntüsü döndürür."""
+        from PIL import Image, ImageDraw
+
+        if not hasattr(image, "convert"):
+            image = Image.fromarray(np.asarray(image))
+        canvas = image.convert("RGB")
+        draw = ImageDraw.Draw(canvas)
+        selected = self.filter(min_confidence, None if page is None else [page])
+        for (x0, y0, x1, y1), confidence, label in zip(
+            selected.boxes, selected.confidences, selected.labels
+        ):
+            # Düşük güvenli kutular kırmızıya, yüksek güvenliler yeşile yaklaşır
+            level = float(np.clip(confidence, 0.0, 1.0))
+            color = (int(255 * (1 - level)), int(180 * level), 0)
+            draw.rectangle([float(x0), float(y0), float(x1), float(y1)], outline=color, width=width)
+            if label:
+                draw.text((float(x0) + 2, float(y0) + 2), str(label), fill=color)
+        return canvas
+
+    def to_dict(self):
+        """Sütunlu, JSON'a yazılabilir bir sözlük döndürür."""
+        return {
+            "source": self.source,
+            "page": self.pages.tolist(),
+            "box": np.round(self.boxes, 1).tolist(),
+            "text": self.texts.tolist(),
+            "confidence": np.round(self.confidences, 4).tolist(),
+            "label": self.labels.tolist(),
+        }
+
+    def to_dataframe(self):
+        return pd.DataFrame(
+            {
+                "page": self.pages,
+                "x0": self.boxes[:, 0],
+                "y0": self.boxes[:, 1],
+                "x1": self.boxes[:, 2],
+                "y1": self.boxes[:, 3],
+                "text": self.texts,
+                "confidence": self.confidences,
+                "label": self.labels,
+            },
+            columns=COLUMNS,
+        )
+
+
+def _build(source, boxes, texts, confidences, page, labels=None):
+    count = len(texts)
+    return OcrResult(
+        source,
+        np.asarray(boxes, dtype=np.float32).reshape(count, 4),
+        np.asarray(texts, dtype=object).reshape(count),
+        np.asarray(confidences, dtype=np.float32).reshape(count),
+        np.full(count, page, dtype=np.int32),
+        np.asarray(labels if labels is not None else [""] * count, dtype=object).reshape(count),
+    )
+
+
+def empty(source):
+    return _build(source, [], [], [], 1)
+
+
+def from_paddleocr(lines, page=1, source="paddleocr"):
+    """PaddleOCR [[dörtgen, (metin, güven)], ...] satırlarını dönüştürür."""
+    lines = [line for line in lines or [] if line]
+    boxes = [
+        (
+            min(point[0] for point in line[0]),
+            min(point[1] for point in line[0]),
+            max(point[0] for point in line[0]),
+            max(point[1] for point in line[0]),
+        )
+        for line in lines
+    ]
+    return _build(
+        source,
+        boxes,
+        [line[1][0] for line in lines],
+        [line[1][1] for line in lines],
+        page,
+    )
+
+
+def from_layoutparser(layout, page=1):
+    """LayoutParser blok listesini dönüştürür; blok türü etiket olarak saklanır."""
+    blocks = list(layout)
+    return _build(
+        "layoutparser",
+        [block.block.coordinates for block in blocks],
+        [getattr(block, "text", None) or "" for block in blocks],
+        [block.score if block.score is not None else 1.0 for block in blocks],
+        page,
+        [str(block.type) if block.type is not None else "" for block in blocks],
+    )
+
+
+def concat(results, source=None):
+    """Birden çok sonucu tek bir sütunlu sonuçta birleştirir."""
+    results = [result for result in results if result is not None]
+    if not results:
+        return empty(source or "ocr")
+    return OcrResult(
+        source or results[0].source,
+        np.concatenate([result.boxes for result in results]),
+        np.concatenate([result.texts for result in results]),
+        np.concatenate([result.confidences for result in results]),
+        np.concatenate([result.pages for result in results]),
+        np.concatenate([result.labels for result in results]),
+    )
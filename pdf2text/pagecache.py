@@ -0,0 +1,64 @@
+"""Sayfa bazında artımlı çıkarma önbelleği.
+
+Her sayfanın sonucu dosya özeti, motor, mod, parametreler ve sayfa
+numarasıyla ayrı ayrı saklanır. Sayfa aralığı genişletildiğinde yalnızca
+önbellekte olmayan sayfalar hesaplanır; örneğin 1-50 aralığından sonra 1-100
+istendiğinde yalnızca 51-100 işlenir.
+"""
+from pdf2text.cache import file_sha256, make_key, result_cache
+
+
+def page_key(file_hash, backend, mode, page_num, params=None):
+    return make_key(file_hash, backend, mode + "_page", dict(params or {}, page=page_num))
+
+
+def page_numbers(first_page, last_page):
+    return list(range(first_page, last_page + 1))
+
+
+def lookup(file_path, backend, mode, pages, params=None, cache=result_cache):
+    """Önbellekteki sayfaları ve eksik sayfa numaralarını döndürür."""
+    file_hash = file_sha256(file_path)
+    missing_value = object()
+    found = {}
+    missing = []
+    for page_num in pages:
+        value = cache.get(page_key(file_hash, backend, mode, page_num, params), missing_value)
+        if value is missing_value:
+            missing.append(page_num)
+        else:
+            found[page_num] = value
+    return found, missing
+
+
+def iter_pages(file_path, backend, mode, pages, compute, params=None, default=None, cache=result_cache):
+    """Sayfaları sırayla (sayfa numarası, sonuç) olarak üretir.
+
+    `compute(eksik_sayfalar)` eksik sayfalar için artan sırada (sayfa
+    numarası, sonuç) çiftleri üretmelidir; sonuç döndürmediği sayfalar
+    `default` ile saklanır. Hesaplanan her sayfa üretildiği anda önbelleğe
+    yazılır, böylece yarıda kalan bir çıkarma tamamlanan sayfaları kaybetmez.
+    """
+    pages = sorted(set(pages))
+    file_hash = file_sha256(file_path)
+    found, missing = lookup(file_path, backend, mode, pages, params, cache)
+    computed = iter(compute(missing)) if missing else iter(())
+    pending = None
+    for page_num in pages:
+        if page_num in found:
+            yield page_num, found[page_num]
+            continue
+        if pending is None:
+            pending = next(computed, (None, None))
+        if pending[0] == page_num:
+            value = pending[1]
+            pending = None
+        else:
+            value = default
+        cache.put(page_key(file_hash, backend, mode, page_num, params), value)
+        yield page_num, value
+
+
+def cached_pages(file_path, backend, mode, pages, compute, params=None, default=None, cache=result_cache):
+    """`iter_pages` sonucunu liste olarak döndürür."""
+    return list(iter_pages(file_path, backend, mode, pages, compute, params, default, cache))
@@ -0,0 +1,67 @@
+"""Sayfaları `page.get_pixmap` ile NumPy dizisine dönüştüren rasterleştirme aşaması.
+
+Taranmış sayfalar veya vektörel çizimler gömülü görüntü içermediği için
+OCR'a ancak bu aşamayla ulaşır. Piksel tamponu PNG kodlaması yapılmadan
+doğrudan (yükseklik, genişlik, kanal) biçiminde bir diziye kopyalanır.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import fitz
+import numpy as np
+
+DEFAULT_DPI = 150
+
+
+def pixmap_to_array(pix):
+    """Pixmap örneklerini tek kopyayla yazılabilir bir uint8 diziye çevirir."""
+    return np.frombuffer(bytearray(pix.samples_mv), dtype=np.uint8).reshape(
+        pix.height, pix.width, pix.n
+    )
+
+
+def render_page(page, dpi=DEFAULT_DPI, grayscale=False):
+    colorspace = fitz.csGRAY if grayscale else fitz.csRGB
+    pix = page.get_pixmap(dpi=dpi, colorspace=colorspace, alpha=False)
+    array = pixmap_to_array(pix)
+    return array[:, :, 0] if grayscale else array
+
+
+def render_pages(file_path, page_indices=None, dpi=DEFAULT_DPI, grayscale=False):
+    """Sayfaları sırayla (sayfa numarası, dizi) olarak üretir."""
+    with fitz.open(file_path) as doc:
+        if page_indices is None:
+            page_indices = range(doc.page_count)
+        for page_index in page_indices:
+            yield page_index + 1, render_page(doc[page_index], dpi, grayscale)
+
+
+def ocr_pages(
+    file_path,
+    ocr_fn,
+    page_indices=None,
+    dpi=DEFAULT_DPI,
+    workers=2,
+    grayscale=False,
+):
+    """Sayfaları sırayla render edip OCR'ı sınırlı bir iş parçacığı havuzunda çalıştırır.
+
+    MuPDF iş parçacığı güvenli olmadığından belge yalnızca çağıran iş
+    parçacığında açılır ve render edilir; havuza yalnızca `ocr_fn` gönderilir.
+    Aynı anda en fazla `workers * 2` sayfa bellekte tutulur; sonuçlar sayfa
+    sırasıyla (sayfa numarası, OCR sonucu) olarak üretilir.
+    """
+    max_in_flight = max(workers, 1) * 2
+    with fitz.open(file_path) as doc, ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        if page_indices is None:
+            page_indices = range(doc.page_count)
+        page_indices = list(page_indices)
+        pending = []
+        next_index = 0
+        while next_index < len(page_indices) or pending:
+            while next_index < len(page_indices) and len(pending) < max_in_flight:
+                page_index = page_indices[next_index]
+                image = render_page(doc[page_index], dpi, grayscale)
+                pending.append((page_index + 1, executor.submit(ocr_fn, image)))
+                next_index += 1
+            page_num, future = pending.pop(0)
+            yield page_num, future.result()
@@ -0,0 +1,100 @@
+"""Sayfa bazında metin katmanı tespiti ve doğrudan çıkarma / OCR yönlendirmesi.
+
+Her sayfa PyMuPDF ile ucuz ölçümlerle (karakter sayısı, görüntü kaplama
+oranı, font varlığı) sınıflandırılır; yalnızca metin katmanı olmayan
+sayfalar OCR'a gönderilir.
+"""
+import fitz
+
+from pdf2text import raster
+
+ROUTE_TEXT = "text"
+ROUTE_OCR = "ocr"
+
+MIN_TEXT_CHARS = 50
+MAX_IMAGE_COVERAGE = 0.5
+# Taranmış sayfadaki kaşe, Bates numarası gibi kısa metin katmanları bu sınırın altında kalır
+MIN_SCAN_TEXT_CHARS = 200
+
+
+def image_coverage(page):
+    """Görüntülerin kapladığı sayfa alanı oranını (en fazla 1.0) döndürür."""
+    page_rect = page.rect
+    page_area = page_rect.width * page_rect.height
+    if page_area <= 0:
+        return 0.0
+    covered = 0.0
+    for info in page.get_image_info():
+        rect = fitz.Rect(info["bbox"]) & page_rect
+        if not rect.is_empty:
+            covered += rect.width * rect.height
+    return min(covered / page_area, 1.0)
+
+
+def classify_page(
+    page,
+    min_chars=MIN_TEXT_CHARS,
+    max_image_coverage=MAX_IMAGE_COVERAGE,
+    min_scan_chars=MIN_SCAN_TEXT_CHARS,
+):
+    """Sayfanın ölçümlerini ve yönlendirme kararını döndürür.
+
+    Görüntü kaplama oranı karakter sayısından önce denetlenir: sayfanın
+    çoğunu kaplayan bir taramanın üzerindeki kısa metin katmanı (kaşe,
+    Bates satırı) sayfayı doğrudan çıkarmaya yönlendirmez.
+    """
+    text = page.get_text()
+    chars = len("".join(text.split()))
+    fonts = len(page.get_fonts())
+    coverage = image_coverage(page)
+
+    if coverage >= max_image_coverage and chars < min_scan_chars:
+        route, reason = ROUTE_OCR, "page is mostly image, text layer is only an overlay"
+    elif chars >= min_chars and fonts:
+        route, reason = ROUTE_TEXT, "text layer present"
+    elif chars and fonts and coverage < max_image_coverage:
+        route, reason = ROUTE_TEXT, "short text, no large images"
+    elif coverage >= max_image_coverage:
+        route, reason = ROUTE_OCR, "page is mostly image"
+    else:
+        route, reason = ROUTE_OCR, "no usable text layer"
+
+    return {
+        "page": page.number + 1,
+        "route": route,
+        "reason": reason,
+        "chars": chars,
+        "fonts": fonts,
+        "image_coverage": round(coverage, 3),
+        "text": text,
+    }
+
+
+def classify_document(file_path, **thresholds):
+    with fitz.open(file_path) as doc:
+        return [classify_page(page, **thresholds) for page in doc]
+
+
+def route_document(
+    file_path, ocr_fn, dpi=raster.DEFAULT_DPI, workers=2, decisions=None, **thresholds
+):
+    """Metin katmanı olan sayfaları doğrudan, diğerlerini OCR ile çıkarır.
+
+    Önceden hesaplanmış `decisions` verilirse belge yeniden sınıflandırılmaz.
+    Sayfa sırasıyla sınıflandırma bilgisi ve `text` alanı dolu kayıtlar döndürür.
+    """
+    if decisions is None:
+        decisions = classify_document(file_path, **thresholds)
+    else:
+        decisions = [dict(decision) for decision in decisions]
+    ocr_indices = [d["page"] - 1 for d in decisions if d["route"] == ROUTE_OCR]
+    if ocr_indices:
+        for page_num, ocr_text in raster.ocr_pages(
+            file_path, ocr_fn, ocr_indices, dpi=dpi, workers=workers
+        ):
+            # Yapılandırılmış OCR sonuçları metne çevrilir, kutular ayrı alanda saklanır
+            if hasattr(ocr_text, "to_text"):
+                decisions[page_num - 1]["ocr"] = ocr_text.on_page(page_num)
+                ocr_text = ocr_text.to_text()
+            decisions[page_num - 1]["text"] = ocr_text
+    return decisions
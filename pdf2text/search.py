@@ -0,0 +1,182 @@
+"""Belge başına kalıcı tam metin arama dizini.
+
+Dizin; her sayfanın kelimelerini ve koordinatlarını, ayrıca küçük harfe
+çevrilmiş kelime -> (sayfa, kelime sırası) ters listesini tutar. Bir kez
+oluşturulur ve yüklenen PDF'in yanına `.idx` dosyası olarak kaydedilir.
+"""
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+import fitz
+
+from pdf2text import tracing
+from pdf2text.cache import file_sha256
+
+INDEX_VERSION = 1
+SEARCH_MODES = ["substring", "exact", "prefix", "all_terms"]
+
+
+def index_path(file_path):
+    return file_path + ".idx"
+
+
+class SearchIndex:
+    def __init__(self, file_hash, pages, postings):
+        self.file_hash = file_hash
+        # pages[i] = [(kelime, x0, y0, x1, y1), ...]
+        self.pages = pages
+        self.postings = postings
+
+    @classmethod
+    @tracing.traced("search.build_index")
+    def build(cls, file_path):
+        pages = []
+        postings = {}
+        with fitz.open(file_path) as doc:
+            for page in doc:
+                words = [
+                    (word[4], word[0], word[1], word[2], word[3])
+                    for word in page.get_text("words")
+                ]
+                for word_index, word in enumerate(words):
+                    postings.setdefault(word[0].lower(), []).append(
+                        (page.number, word_index)
+                    )
+                pages.append(words)
+        return cls(file_sha256(file_path), pages, postings)
+
+    def save(self, path):
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(
+                (INDEX_VERSION, self.file_hash, self.pages, self.postings),
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, file_hash=None):
+        """Dizini yükler; sürüm veya dosya özeti uyuşmazsa None döndürür."""
+        try:
+            with open(path, "rb") as f:
+                version, stored_hash, pages, postings = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            return None
+        if version != INDEX_VERSION or (file_hash and stored_hash != file_hash):
+            return None
+        return cls(stored_hash, pages, postings)
+
+    def _matching_tokens(self, term, mode):
+        term = term.lower()
+        if mode == "prefix":
+            return [token for token in self.postings if token.startswith(term)]
+        if mode == "substring":
+            return [token for token in self.postings if term in token]
+        return [term] if term in self.postings else []
+
+    def candidate_pages(self, search_term):
+        """Alt dize aramasında eşleşme içerebilecek sayfaları döndürür."""
+        candidates = None
+        for term in search_term.split():
+            pages = {
+                page_index
+                for token in self._matching_tokens(term, "substring")
+                for page_index, _ in self.postings[token]
+            }
+            candidates = pages if candidates is None else candidates & pages
+            if not candidates:
+                return []
+        return sorted(candidates or [])
+
+    def search(self, file_path, search_term):
+        """`page.search_for` ile aynı sonucu, yalnızca aday sayfaları tarayarak döndürür."""
+        results = []
+        candidates = self.candidate_pages(search_term)
+        if not candidates:
+            return results
+        with fitz.open(file_path) as doc:
+            for page_index in candidates:
+                text_instances = doc[page_index].search_for(search_term)
+                if text_instances:
+                    results.append(
+                        {
+                            "page": page_index + 1,
+                            "occurrences": len(text_instances),
+                            "coordinates": [tuple(rect) for rect in text_instances],
+                        }
+                    )
+        return results
+
+    def search_words(self, query, mode="exact", case_sensitive=False):
+        """Yalnızca dizinden kelime araması yapar.
+
+        `exact` ve `prefix` kipleri sorgudaki kelimelerden herhangi birini,
+        `all_terms` kipi ise tüm kelimelerin geçtiği sayfaları döndürür.
+        """
+        terms = query.split()
+        word_mode = "exact" if mode == "all_terms" else mode
+        hits = {}
+        pages_per_term = []
+        for term in terms:
+            term_pages = set()
+            for token in self._matching_tokens(term, word_mode):
+                for page_index, word_index in self.postings[token]:
+                    word = self.pages[page_index][word_index]
+                    if case_sensitive:
+                        text = word[0]
+                        if word_mode == "prefix" and not text.startswith(term):
+                            continue
+                        if word_mode == "exact" and text != term:
+                            continue
+                    hits.setdefault(page_index, set()).add(word_index)
+                    term_pages.add(page_index)
+            pages_per_term.append(term_pages)
+
+        page_indices = set(hits)
+        if mode == "all_terms" and pages_per_term:
+            page_indices = set.intersection(*pages_per_term)
+
+        results = []
+        for page_index in sorted(page_indices):
+            words = [self.pages[page_index][i] for i in sorted(hits[page_index])]
+            results.append(
+                {
+                    "page": page_index + 1,
+                    "occurrences": len(words),
+                    "coordinates": [word[1:] for word in words],
+                }
+            )
+        return results
+
+
+_loaded = OrderedDict()
+_loaded_lock = threading.Lock()
+MAX_LOADED_INDEXES = 8
+
+
+def get_index(file_path):
+    """Dizini bellekten, diskten veya yeniden oluşturarak döndürür."""
+    file_hash = file_sha256(file_path)
+    with _loaded_lock:
+        if file_hash in _loaded:
+            _loaded.move_to_end(file_hash)
+            return _loaded[file_hash]
+
+    path = index_path(file_path)
+    index = SearchIndex.load(path, file_hash)
+    if index is None:
+        index = SearchIndex.build(file_path)
+        try:
+            index.save(path)
+        except OSError:
+            pass
+
+    with _loaded_lock:
+        _loaded[file_hash] = index
+        while len(_loaded) > MAX_LOADED_INDEXES:
+            _loaded.popitem(last=False)
+    return index
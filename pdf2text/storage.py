@@ -0,0 +1,192 @@
+"""Yüklenen PDF'ler için içerik adresli depolama.
+
+Her belge SHA-256 özetiyle adlandırılır ve yalnızca bir kez yazılır; aynı
+içeriğin tekrar yüklenmesi mevcut dosyayı (ve önbellekteki sonuçlarını)
+yeniden kullanır. Oturumlar belgeleri referansla tutar. Arka plandaki
+süpürücü, referanssız ve süresi dolan belgeleri siler, ardından toplam boyut
+kotayı aşıyorsa en eski referanssız belgelerden başlayarak yer açar. Eski
+UUID adlı yüklemeler ve belgesiz kalan yan dosyalar da aynı şekilde süpürülür.
+"""
+import os
+import re
+import threading
+import time
+
+from pdf2text.cache import remember_sha256
+
+DEFAULT_ROOT = os.path.join(os.path.dirname(os.path.dirname(__file__)), "pages", "docs")
+
+_STORED_NAME = re.compile(r"^[0-9a-f]{64}\.pdf$")
+# Özetle adlandırmadan önce rastgele UUID ile kaydedilmiş eski yüklemeler
+_LEGACY_NAME = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\.pdf$")
+# Belgeyle birlikte silinen yan dosyalar (ör. arama dizini)
+_SIDECAR_SUFFIXES = (".idx",)
+
+
+class DocumentStore:
+    """Özetle adlandırılmış PDF'ler, oturum referansları ve TTL/kota süpürücüsü."""
+
+    def __init__(self, root=DEFAULT_ROOT, ttl=24 * 3600, max_mb=1024, session_ttl=3600):
+        self.root = root
+        self.ttl = ttl
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.session_ttl = session_ttl
+        self._refs = {}
+        self._lock = threading.Lock()
+        self.counters = {"stored": 0, "deduplicated": 0, "swept": 0, "swept_bytes": 0}
+
+    def path_for(self, file_hash):
+        return os.path.join(self.root, file_hash + ".pdf")
+
+    def adopt(self, tmp_path, file_hash):
+        """Depo dizinindeki geçici dosyayı belge olarak yerleştirir; (yol, yeni_mi) döndürür.
+
+        Belge zaten varsa geçici dosya silinir ve mevcut belge kullanılır.
+        """
+        path = self.path_for(file_hash)
+        # Süpürücü silme kararını aynı kilit altında verir; kontrol ile utime
+        # arasında belge silinemez
+        with self._lock:
+            is_new = True
+            if os.path.exists(path):
+                try:
+                    os.utime(path)
+                    is_new = False
+                except FileNotFoundError:
+                    # Belge başka bir süreç tarafından silindiyse yenisini yerleştir
+                    pass
+            if is_new:
+                os.replace(tmp_path, path)
+            else:
+                os.remove(tmp_path)
+            self.counters["stored" if is_new else "deduplicated"] += 1
+        remember_sha256(path, file_hash)
+        return path, is_new
+
+    def acquire(self, file_hash, session_id):
+        """Oturumun belgeyi kullandığını kaydeder; her çalıştırmada yenilenir."""
+        with self._lock:
+            self._refs.setdefault(file_hash, {})[session_id] = time.time()
+
+    def release(self, file_hash, session_id):
+        with self._lock:
+            sessions = self._refs.get(file_hash, {})
+            sessions.pop(session_id, None)
+            if not sessions:
+                self._refs.pop(file_hash, None)
+
+    def _referenced(self, now):
+        # Uzun süredir yenilenmeyen referanslar kapanmış oturumlara aittir
+        with self._lock:
+            for file_hash in list(self._refs):
+                sessions = self._refs[file_hash]
+                for session_id, seen in list(sessions.items()):
+                    if now - seen > self.session_ttl:
+                        del sessions[session_id]
+                if not sessions:
+                    del self._refs[file_hash]
+            return set(self._refs)
+
+    @staticmethod
+    def _remove_file(path):
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return 0
+        return size
+
+    def _remove(self, path):
+        return sum(
+            self._remove_file(target)
+            for target in (path,) + tuple(path + suffix for suffix in _SIDECAR_SUFFIXES)
+        )
+
+    def sweep(self):
+        """Süresi dolan ve kotayı aşan referanssız belgeleri siler; silinen sayıyı döndürür."""
+        now = time.time()
+        # Süresi dolan oturum referanslarını temizler
+        self._referenced(now)
+        try:
+            names = os.listdir(self.root)
+        except OSError:
+            return 0
+
+        documents = []
+        total = 0
+        swept = 0
+        swept_bytes = 0
+        for name in names:
+            path = os.path.join(self.root, name)
+            if name.endswith(_SIDECAR_SUFFIXES):
+                # Belgesi silinmiş (veya eski adlı belgeye ait) yetim yan dosyalar
+                if not os.path.exists(os.path.splitext(path)[0]):
+                    removed = self._remove_file(path)
+                    swept_bytes += removed
+                continue
+            if not (_STORED_NAME.match(name) or _LEGACY_NAME.match(name)):
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            documents.append((stat.st_mtime, stat.st_size, path, name[:-4]))
+            total += stat.st_size
+
+        for _, size, path, file_hash in sorted(documents):
+            with self._lock:
+                # Karar, `adopt` ve `acquire` ile aynı kilit altında yeniden denetlenir
+                if file_hash in self._refs:
+                    continue
+                try:
+                    mtime = os.stat(path).st_mtime
+                except OSError:
+                    continue
+                if now - mtime <= self.ttl and total <= self.max_bytes:
+                    continue
+                removed = self._remove(path)
+            if removed:
+                total -= size
+                swept += 1
+                swept_bytes += removed
+
+        with self._lock:
+            self.counters["swept"] += swept
+            self.counters["swept_bytes"] += swept_bytes
+        return swept
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self.counters)
+            stats["referenced"] = len(self._refs)
+        return stats
+
+
+document_store = DocumentStore(
+    root=os.environ.get("PDF2TEXT_UPLOAD_DIR", DEFAULT_ROOT),
+    ttl=float(os.environ.get("PDF2TEXT_UPLOAD_TTL", 24 * 3600)),
+    max_mb=float(os.environ.get("PDF2TEXT_UPLOAD_MAX_MB", 1024)),
+)
+
+_sweeper_started = False
+
+
+def _sweep_forever(interval):
+    while True:
+        time.sleep(interval)
+        try:
+            document_store.sweep()
+        except Exception:
+            # Süpürücü hatası uygulamayı durdurmamalı; bir sonraki turda tekrar denenir
+            pass
+
+
+def start_sweeper():
+    """Depolama süpürücüsünü arka planda bir kez başlatır."""
+    global _sweeper_started
+    interval = float(os.environ.get("PDF2TEXT_SWEEP_INTERVAL", 600))
+    if _sweeper_started or interval <= 0:
+        return
+    _sweeper_started = True
+    document_store.sweep()
+    threading.Thread(target=_sweep_forever, args=(interval,), daemon=True).start()
@@ -0,0 +1,50 @@
+"""Sayfa sayfa akan metin çıkarma ve diske aktarma yardımcıları."""
+import os
+import tempfile
+
+from pdf2text.cache import CACHE_DIR, result_cache, touch
+
+
+def format_page(page_num, page_text):
+    return f"\n--- Page {page_num} ---\n{page_text}\n"
+
+
+def export_path(file_hash, backend, suffix="txt"):
+    return os.path.join(CACHE_DIR, "exports", f"{file_hash}.{backend}.{suffix}")
+
+
+def is_exported(path):
+    """Dışa aktarma dosyası varsa tahliye sırasını yenileyip True döndürür."""
+    return os.path.exists(path) and touch(path)
+
+
+def tee_to_file(pages, path, skip_empty=False):
+    """Sayfaları üretirken aynı anda dosyaya yazar.
+
+    Dosya geçici bir adla yazılır ve yalnızca tüm sayfalar bittiğinde yerine
+    taşınır; yarıda kalan bir çıkarma eksik dosya bırakmaz.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    completed = False
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for page_num, page_text in pages:
+                if page_text or not skip_empty:
+                    f.write(format_page(page_num, page_text))
+                yield page_num, page_text
+        previous_size = os.path.getsize(path) if os.path.exists(path) else 0
+        os.replace(tmp_path, path)
+        completed = True
+        result_cache.track_file(path, previous_size)
+    finally:
+        if not completed and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def write_pages(pages, path, skip_empty=False):
+    """Sayfaları belleğe toplamadan dosyaya yazar; sayfa sayısını döndürür."""
+    count = 0
+    for _ in tee_to_file(pages, path, skip_empty):
+        count += 1
+    return count
@@ -0,0 +1,121 @@
+"""PyMuPDF metin yapısının (blok/satır/span) küçültülmüş, sayfalı gösterimi.
+
+`page.get_text("dict")` her span için yazı tipi, renk, köken gibi alanlar ve
+görüntü blokları için ham bayt içerir. Burada her sayfa dizi tabanlı bir
+biçime indirgenir; yalnızca istenen span alanları tutulur ve koordinatlar
+yuvarlanır. Sayfalar tek tek üretilip önbelleğe alınır.
+
+Biçim::
+
+    {"page": 1, "size": [w, h], "fields": ["text", "size"],
+     "blocks": [[bbox, [[bbox, [span, ...]], ...]], ...]}
+
+Span'ler `fields` sırasıyla değer dizileridir (ör. `["Başlık", 12.0]`).
+"""
+import fitz
+
+from pdf2text.cache import file_sha256, make_key, result_cache
+
+SPAN_FIELDS = ["text", "size", "font", "flags", "color", "bbox"]
+DEFAULT_SPAN_FIELDS = ("text", "size")
+
+
+def _bbox(bbox, digits=1):
+    return [round(value, digits) for value in bbox]
+
+
+def _span(span, span_fields):
+    values = []
+    for field in span_fields:
+        value = span[field]
+        if field == "bbox":
+            value = _bbox(value)
+        elif field == "size":
+            value = round(value, 1)
+        values.append(value)
+    return values
+
+
+def compact_page(page, span_fields=DEFAULT_SPAN_FIELDS):
+    """Sayfanın metin bloklarını dizi tabanlı küçük bir yapıya çevirir."""
+    # Görüntü blokları ham bayt taşıdığı için yalnızca metin blokları alınır
+    raw = page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)
+    blocks = []
+    for block in raw["blocks"]:
+        if block.get("type", 0) != 0:
+            continue
+        lines = [
+            [_bbox(line["bbox"]), [_span(span, span_fields) for span in line["spans"]]]
+            for line in block["lines"]
+        ]
+        blocks.append([_bbox(block["bbox"]), lines])
+    return {
+        "page": page.number + 1,
+        "size": [round(raw["width"], 1), round(raw["height"], 1)],
+        "fields": list(span_fields),
+        "blocks": blocks,
+    }
+
+
+def block_text(block, span_fields):
+    """Küçültülmüş bloğun düz metnini döndürür."""
+    if "text" not in span_fields:
+        return ""
+    text_index = span_fields.index("text")
+    return "\n".join(
+        "".join(span[text_index] for span in spans) for _, spans in block[1]
+    )
+
+
+def block_summary(structure, preview_chars=80):
+    """Sayfadaki bloklar için (blok, bbox, satır, span, önizleme) satırları döndürür."""
+    rows = []
+    for index, block in enumerate(structure["blocks"]):
+        bbox, lines = block
+        rows.append(
+            {
+                "block": index,
+                "bbox": bbox,
+                "lines": len(lines),
+                "spans": sum(len(spans) for _, spans in lines),
+                "preview": block_text(block, structure["fields"])[:preview_chars],
+            }
+        )
+    return rows
+
+
+def expand_block(structure, index):
+    """Tek bir bloğu alan adlarıyla okunur sözlüğe açar."""
+    span_fields = structure["fields"]
+    bbox, lines = structure["blocks"][index]
+    return {
+        "bbox": bbox,
+        "lines": [
+            {"bbox": line_bbox, "spans": [dict(zip(span_fields, span)) for span in spans]}
+            for line_bbox, spans in lines
+        ],
+    }
+
+
+def page_structure(file_path, page_num, span_fields=DEFAULT_SPAN_FIELDS, cache=result_cache):
+    """Tek sayfanın küçültülmüş yapısını döndürür (önbellekli)."""
+    span_fields = tuple(field for field in SPAN_FIELDS if field in span_fields)
+    key = make_key(
+        file_sha256(file_path), "pymupdf", "structure_page",
+        {"page": page_num, "span_fields": list(span_fields)},
+    )
+    missing = object()
+    structure = cache.get(key, missing)
+    if structure is missing:
+        with fitz.open(file_path) as doc:
+            structure = compact_page(doc[page_num - 1], span_fields)
+        cache.put(key, structure)
+    return structure
+
+
+def structure_pages(file_path, first_page, last_page, span_fields=DEFAULT_SPAN_FIELDS):
+    """Sayfa aralığının küçültülmüş yapılarını döndürür."""
+    return [
+        page_structure(file_path, page_num, span_fields)
+        for page_num in range(first_page, last_page + 1)
+    ]
@@ -0,0 +1,166 @@
+"""Tüm tablo kaynakları için ortak normalizasyon ve kayıt tipi.
+
+PyMuPDF, PDFplumber, Camelot ve img2table çıktıları aynı `TableRecord`
+tipine dönüştürülür. DataFrame'ler hücre hücre Python listeleri kurmadan tek
+adımda oluşturulur; düzensiz (farklı uzunlukta) satırlar boş hücrelerle
+tamamlanır.
+"""
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+
+@dataclass
+class TableRecord:
+    source: str
+    page: int
+    index: int
+    df: pd.DataFrame
+    header: list = field(default_factory=list)
+    accuracy: float = None
+    whitespace: float = None
+    # Sayfalar arası birleştirilen tablolarda tablonun yayıldığı sayfalar
+    pages: list = field(default_factory=list)
+
+    def __post_init__(self):
+        if not self.pages:
+            self.pages = [self.page]
+
+    def to_dict(self):
+        return {
+            "source": self.source,
+            "page": self.page,
+            "index": self.index,
+            "pages": list(self.pages),
+            "columns": [str(col) for col in self.df.columns],
+            "rows": self.df.astype(object).where(self.df.notna(), None).values.tolist(),
+            "accuracy": self.accuracy,
+            "whitespace": self.whitespace,
+        }
+
+
+def unique_columns(names, fallback="Column"):
+    """Boş başlıkları `{fallback}_{j}` ile doldurur, tekrarları `_1`, `_2` ile ayırır."""
+    names = pd.Series(list(names), dtype=object)
+    fallback_names = pd.Series(
+        [f"{fallback}_{j + 1}" for j in range(len(names))], dtype=object
+    )
+    empty = names.isna() | (names.astype(str) == "")
+    names = names.astype(str).where(~empty, fallback_names)
+    counts = names.groupby(names).cumcount()
+    return names.where(counts == 0, names + "_" + counts.astype(str)).tolist()
+
+
+def rows_to_dataframe(rows, header=True, fallback="Column"):
+    """Ham satır listesinden DataFrame oluşturur.
+
+    `header=True` ise ilk satır başlık olarak kullanılır; ilk satır boşsa
+    sütunlar `{fallback}_{j}` olarak adlandırılır.
+    """
+    if not rows:
+        return pd.DataFrame()
+    frame = pd.DataFrame(list(rows), dtype=object)
+    if header and rows[0]:
+        df = frame.iloc[1:].reset_index(drop=True)
+        df.columns = unique_columns(frame.iloc[0].tolist(), fallback)
+    else:
+        df = frame.iloc[1:].reset_index(drop=True) if header else frame
+        df.columns = [f"{fallback}_{j + 1}" for j in range(frame.shape[1])]
+    return df
+
+
+def from_rows(source, page, rows_by_table, fallback="Column"):
+    """Bir sayfadaki ham tablolardan (PyMuPDF, PDFplumber) kayıt listesi oluşturur."""
+    return [
+        TableRecord(
+            source=source,
+            page=page,
+            index=i + 1,
+            df=rows_to_dataframe(rows, fallback=fallback),
+            header=list(rows[0]) if rows and rows[0] else [],
+        )
+        for i, rows in enumerate(rows_by_table)
+        if rows
+    ]
+
+
+def from_camelot(tables):
+    """`extract.camelot_tables` sonuçlarını kayıtlara dönüştürür."""
+    records = []
+    for table in tables:
+        df = table["df"].copy()
+        df.columns = [f"Column_{j + 1}" for j in range(df.shape[1])]
+        records.append(
+            TableRecord(
+                source="camelot",
+                page=int(table["page"]),
+                index=table.get("order", 1),
+                df=df,
+                accuracy=table["accuracy"],
+                whitespace=table["whitespace"],
+            )
+        )
+    return records
+
+
+def from_img2table(tables, page=1):
+    """img2table `ExtractedTable` nesnelerini kayıtlara dönüştürür."""
+    records = []
+    for i, table in enumerate(tables):
+        df = table.df.copy()
+        df.columns = unique_columns(df.columns.tolist())
+        records.append(
+            TableRecord(source="img2table", page=page, index=i + 1, df=df, header=list(df.columns))
+        )
+    return records
+
+
+def merge_continued(records):
+    """Bir sonraki sayfanın başında devam eden tabloları önceki tabloyla birleştirir.
+
+    Önceki tablo sayfasının son tablosu, sonraki tablo bir sonraki sayfanın
+    ilk tablosu ve sütun sayıları eşitse tablolar birleştirilir. Başlık
+    tekrarlanmışsa atlanır, aksi halde sonraki tablonun ilk satırı veri
+    satırı olarak eklenir.
+    """
+    last_index = {}
+    for record in records:
+        last_index[record.page] = max(last_index.get(record.page, 0), record.index)
+
+    merged = []
+    # Birleştirilmiş tablonun son parçasının kendi sayfasındaki sırası; `index`
+    # tablonun ilk sayfasındaki sırası olarak kalır
+    fragment_index = None
+    for record in records:
+        previous = merged[-1] if merged else None
+        if (
+            previous is not None
+            and previous.source == record.source
+            and record.page == previous.pages[-1] + 1
+            and record.index == 1
+            and fragment_index == last_index.get(previous.pages[-1])
+            and record.df.shape[1] == previous.df.shape[1]
+        ):
+            body = record.df.copy()
+            body.columns = previous.df.columns
+            if record.header and record.header != previous.header:
+                header_row = pd.DataFrame([record.header], columns=previous.df.columns, dtype=object)
+                body = pd.concat([header_row, body], ignore_index=True)
+            previous.df = pd.concat([previous.df, body], ignore_index=True)
+            previous.pages.append(record.page)
+            fragment_index = record.index
+            continue
+        fragment_index = record.index
+        merged.append(
+            TableRecord(
+                source=record.source,
+                page=record.page,
+                index=record.index,
+                df=record.df,
+                header=record.header,
+                accuracy=record.accuracy,
+                whitespace=record.whitespace,
+                pages=list(record.pages),
+            )
+        )
+    return merged
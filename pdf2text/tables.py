@@ -0,0 +1,138 @@
+"""Tablo tespiti öncesi ucuz aday sayfa ön filtresi.
+
+Her sayfa PyMuPDF çizim (yatay/dikey çizgi, hücre dikdörtgeni) ve metin
+hizalama (çok hücreli satırlar, tekrar eden sütun konumları) istatistikleriyle
+puanlanır. Ağır tablo dedektörleri yalnızca aday sayfalarda çalıştırılır.
+"""
+import time
+from collections import Counter
+
+import fitz
+
+CANDIDATE_THRESHOLD = 0.5
+# Aynı satırdaki iki kelime arasında bu kadar boşluk varsa ayrı hücre sayılır
+CELL_GAP = 10.0
+MIN_SEGMENT = 10.0
+
+
+def _ruling_stats(page):
+    h_lines = v_lines = cell_rects = 0
+    page_area = page.rect.width * page.rect.height
+    for drawing in page.get_drawings():
+        for item in drawing["items"]:
+            if item[0] == "l":
+                p1, p2 = item[1], item[2]
+                dx, dy = abs(p2.x - p1.x), abs(p2.y - p1.y)
+                if dy < 1 and dx > MIN_SEGMENT:
+                    h_lines += 1
+                elif dx < 1 and dy > MIN_SEGMENT:
+                    v_lines += 1
+            elif item[0] == "re":
+                rect = item[1]
+                if rect.height < 2 and rect.width > MIN_SEGMENT:
+                    h_lines += 1
+                elif rect.width < 2 and rect.height > MIN_SEGMENT:
+                    v_lines += 1
+                elif rect.width > 5 and rect.height > 5 and rect.width * rect.height < 0.9 * page_area:
+                    cell_rects += 1
+    return h_lines, v_lines, cell_rects
+
+
+def _alignment_stats(page):
+    lines = {}
+    for x0, _, x1, _, _, block_no, line_no, _ in page.get_text("words"):
+        lines.setdefault((block_no, line_no), []).append((x0, x1))
+
+    aligned_rows = 0
+    column_starts = Counter()
+    for words in lines.values():
+        words.sort()
+        cells = [words[0][0]]
+        for (_, prev_x1), (x0, _) in zip(words, words[1:]):
+            if x0 - prev_x1 > CELL_GAP:
+                cells.append(x0)
+        if len(cells) >= 3:
+            aligned_rows += 1
+            column_starts.update(round(x / 5) for x in cells)
+    recurring_columns = sum(1 for count in column_starts.values() if count >= 3)
+    return aligned_rows, recurring_columns
+
+
+def score_page(page):
+    """Sayfanın tablo içerme olasılığını 0-1 arası bir puanla döndürür."""
+    h_lines, v_lines, cell_rects = _ruling_stats(page)
+    aligned_rows, recurring_columns = _alignment_stats(page)
+
+    ruling_score = max(
+        min(1.0, (min(h_lines, v_lines) + cell_rects) / 4),
+        # Yalnızca yatay çizgili tablolar (ör. akademik tablolar)
+        0.5 * min(1.0, h_lines / 6),
+    )
+    text_score = min(1.0, aligned_rows / 4) * min(1.0, recurring_columns / 3)
+    return {
+        "page": page.number + 1,
+        "score": round(max(ruling_score, text_score), 3),
+        "h_lines": h_lines,
+        "v_lines": v_lines,
+        "cell_rects": cell_rects,
+        "aligned_rows": aligned_rows,
+        "recurring_columns": recurring_columns,
+    }
+
+
+def table_candidates(file_path, threshold=CANDIDATE_THRESHOLD, first_page=1, last_page=None):
+    """Aday sayfa numaralarını, sayfa puanlarını ve ön filtre süresini döndürür."""
+    started = time.perf_counter()
+    with fitz.open(file_path) as doc:
+        last_page = doc.page_count if last_page is None else min(last_page, doc.page_count)
+        scores = [score_page(doc[i]) for i in range(first_page - 1, last_page)]
+    for score in scores:
+        score["candidate"] = score["score"] >= threshold
+    candidates = [score["page"] for score in scores if score["candidate"]]
+    return candidates, scores, time.perf_counter() - started
+
+
+def run_with_prefilter(
+    file_path,
+    detector,
+    threshold=CANDIDATE_THRESHOLD,
+    enabled=True,
+    first_page=1,
+    last_page=None,
+):
+    """Dedektörü yalnızca aday sayfalarda çalıştırır ve bir rapor ekler.
+
+    `detector(file_path, page_numbers)` verilen sayfa numaraları (1 tabanlı)
+    için sonuç döndürmelidir. Kazanılan süre, atlanan sayfa sayısı ile aday
+    sayfa başına ortalama dedektör süresinin çarpımından ön filtre süresi
+    çıkarılarak tahmin edilir.
+    """
+    if enabled:
+        candidates, scores, prefilter_seconds = table_candidates(
+            file_path, threshold, first_page, last_page
+        )
+        page_count = len(scores)
+    else:
+        with fitz.open(file_path) as doc:
+            last_page = doc.page_count if last_page is None else min(last_page, doc.page_count)
+        candidates = list(range(first_page, last_page + 1))
+        scores, prefilter_seconds = [], 0.0
+        page_count = len(candidates)
+
+    started = time.perf_counter()
+    result = detector(file_path, candidates) if candidates else []
+    detector_seconds = time.perf_counter() - started
+
+    skipped = page_count - len(candidates)
+    per_page = detector_seconds / len(candidates) if candidates else 0.0
+    report = {
+        "pages": page_count,
+        "candidates": len(candidates),
+        "skipped": skipped,
+        "skipped_pages": [score["page"] for score in scores if not score["candidate"]],
+        "prefilter_seconds": round(prefilter_seconds, 3),
+        "detector_seconds": round(detector_seconds, 3),
+        "estimated_seconds_saved": round(skipped * per_page - prefilter_seconds, 3),
+        "scores": scores,
+    }
+    return result, report
@@ -0,0 +1,236 @@
+"""Çıkarma aşamaları için süre ve bellek ölçümü.
+
+`span` bağlam yöneticisi (veya `traced` dekoratörü) bir aşamanın duvar
+saati süresini, iş parçacığı CPU süresini, işlenen sayfa sayısını ve RSS
+farkını kaydeder. Kayıtlar hem etkin `run` toplayıcısına (arayüzdeki döküm
+için) hem de süreç genelindeki sayaçlara eklenir; sayaçlar Prometheus metin
+biçiminde yerel bir uç noktadan sunulur.
+"""
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# Süre histogramı kovaları (saniye)
+BUCKETS = (0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300)
+
+
+def _rss_bytes():
+    if not PSUTIL_AVAILABLE:
+        return None
+    return psutil.Process(os.getpid()).memory_info().rss
+
+
+class Span:
+    __slots__ = ("name", "pages", "seconds", "cpu_seconds", "rss_delta", "depth", "error")
+
+    def __init__(self, name, pages=0, depth=0):
+        self.name = name
+        self.pages = pages
+        self.seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.rss_delta = None
+        self.depth = depth
+        self.error = None
+
+    def to_dict(self):
+        return {
+            "stage": self.name,
+            "depth": self.depth,
+            "seconds": round(self.seconds, 4),
+            "cpu_seconds": round(self.cpu_seconds, 4),
+            "pages": self.pages,
+            "rss_delta_mb": None if self.rss_delta is None else round(self.rss_delta / (1024 * 1024), 1),
+            "error": self.error,
+        }
+
+
+class Metrics:
+    """Aşama bazında süreç genelindeki sayaçlar ve süre histogramı."""
+
+    def __init__(self):
+        self._stages = {}
+        self._lock = threading.Lock()
+
+    def record(self, span):
+        with self._lock:
+            stage = self._stages.setdefault(
+                span.name,
+                {
+                    "calls": 0,
+                    "errors": 0,
+                    "seconds": 0.0,
+                    "cpu_seconds": 0.0,
+                    "pages": 0,
+                    "rss_delta_bytes": 0,
+                    "buckets": [0] * len(BUCKETS),
+                },
+            )
+            stage["calls"] += 1
+            stage["errors"] += span.error is not None
+            stage["seconds"] += span.seconds
+            stage["cpu_seconds"] += span.cpu_seconds
+            stage["pages"] += span.pages
+            if span.rss_delta is not None:
+                stage["rss_delta_bytes"] += span.rss_delta
+            for i, bound in enumerate(BUCKETS):
+                if span.seconds <= bound:
+                    stage["buckets"][i] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {name: dict(stage, buckets=list(stage["buckets"])) for name, stage in self._stages.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+
+    def prometheus(self):
+        """Sayaçları Prometheus metin biçiminde döndürür."""
+        stages = self.snapshot()
+        lines = []
+
+        def family(name, kind, help_text, field):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for stage, values in sorted(stages.items()):
+                lines.append(f'{name}{{stage="{_escape(stage)}"}} {values[field]}')
+
+        family("pdf2text_stage_calls_total", "counter", "Stage executions.", "calls")
+        family("pdf2text_stage_errors_total", "counter", "Stage executions that raised.", "errors")
+        family("pdf2text_stage_cpu_seconds_total", "counter", "Thread CPU time spent in stage.", "cpu_seconds")
+        family("pdf2text_stage_pages_total", "counter", "Pages processed by stage.", "pages")
+        family(
+            "pdf2text_stage_rss_delta_bytes_total", "counter",
+            "Sum of resident memory changes across stage executions.", "rss_delta_bytes",
+        )
+
+        lines.append("# HELP pdf2text_stage_seconds Wall time spent in stage.")
+        lines.append("# TYPE pdf2text_stage_seconds histogram")
+        for stage, values in sorted(stages.items()):
+            label = _escape(stage)
+            for bound, count in zip(BUCKETS, values["buckets"]):
+                lines.append(f'pdf2text_stage_seconds_bucket{{stage="{label}",le="{bound}"}} {count}')
+            lines.append(f'pdf2text_stage_seconds_bucket{{stage="{label}",le="+Inf"}} {values["calls"]}')
+            lines.append(f'pdf2text_stage_seconds_sum{{stage="{label}"}} {values["seconds"]}')
+            lines.append(f'pdf2text_stage_seconds_count{{stage="{label}"}} {values["calls"]}')
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+metrics = Metrics()
+_local = threading.local()
+
+
+def _collector():
+    return getattr(_local, "collector", None)
+
+
+@contextmanager
+def span(name, pages=0):
+    """Aşamayı ölçer; `with span(...) as s: s.pages += 1` ile sayfa sayılabilir."""
+    depth = getattr(_local, "depth", 0)
+    current = Span(name, pages, depth)
+    collector = _collector()
+    if collector is not None:
+        collector.append(current)
+    rss_before = _rss_bytes()
+    cpu_started = time.thread_time()
+    started = time.perf_counter()
+    _local.depth = depth + 1
+    try:
+        yield current
+    except BaseException as e:
+        current.error = type(e).__name__
+        raise
+    finally:
+        _local.depth = depth
+        current.seconds = time.perf_counter() - started
+        current.cpu_seconds = time.thread_time() - cpu_started
+        rss_after = _rss_bytes()
+        if rss_before is not None and rss_after is not None:
+            current.rss_delta = rss_after - rss_before
+        metrics.record(current)
+
+
+def traced(name):
+    """Fonksiyonu `span(name)` içinde çalıştıran dekoratör."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def run():
+    """Bu iş parçacığında açılan aşamaları toplar; aşama listesini verir."""
+    previous = _collector()
+    spans = []
+    _local.collector = spans
+    try:
+        yield spans
+    finally:
+        _local.collector = previous
+        if previous is not None:
+            previous.extend(spans)
+
+
+def merge(spans):
+    """Başka bir süreçte ölçülen aşamaları etkin `run` toplayıcısına ekler.
+
+    Sayaçlara eklenmez; onları aşamaları alan süreç bir kez kaydeder.
+    """
+    collector = _collector()
+    if collector is not None:
+        collector.extend(spans)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = metrics.prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server():
+    """PDF2TEXT_METRICS_PORT ayarlıysa /metrics uç noktasını bir kez başlatır."""
+    global _server
+    port = int(os.environ.get("PDF2TEXT_METRICS_PORT", 0) or 0)
+    if not port:
+        return None
+    with _server_lock:
+        if _server is None:
+            host = os.environ.get("PDF2TEXT_METRICS_HOST", "127.0.0.1")
+            try:
+                _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            except OSError:
+                return None
+            threading.Thread(target=_server.serve_forever, daemon=True).start()
+    return _server
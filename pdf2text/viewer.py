@@ -0,0 +1,81 @@
+"""Sunucu tarafında sayfa görüntüsü üreten hafif PDF görüntüleyici yardımcıları.
+
+Tarayıcıya belgenin tamamı yerine yalnızca görüntülenen sayfaların PNG
+görüntüleri gönderilir. Sayfa görüntüleri dosya özeti, sayfa ve DPI ile
+önbelleğe alınır; arama sonuçları veya tablolar gibi vurgular önbellekteki
+görüntünün üzerine çizilir, sayfa yeniden işlenmez.
+"""
+import io
+
+import fitz
+from PIL import Image, ImageDraw
+
+from pdf2text.cache import file_sha256, make_key, result_cache
+
+DEFAULT_DPI = 96
+THUMBNAIL_DPI = 24
+# Vurgu türü -> (dolgu, kenar) RGBA renkleri
+HIGHLIGHT_COLORS = {
+    "search": ((255, 230, 0, 90), (230, 160, 0, 255)),
+    "table": ((0, 120, 255, 40), (0, 90, 220, 255)),
+}
+
+
+def page_count(file_path):
+    return result_cache.get_or_compute(
+        file_sha256(file_path), "pymupdf", "page_count", {},
+        lambda: _page_count(file_path),
+    )
+
+
+def _page_count(file_path):
+    with fitz.open(file_path) as doc:
+        return doc.page_count
+
+
+def page_png(file_path, page_num, dpi=DEFAULT_DPI, cache=result_cache):
+    """Sayfanın PNG görüntüsünü döndürür (önbellekli)."""
+    key = make_key(file_sha256(file_path), "viewer", "page_png", {"page": page_num, "dpi": dpi})
+    png = cache.get(key)
+    if png is None:
+        with fitz.open(file_path) as doc:
+            png = doc[page_num - 1].get_pixmap(dpi=dpi, alpha=False).tobytes("png")
+        cache.put(key, png)
+    return png
+
+
+def thumbnail(file_path, page_num):
+    return page_png(file_path, page_num, THUMBNAIL_DPI)
+
+
+def draw_highlights(png, highlights, dpi=DEFAULT_DPI):
+    """PDF koordinatlarındaki (x0, y0, x1, y1, tür) kutularını görüntüye çizer."""
+    if not highlights:
+        return png
+    scale = dpi / 72
+    image = Image.open(io.BytesIO(png)).convert("RGBA")
+    overlay = Image.new("RGBA", image.size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    for x0, y0, x1, y1, kind in highlights:
+        fill, outline = HIGHLIGHT_COLORS.get(kind, HIGHLIGHT_COLORS["search"])
+        draw.rectangle(
+            [x0 * scale, y0 * scale, x1 * scale, y1 * scale],
+            fill=fill,
+            outline=outline,
+            width=2,
+        )
+    output = io.BytesIO()
+    Image.alpha_composite(image, overlay).convert("RGB").save(output, format="PNG")
+    return output.getvalue()
+
+
+def page_images(file_path, page_numbers, dpi=DEFAULT_DPI, highlights=None):
+    """İstenen sayfalar için (sayfa numarası, PNG) listesi döndürür.
+
+    `highlights` sayfa numarasından vurgu kutuları listesine eşlemedir.
+    """
+    highlights = highlights or {}
+    return [
+        (page_num, draw_highlights(page_png(file_path, page_num, dpi), highlights.get(page_num), dpi))
+        for page_num in page_numbers
+    ]